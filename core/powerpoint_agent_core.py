@@ -60,11 +60,13 @@ Changelog v1.1.0:
 Dependencies:
 - python-pptx >= 0.6.21 (required)
 - Pillow >= 9.0.0 (optional, for image operations)
+- mozjpeg-lossless-optimization (optional, smaller compressed JPEGs)
 """
 
 import os
 import re
 import sys
+import copy
 import json
 import hashlib
 import subprocess
@@ -74,8 +76,10 @@ import time
 import logging
 import platform
 import errno
+import struct
+import zipfile
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Pattern, Union, Tuple
 from enum import Enum
 from datetime import datetime
 from io import BytesIO
@@ -111,6 +115,13 @@ except ImportError:
     HAS_PILLOW = False
     PILImage = None
 
+try:
+    import mozjpeg_lossless_optimization
+    HAS_MOZJPEG = True
+except ImportError:
+    HAS_MOZJPEG = False
+    mozjpeg_lossless_optimization = None
+
 
 # ============================================================================
 # LOGGING SETUP
@@ -277,6 +288,9 @@ WCAG_CONTRAST_LARGE = 3.0
 # Maximum recommended file size (MB)
 MAX_RECOMMENDED_FILE_SIZE_MB = 50
 
+# Images smaller than this (KB) are embedded as-is instead of re-encoded
+MIN_COMPRESSION_THRESHOLD_KB = 200
+
 # Valid PowerPoint extensions
 VALID_PPTX_EXTENSIONS = {'.pptx', '.pptm', '.potx', '.potm'}
 
@@ -354,6 +368,185 @@ def _get_placeholder_type_int_helper(ph_type: Any) -> int:
         return 0
 
 
+# XML namespaces for direct lxml queries against slide parts
+XML_NAMESPACES = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+}
+
+# Paragraphs of a shape-level text frame (<p:sp>/<p:txBody>/<a:p>)
+_XPATH_TEXT_FRAME_PARAGRAPHS = etree.XPath("./p:txBody/a:p", namespaces=XML_NAMESPACES)
+
+# Text nodes of the runs in a shape-level text frame (<a:r>/<a:t>)
+_XPATH_TEXT_FRAME_RUN_TEXTS = etree.XPath("./p:txBody/a:p/a:r/a:t", namespaces=XML_NAMESPACES)
+
+# Rows of a table graphic frame (<p:graphicFrame>/.../<a:tbl>/<a:tr>)
+_XPATH_TABLE_ROWS = etree.XPath(
+    "./a:graphic/a:graphicData/a:tbl/a:tr", namespaces=XML_NAMESPACES
+)
+_XPATH_ROW_CELLS = etree.XPath("./a:tc", namespaces=XML_NAMESPACES)
+_XPATH_CELL_PARAGRAPHS = etree.XPath("./a:txBody/a:p", namespaces=XML_NAMESPACES)
+
+
+def iter_shape_texts(
+    slide,
+    include_non_text: bool = False
+) -> Iterator[Tuple[int, Any, Optional[str]]]:
+    """
+    Yield the text of every shape on a slide that owns a text frame.
+    
+    Reads paragraph text straight from the slide XML with a compiled XPath,
+    so no python-pptx shape/text-frame proxies are constructed. Text is
+    joined exactly like ``TextFrame.text`` ("\\n" between paragraphs,
+    "\\v" for line breaks), and shape indices match ``slide.shapes``.
+    
+    Args:
+        slide: python-pptx Slide object
+        include_non_text: Also yield shapes without a text frame, with
+            text None (pictures, tables, charts, ...)
+        
+    Yields:
+        Tuples of (shape_index, shape_element, text)
+    """
+    for idx, shape_elm in enumerate(slide.shapes._iter_member_elms()):
+        paragraphs = _XPATH_TEXT_FRAME_PARAGRAPHS(shape_elm)
+        if paragraphs:
+            yield idx, shape_elm, "\n".join(p.text for p in paragraphs)
+        elif include_non_text:
+            yield idx, shape_elm, None
+
+
+def iter_table_cell_texts(shape_elm) -> Iterator[Tuple[int, int, str]]:
+    """
+    Yield the text of every cell of a table graphic frame.
+    
+    Reads the ``<a:tc>`` elements directly, so no table/row/cell proxies
+    are constructed. Indices match ``table.rows[r].cells[c]`` and text is
+    joined like ``cell.text_frame.text``. Non-table shapes yield nothing.
+    
+    Args:
+        shape_elm: Shape XML element (e.g. ``shape._element``)
+        
+    Yields:
+        Tuples of (row_index, col_index, text)
+    """
+    for row_idx, tr in enumerate(_XPATH_TABLE_ROWS(shape_elm)):
+        for col_idx, tc in enumerate(_XPATH_ROW_CELLS(tr)):
+            yield row_idx, col_idx, "\n".join(p.text for p in _XPATH_CELL_PARAGRAPHS(tc))
+
+
+def substitute_text(
+    text: str,
+    find: str,
+    replace: Union[str, Callable[[Any], str]],
+    pattern: Optional[Pattern] = None
+) -> Tuple[str, int]:
+    """
+    Replace every occurrence in one string and count them in a single pass.
+    
+    Literal finds use split/join; otherwise ``pattern.subn`` does both.
+    A string ``replace`` is always inserted literally: it is passed to
+    ``subn`` through a callback, so backslashes and group references in
+    it are not expanded as a regex template.
+    
+    Args:
+        text: Text to rewrite
+        find: Literal text to find (used when no pattern is given)
+        replace: Replacement text, or a match callback when a pattern is given
+        pattern: Optional compiled regex (case-insensitive, whole-word, ...)
+        
+    Returns:
+        Tuple of (new_text, occurrences)
+    """
+    if pattern is None:
+        parts = text.split(find)
+        return replace.join(parts), len(parts) - 1
+    if isinstance(replace, str):
+        literal = replace
+        replace = lambda match: literal
+    return pattern.subn(replace, text)
+
+
+def replace_in_run_texts(
+    shape_elm,
+    find: str,
+    replace: Union[str, Callable[[Any], str]],
+    pattern: Optional[Pattern] = None
+) -> Tuple[int, int]:
+    """
+    Replace text directly on the ``<a:t>`` nodes of a shape's runs.
+    
+    Equivalent to editing ``run.text`` for every run of every paragraph,
+    but collects the nodes with one compiled XPath instead of building
+    paragraph/run proxies. Run properties are untouched, so per-run
+    formatting is preserved.
+    
+    Args:
+        shape_elm: Shape XML element (e.g. ``shape._element``)
+        find: Literal text to find (used when no pattern is given)
+        replace: Replacement text, or a match callback when a pattern is given
+        pattern: Optional compiled regex (case-insensitive, whole-word, ...)
+        
+    Returns:
+        Tuple of (occurrences_replaced, runs_modified)
+    """
+    occurrences = 0
+    runs_modified = 0
+    
+    for t in _XPATH_TEXT_FRAME_RUN_TEXTS(shape_elm):
+        text = t.text
+        if not text:
+            continue
+        
+        new_text, n = substitute_text(text, find, replace, pattern)
+        if n:
+            t.text = new_text
+            occurrences += n
+            runs_modified += 1
+    
+    return occurrences, runs_modified
+
+
+def copy_zip_entry_raw(
+    source: zipfile.ZipFile,
+    target: zipfile.ZipFile,
+    info: zipfile.ZipInfo
+) -> None:
+    """
+    Copy one ZIP entry's compressed bytes from ``source`` into ``target``.
+    
+    The data is neither decompressed nor recompressed, so already
+    compressed media (JPEG, PNG, video) costs a plain byte copy. The new
+    entry is registered the way ``ZipFile.mkdir`` registers one, so
+    ``target.close()`` writes it into the central directory.
+    
+    Args:
+        source: Archive opened for reading
+        target: Archive opened for writing (mode "w")
+        info: Entry of ``source`` to copy
+    """
+    source.fp.seek(info.header_offset)
+    local_header = source.fp.read(zipfile.sizeFileHeader)
+    name_length, extra_length = struct.unpack("<HH", local_header[26:30])
+    source.fp.seek(info.header_offset + zipfile.sizeFileHeader + name_length + extra_length)
+    data = source.fp.read(info.compress_size)
+    
+    entry = copy.copy(info)
+    # CRC and sizes go into the local header, so no data descriptor follows
+    entry.flag_bits &= ~0x08
+    
+    with target._lock:
+        target.fp.seek(target.start_dir)
+        entry.header_offset = target.fp.tell()
+        target._writecheck(entry)
+        target._didModify = True
+        target.fp.write(entry.FileHeader())
+        target.fp.write(data)
+        target.filelist.append(entry)
+        target.NameToInfo[entry.filename] = entry
+        target.start_dir = target.fp.tell()
+
+
 # ============================================================================
 # ENUMS
 # ============================================================================
@@ -863,14 +1056,16 @@ class ColorHelper:
         if len(hex_color) != 6:
             raise ValueError(f"Invalid hex color: {hex_color}. Must be 6 hex digits.")
         
-        if not all(c in '0123456789ABCDEFabcdef' for c in hex_color):
+        # bytes.fromhex parses all three channels in C; it skips spaces, so
+        # a short result means the six characters were not all hex digits
+        try:
+            rgb = bytes.fromhex(hex_color)
+        except ValueError:
+            rgb = b''
+        if len(rgb) != 3:
             raise ValueError(f"Invalid hex color: {hex_color}. Contains non-hex characters.")
         
-        r = int(hex_color[0:2], 16)
-        g = int(hex_color[2:4], 16)
-        b = int(hex_color[4:6], 16)
-        
-        return RGBColor(r, g, b)
+        return RGBColor(*rgb)
     
     @staticmethod
     def to_hex(rgb_color: RGBColor) -> str:
@@ -1301,7 +1496,9 @@ class AssetValidator:
     def compress_image(
         image_path: Path,
         max_width: int = 1920,
-        quality: int = 85
+        quality: int = 85,
+        min_compression_threshold: int = MIN_COMPRESSION_THRESHOLD_KB * 1024,
+        fallback_to_original: bool = True
     ) -> BytesIO:
         """
         Compress image for PowerPoint embedding.
@@ -1310,9 +1507,13 @@ class AssetValidator:
             image_path: Path to source image
             max_width: Maximum width in pixels
             quality: JPEG quality (1-100)
+            min_compression_threshold: Source files smaller than this many
+                bytes are returned unchanged without decoding
+            fallback_to_original: Return the original bytes when the
+                re-encoded image is not smaller than the source
             
         Returns:
-            BytesIO containing compressed image
+            BytesIO containing compressed (or original) image
             
         Raises:
             ImportError: If Pillow is not available
@@ -1320,11 +1521,18 @@ class AssetValidator:
         if not HAS_PILLOW:
             raise ImportError("Pillow is required for image compression")
         
+        original_size = Path(image_path).stat().st_size
+        if original_size < min_compression_threshold:
+            return BytesIO(Path(image_path).read_bytes())
+        
         with PILImage.open(image_path) as img:
             # Resize if needed
             if img.width > max_width:
                 ratio = max_width / img.width
-                new_height = int(img.height * ratio)
+                new_height = max(1, int(img.height * ratio))
+                # Let libjpeg decode at 1/2, 1/4 or 1/8 scale when the source is
+                # much larger than the target (no-op for non-JPEG sources)
+                img.draft('RGB', (max_width, new_height))
                 img = img.resize((max_width, new_height), PILImage.LANCZOS)
             
             # Convert to RGB if necessary
@@ -1340,7 +1548,16 @@ class AssetValidator:
             
             # Save to BytesIO
             output = BytesIO()
-            img.save(output, format='JPEG', quality=quality, optimize=True)
+            img.save(output, format='JPEG', quality=quality, optimize=True, progressive=True)
+            
+            # Lossless mozjpeg re-optimization (trellis/scan tuning) when available
+            if HAS_MOZJPEG:
+                output = BytesIO(mozjpeg_lossless_optimization.optimize(output.getvalue()))
+            
+            # Re-encoding can enlarge already well-compressed sources
+            if fallback_to_original and output.getbuffer().nbytes >= original_size:
+                return BytesIO(Path(image_path).read_bytes())
+            
             output.seek(0)
             
             return output
@@ -1372,14 +1589,21 @@ class PowerPointAgent:
             agent.save()
     """
     
-    def __init__(self, filepath: Optional[Union[str, Path]] = None):
+    def __init__(
+        self,
+        filepath: Optional[Union[str, Path]] = None,
+        track_versions: bool = True
+    ):
         """
         Initialize PowerPoint agent.
         
         Args:
             filepath: Optional path to open immediately
+            track_versions: Compute presentation_version_before/after hashes
+                in mutation results (disable to skip full-deck hashing)
         """
         self.filepath: Optional[Path] = None
+        self.track_versions = track_versions
         self.prs: Optional[Presentation] = None
         self._lock: Optional[FileLock] = None
         self._template_profile: Optional[TemplateProfile] = None
@@ -1429,8 +1653,10 @@ class PowerPointAgent:
                 details={"token_length": len(token)}
             )
 
-    def _capture_version(self) -> str:
-        """Capture current presentation version hash."""
+    def _capture_version(self) -> Optional[str]:
+        """Capture current presentation version hash (None when tracking is disabled)."""
+        if not self.track_versions:
+            return None
         return self.get_presentation_version()
 
     def _log_warning(self, message: str) -> None:
@@ -1541,6 +1767,89 @@ class PowerPointAgent:
         self.prs.save(str(target_path))
         self.filepath = target_path
     
+    def save_incremental(self, dirty_parts: Iterable[Any]) -> bool:
+        """
+        Save presentation, re-serializing only the parts that changed.
+        
+        Every other ZIP entry of the file on disk is copied as raw
+        compressed bytes, which skips re-serializing untouched XML and
+        re-deflating media. The caller names the parts it modified
+        (e.g. ``slide.part``, ``layout.part``); their relationship items are
+        rewritten with them. Falls back to a full save() when the package
+        gained or lost parts, when a dirty part is not in the file, or when
+        the raw entry copy fails.
+        
+        Args:
+            dirty_parts: python-pptx parts whose XML or relationships changed
+            
+        Returns:
+            True if untouched entries were copied, False if save() was used
+            
+        Raises:
+            PowerPointAgentError: If no presentation loaded
+        """
+        if not self.prs:
+            raise PowerPointAgentError("No presentation loaded")
+        
+        if not self.filepath or not self.filepath.exists():
+            self.save()
+            return False
+        
+        replacements: Dict[str, bytes] = {}
+        for part in dirty_parts:
+            replacements[part.partname.membername] = part.blob
+            if part._rels:
+                replacements[part.partname.rels_uri.membername] = part.rels.xml
+        
+        package_parts = {part.partname.membername for part in self.prs.part.package.iter_parts()}
+        
+        tmp_path = None
+        try:
+            with zipfile.ZipFile(self.filepath) as source:
+                names = set(source.namelist())
+                stored_parts = {
+                    name for name in names
+                    if not name.endswith(".rels") and name != "[Content_Types].xml"
+                }
+                if stored_parts != package_parts or not names.issuperset(replacements):
+                    self.save()
+                    return False
+                
+                fd, tmp_path = tempfile.mkstemp(
+                    suffix=".pptx", dir=str(self.filepath.parent)
+                )
+                try:
+                    with os.fdopen(fd, "wb") as tmp, \
+                            zipfile.ZipFile(tmp, "w", zipfile.ZIP_DEFLATED) as target:
+                        for info in source.infolist():
+                            blob = replacements.get(info.filename)
+                            if blob is None:
+                                copy_zip_entry_raw(source, target, info)
+                            else:
+                                target.writestr(copy.copy(info), blob, compress_type=zipfile.ZIP_DEFLATED)
+                except (AttributeError, struct.error):
+                    # copy_zip_entry_raw relies on zipfile internals and the
+                    # local header layout; if either is not what it expects,
+                    # discard the partial archive and do a full save instead
+                    raw_copy_failed = True
+                else:
+                    raw_copy_failed = False
+            
+            if raw_copy_failed:
+                os.unlink(tmp_path)
+                tmp_path = None
+                self.save()
+                return False
+            
+            shutil.copymode(str(self.filepath), tmp_path)
+            os.replace(tmp_path, str(self.filepath))
+            tmp_path = None
+        finally:
+            if tmp_path is not None:
+                os.unlink(tmp_path)
+        
+        return True
+    
     def close(self) -> None:
         """Close presentation and release resources."""
         self.prs = None
@@ -2107,15 +2416,24 @@ class PowerPointAgent:
         else:
             slides_to_process = list(enumerate(self.prs.slides))
         
+        # IGNORECASE folds case during the scan, avoiding a lowercased copy of each text
+        pattern = None if match_case else re.compile(re.escape(find), re.IGNORECASE)
+        
         for s_idx, slide in slides_to_process:
             # Determine shapes to process
             if shape_index is not None:
                 shapes_to_process = [(shape_index, self._get_shape(s_idx, shape_index))]
             else:
-                shapes_to_process = list(enumerate(slide.shapes))
+                # Prefilter on raw XML text; only wrap shapes that contain the needle
+                shapes = slide.shapes
+                shapes_to_process = [
+                    (sh_idx, shapes._shape_factory(shape_elm))
+                    for sh_idx, shape_elm, text in iter_shape_texts(slide)
+                    if (find in text if pattern is None else pattern.search(text))
+                ]
             
             for sh_idx, shape in shapes_to_process:
-                if not hasattr(shape, 'text_frame') or not shape.has_text_frame:
+                if not getattr(shape, 'has_text_frame', False):
                     continue
                 
                 count = self._replace_text_in_shape(shape, find, replace, match_case)
@@ -2155,19 +2473,8 @@ class PowerPointAgent:
             return 0
         
         # Strategy 1: Replace in runs (preserves formatting)
-        for paragraph in text_frame.paragraphs:
-            for run in paragraph.runs:
-                if match_case:
-                    if find in run.text:
-                        occurrences = run.text.count(find)
-                        run.text = run.text.replace(find, replace)
-                        count += occurrences
-                else:
-                    if find.lower() in run.text.lower():
-                        pattern = re.compile(re.escape(find), re.IGNORECASE)
-                        matches = pattern.findall(run.text)
-                        run.text = pattern.sub(replace, run.text)
-                        count += len(matches)
+        pattern = None if match_case else re.compile(re.escape(find), re.IGNORECASE)
+        count, _ = replace_in_run_texts(shape._element, find, replace, pattern)
         
         if count > 0:
             return count
@@ -2178,17 +2485,11 @@ class PowerPointAgent:
             if not full_text:
                 return 0
             
-            if match_case:
-                if find in full_text:
-                    occurrences = full_text.count(find)
-                    shape.text = full_text.replace(find, replace)
-                    return occurrences
-            else:
-                if find.lower() in full_text.lower():
-                    pattern = re.compile(re.escape(find), re.IGNORECASE)
-                    matches = pattern.findall(full_text)
-                    shape.text = pattern.sub(replace, full_text)
-                    return len(matches)
+            # Single pass: substitute and inspect the match count, no separate probe
+            new_text, occurrences = substitute_text(full_text, find, replace, pattern)
+            if occurrences:
+                shape.text = new_text
+                return occurrences
         except (AttributeError, TypeError):
             pass
         
@@ -2900,47 +3201,39 @@ class PowerPointAgent:
         sp_tree = slide.shapes._spTree
         element = shape.element
         
-        # Find current position in XML tree
-        current_index = -1
-        shape_elements = [child for child in sp_tree if child.tag.endswith('}sp') or 
-                         child.tag.endswith('}pic') or child.tag.endswith('}graphicFrame')]
-        
-        for i, child in enumerate(sp_tree):
-            if child == element:
-                current_index = i
-                break
-        
-        if current_index == -1:
+        # Find current position in XML tree; lxml's index() is a C-level
+        # identity scan, with no Python-level loop over the children
+        try:
+            current_index = sp_tree.index(element)
+        except ValueError:
             raise PowerPointAgentError(
                 "Could not locate shape in XML tree",
                 details={"slide_index": slide_index, "shape_index": shape_index}
             )
         
         new_index = current_index
-        max_index = len(sp_tree) - 1
         
-        # Execute the z-order action
+        # Execute the z-order action. lxml moves an attached element in one
+        # call, so nothing is removed first; shapes stay between
+        # nvGrpSpPr/grpSpPr (indices 0 and 1) and an optional <p:extLst>
         if action == "bring_to_front":
-            sp_tree.remove(element)
-            sp_tree.append(element)
-            new_index = len(sp_tree) - 1
+            sp_tree.insert_element_before(element, "p:extLst")
+            new_index = sp_tree.index(element)
             
         elif action == "send_to_back":
-            sp_tree.remove(element)
-            # Insert after nvGrpSpPr and grpSpPr (indices 0 and 1 typically)
-            sp_tree.insert(2, element)
+            sp_tree.grpSpPr.addnext(element)
             new_index = 2
             
         elif action == "bring_forward":
-            if current_index < max_index:
-                sp_tree.remove(element)
-                sp_tree.insert(current_index + 1, element)
+            neighbor = element.getnext()
+            if neighbor is not None and neighbor.tag != qn("p:extLst"):
+                neighbor.addnext(element)
                 new_index = current_index + 1
                 
         elif action == "send_backward":
-            if current_index > 2:  # Don't go before required elements
-                sp_tree.remove(element)
-                sp_tree.insert(current_index - 1, element)
+            neighbor = element.getprevious()
+            if neighbor is not None and neighbor.tag != qn("p:grpSpPr"):
+                neighbor.addprevious(element)
                 new_index = current_index - 1
         
         version_after = self._capture_version()
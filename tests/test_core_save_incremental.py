@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Tests for PowerPointAgent.save_incremental"""
+
+import pytest
+import struct
+import sys
+import zipfile
+from pathlib import Path
+from pptx import Presentation
+from pptx.util import Inches
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import core.powerpoint_agent_core as agent_core
+from core.powerpoint_agent_core import PowerPointAgent
+
+
+@pytest.fixture
+def images(tmp_path):
+    """Create two distinct pictures."""
+    paths = []
+    for i, color in enumerate([(0, 128, 0), (128, 0, 0)]):
+        path = tmp_path / f"image{i}.png"
+        Image.new("RGB", (200, 100), color).save(path)
+        paths.append(path)
+    return paths
+
+
+@pytest.fixture
+def sample_pptx(tmp_path, images):
+    """Create a presentation with a picture on each of two slides."""
+    pptx_path = tmp_path / "test_save_incremental.pptx"
+    prs = Presentation()
+    for image in images:
+        slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank
+        slide.shapes.add_picture(str(image), Inches(1), Inches(1))
+    prs.save(str(pptx_path))
+    return pptx_path
+
+
+def _raw_entries(pptx_path):
+    with zipfile.ZipFile(pptx_path) as archive:
+        return {
+            info.filename: (info.CRC, info.compress_size)
+            for info in archive.infolist()
+        }
+
+
+class TestSaveIncremental:
+    """Tests for rewriting only dirty parts."""
+
+    def test_rewrites_dirty_parts_and_copies_the_rest(self, sample_pptx):
+        before = _raw_entries(sample_pptx)
+
+        with PowerPointAgent(sample_pptx, track_versions=False) as agent:
+            agent.open(sample_pptx)
+            slide = agent.prs.slides[1]
+            slide.shapes[0].name = "Renamed"
+            assert agent.save_incremental([slide.part]) is True
+
+        after = _raw_entries(sample_pptx)
+        assert list(after) == list(before)
+        changed = {name for name in before if before[name] != after[name]}
+        assert changed == {"ppt/slides/slide2.xml"}
+
+        with zipfile.ZipFile(sample_pptx) as archive:
+            assert archive.testzip() is None
+        assert Presentation(str(sample_pptx)).slides[1].shapes[0].name == "Renamed"
+
+    def test_new_parts_fall_back_to_full_save(self, sample_pptx, tmp_path):
+        third = tmp_path / "image2.png"
+        Image.new("RGB", (200, 100), (0, 0, 128)).save(third)
+
+        with PowerPointAgent(sample_pptx, track_versions=False) as agent:
+            agent.open(sample_pptx)
+            slide = agent.prs.slides[0]
+            slide.shapes.add_picture(str(third), Inches(3), Inches(1))
+            assert agent.save_incremental([slide.part]) is False
+
+        assert len(Presentation(str(sample_pptx)).slides[0].shapes) == 2
+
+    @pytest.mark.parametrize("error", [AttributeError("_didModify"), struct.error("unpack")])
+    def test_raw_copy_failure_falls_back_to_full_save(self, sample_pptx, monkeypatch, error):
+        def broken_copy(source, target, info):
+            raise error
+
+        monkeypatch.setattr(agent_core, "copy_zip_entry_raw", broken_copy)
+
+        with PowerPointAgent(sample_pptx, track_versions=False) as agent:
+            agent.open(sample_pptx)
+            slide = agent.prs.slides[1]
+            slide.shapes[0].name = "Renamed"
+            assert agent.save_incremental([slide.part]) is False
+
+        assert sorted(p.name for p in sample_pptx.parent.glob("*.pptx")) == [sample_pptx.name]
+        with zipfile.ZipFile(sample_pptx) as archive:
+            assert archive.testzip() is None
+        assert Presentation(str(sample_pptx)).slides[1].shapes[0].name == "Renamed"
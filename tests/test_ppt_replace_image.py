@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Tests for ppt_replace_image.py v3.1"""
+
+import os
+import pytest
+import sys
+from pathlib import Path
+from pptx import Presentation
+from pptx.util import Inches
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+
+from core.powerpoint_agent_core import AssetValidator, ImageNotFoundError
+from ppt_replace_image import replace_image, replace_images_batch
+
+
+@pytest.fixture
+def images(tmp_path):
+    """Create an original and a replacement image."""
+    old_png = tmp_path / "logo.png"
+    new_png = tmp_path / "new_logo.png"
+    Image.new("RGB", (200, 100), (0, 128, 0)).save(old_png)
+    Image.new("RGB", (200, 100), (128, 0, 0)).save(new_png)
+    return old_png, new_png
+
+
+@pytest.fixture
+def sample_pptx(tmp_path, images):
+    """Create a presentation with a named logo on two slides."""
+    old_png, _ = images
+    pptx_path = tmp_path / "test_replace_image.pptx"
+    prs = Presentation()
+    for _ in range(2):
+        slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank
+        picture = slide.shapes.add_picture(str(old_png), Inches(1), Inches(1))
+        picture.name = "company_logo"
+    prs.save(str(pptx_path))
+    return pptx_path
+
+
+def _blob(pptx_path, slide_index):
+    prs = Presentation(str(pptx_path))
+    return prs.slides[slide_index].shapes[0].image.blob
+
+
+class TestReplaceImage:
+    """Tests for single replacements."""
+
+    def test_missing_image_raises_and_keeps_file(self, sample_pptx, images):
+        _, new_png = images
+        before = sample_pptx.read_bytes()
+
+        with pytest.raises(ImageNotFoundError):
+            replace_image(sample_pptx, 0, "no_such_image", new_png)
+
+        assert sample_pptx.read_bytes() == before
+
+    def test_no_version_hash(self, sample_pptx, images):
+        _, new_png = images
+        result = replace_image(sample_pptx, 0, "logo", new_png, version_hash=False)
+        assert result["replaced"] is True
+        assert result["presentation_version_before"] is None
+        assert result["presentation_version_after"] is None
+
+
+class TestReplaceImagesBatch:
+    """Tests for --batch manifests."""
+
+    def test_batch_replaces_all(self, sample_pptx, images):
+        _, new_png = images
+        original_blob = _blob(sample_pptx, 0)
+
+        result = replace_images_batch(sample_pptx, [
+            {"slide": 0, "old_image": "logo", "new_image": str(new_png)},
+            {"slide": 1, "old_image": "company_logo", "new_image": str(new_png)},
+        ])
+
+        assert result["operations_applied"] == 2
+        assert _blob(sample_pptx, 0) != original_blob
+        assert _blob(sample_pptx, 1) == _blob(sample_pptx, 0)
+
+    def test_batch_failure_saves_nothing(self, sample_pptx, images):
+        _, new_png = images
+        before = sample_pptx.read_bytes()
+
+        with pytest.raises(ImageNotFoundError):
+            replace_images_batch(sample_pptx, [
+                {"slide": 0, "old_image": "logo", "new_image": str(new_png)},
+                {"slide": 1, "old_image": "missing", "new_image": str(new_png)},
+            ])
+
+        assert sample_pptx.read_bytes() == before
+
+    def test_batch_rejects_malformed_operation(self, sample_pptx):
+        with pytest.raises(ValueError, match="missing required keys"):
+            replace_images_batch(sample_pptx, [{"slide": 0}])
+
+    @pytest.mark.parametrize("value", ["false", "0", 0, None])
+    def test_batch_rejects_non_boolean_compress(self, sample_pptx, images, value):
+        _, new_png = images
+        before = sample_pptx.read_bytes()
+
+        with pytest.raises(ValueError, match="non-boolean compress"):
+            replace_images_batch(sample_pptx, [
+                {"slide": 0, "old_image": "logo", "new_image": str(new_png), "compress": value},
+            ])
+
+        assert sample_pptx.read_bytes() == before
+
+
+class TestCompression:
+    """Tests for compress=True size safeguards."""
+
+    def test_small_image_embedded_unchanged(self, sample_pptx, images):
+        _, new_png = images
+        replace_image(sample_pptx, 0, "logo", new_png, compress=True)
+        assert _blob(sample_pptx, 0) == new_png.read_bytes()
+
+    def test_falls_back_when_reencoding_grows_file(self, tmp_path):
+        noisy = tmp_path / "noisy.jpg"
+        Image.frombytes("RGB", (1200, 900), os.urandom(1200 * 900 * 3)).save(noisy, quality=40)
+        assert noisy.stat().st_size >= 200 * 1024
+
+        output = AssetValidator.compress_image(noisy, quality=95)
+        assert output.getvalue() == noisy.read_bytes()
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""Tests for ppt_replace_text.py v3.1"""
+
+import pytest
+import sys
+from pathlib import Path
+from pptx import Presentation
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+
+from ppt_replace_text import (
+    replace_text, replace_text_bulk, _compile_bulk_prefilter, PARALLEL_SCAN_MIN_SLIDES
+)
+
+
+@pytest.fixture
+def sample_pptx(tmp_path):
+    """Create a presentation with words that contain each other."""
+    pptx_path = tmp_path / "test_replace_text.pptx"
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank
+
+    box = slide.shapes.add_textbox(0, 0, 100, 100)
+    box.text_frame.text = "Art and Cartography. ART class (art)"
+
+    prs.save(str(pptx_path))
+    return pptx_path
+
+
+class TestWholeWords:
+    """Tests for --whole-words matching."""
+
+    def test_dry_run_counts_whole_words_only(self, sample_pptx):
+        result = replace_text(sample_pptx, "art", "Design", dry_run=True, whole_words=True)
+        assert result["total_matches"] == 3
+        assert result["whole_words"] is True
+
+    def test_dry_run_substring_default(self, sample_pptx):
+        result = replace_text(sample_pptx, "art", "Design", dry_run=True)
+        assert result["total_matches"] == 4
+
+    def test_replace_whole_words_match_case(self, sample_pptx):
+        replace_text(sample_pptx, "Art", "Design", match_case=True, whole_words=True)
+
+        prs = Presentation(str(sample_pptx))
+        text = prs.slides[0].shapes[0].text_frame.text
+        assert text == "Design and Cartography. ART class (art)"
+
+    def test_replace_whole_words_ignore_case(self, sample_pptx):
+        replace_text(sample_pptx, "art", "Design", whole_words=True)
+
+        prs = Presentation(str(sample_pptx))
+        text = prs.slides[0].shapes[0].text_frame.text
+        assert text == "Design and Cartography. Design class (Design)"
+
+
+class TestLiteralReplacement:
+    """Tests for replacement text containing regex template syntax."""
+
+    @pytest.mark.parametrize("options", [
+        {}, {"whole_words": True}, {"whole_words": True, "match_case": True}
+    ])
+    def test_backslashes_are_inserted_literally(self, sample_pptx, options):
+        replace_text(sample_pptx, "Art", r"C:\new \1 \d", **options)
+
+        text = Presentation(str(sample_pptx)).slides[0].shapes[0].text_frame.text
+        assert text.startswith(r"C:\new \1 \d and ")
+
+
+class TestDryRunAndApply:
+    """Tests for the combined --dry-run-and-apply mode."""
+
+    def test_preview_then_apply(self, sample_pptx):
+        result = replace_text(sample_pptx, "art", "Design", dry_run_and_apply=True)
+        assert result["action"] == "dry_run_and_apply"
+        assert result["total_matches"] == 4
+        assert result["preview_locations"][0]["occurrences"] == 4
+        assert result["replacements_made"] == 1
+
+        prs = Presentation(str(sample_pptx))
+        assert "art" not in prs.slides[0].shapes[0].text_frame.text.lower()
+
+    def test_no_matches_leaves_file_untouched(self, sample_pptx):
+        before = sample_pptx.read_bytes()
+        result = replace_text(sample_pptx, "missing", "x", dry_run_and_apply=True)
+        assert result["total_matches"] == 0
+        assert result["replacements_made"] == 0
+        assert sample_pptx.read_bytes() == before
+
+    def test_conflicts_with_dry_run(self, sample_pptx):
+        with pytest.raises(ValueError):
+            replace_text(sample_pptx, "art", "x", dry_run=True, dry_run_and_apply=True)
+
+
+class TestRunLevelReplacement:
+    """Tests for <a:t>-level replacement."""
+
+    def test_preserves_run_formatting(self, tmp_path):
+        pptx_path = tmp_path / "runs.pptx"
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        paragraph = slide.shapes.add_textbox(0, 0, 100, 100).text_frame.paragraphs[0]
+        bold = paragraph.add_run()
+        bold.text = "Acme "
+        bold.font.bold = True
+        plain = paragraph.add_run()
+        plain.text = "by acme"
+        prs.save(str(pptx_path))
+
+        result = replace_text(pptx_path, "acme", "Zen")
+        assert result["replacements_made"] == 2
+
+        runs = Presentation(str(pptx_path)).slides[0].shapes[0].text_frame.paragraphs[0].runs
+        assert [r.text for r in runs] == ["Zen ", "by Zen"]
+        assert runs[0].font.bold is True
+        assert runs[1].font.bold is None
+
+
+class TestCaseInsensitiveScan:
+    """Tests for regex-based case-insensitive counting."""
+
+    def test_dry_run_counts_non_ascii_case_insensitively(self, tmp_path):
+        pptx_path = tmp_path / "cyrillic.pptx"
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        slide.shapes.add_textbox(0, 0, 100, 100).text_frame.text = "Привет, ПРИВЕТ и привет"
+        prs.save(str(pptx_path))
+
+        assert replace_text(pptx_path, "привет", "x", dry_run=True)["total_matches"] == 3
+        assert replace_text(
+            pptx_path, "привет", "x", dry_run=True, match_case=True
+        )["total_matches"] == 1
+
+
+    def test_dry_run_count_matches_replacements(self, tmp_path):
+        pptx_path = tmp_path / "turkish.pptx"
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        slide.shapes.add_textbox(0, 0, 100, 100).text_frame.text = "İnfo and ınfo"
+        prs.save(str(pptx_path))
+
+        for find in ["info", "ınfo"]:
+            counted = replace_text(pptx_path, find, "x", dry_run=True)["total_matches"]
+            assert counted == 2
+        assert replace_text(pptx_path, "info", "x")["replacements_made"] == 1
+
+        text = Presentation(str(pptx_path)).slides[0].shapes[0].text_frame.text
+        assert text == "x and x"
+
+
+class TestParallelScan:
+    """Tests for the thread-pooled dry-run scan on large decks."""
+
+    def test_large_deck_keeps_slide_order(self, tmp_path):
+        pptx_path = tmp_path / "large.pptx"
+        prs = Presentation()
+        slide_total = PARALLEL_SCAN_MIN_SLIDES + 10
+        for i in range(slide_total):
+            slide = prs.slides.add_slide(prs.slide_layouts[6])
+            slide.shapes.add_textbox(0, 0, 100, 100).text_frame.text = "Acme " * (i % 3 + 1)
+        prs.save(str(pptx_path))
+
+        result = replace_text(pptx_path, "acme", "x", dry_run=True)
+
+        assert [loc["slide"] for loc in result["locations"]] == list(range(slide_total))
+        assert result["total_matches"] == sum(i % 3 + 1 for i in range(slide_total))
+
+    def test_repeated_text_counted_per_slide(self, tmp_path):
+        pptx_path = tmp_path / "boilerplate.pptx"
+        prs = Presentation()
+        for _ in range(3):
+            slide = prs.slides.add_slide(prs.slide_layouts[6])
+            slide.shapes.add_textbox(0, 0, 100, 100).text_frame.text = "Acme, by acme"
+        prs.save(str(pptx_path))
+
+        result = replace_text(pptx_path, "acme", "x", dry_run=True)
+
+        assert [(loc["slide"], loc["occurrences"]) for loc in result["locations"]] == [
+            (0, 2), (1, 2), (2, 2)
+        ]
+
+
+class TestBulkReplacement:
+    """Tests for --replacements-file bulk mode."""
+
+    def test_applies_all_pairs_in_one_pass(self, sample_pptx):
+        result = replace_text_bulk(sample_pptx, [
+            {"find": "art", "replace": "X"},
+            {"find": "Cartography", "replace": "Maps"},
+        ])
+
+        assert [pair["occurrences"] for pair in result["pairs"]] == [3, 1]
+        assert result["replacements_made"] == 4
+
+        text = Presentation(str(sample_pptx)).slides[0].shapes[0].text_frame.text
+        assert text == "X and Maps. X class (X)"
+
+    def test_per_pair_options_and_dry_run(self, sample_pptx):
+        before = sample_pptx.read_bytes()
+        result = replace_text_bulk(sample_pptx, [
+            {"find": "ART", "replace": "X", "match_case": True},
+            {"find": "and", "replace": "&", "whole_words": True},
+        ], dry_run=True)
+
+        assert [pair["occurrences"] for pair in result["pairs"]] == [1, 1]
+        assert result["total_matches"] == 2
+        assert sample_pptx.read_bytes() == before
+
+    def test_rejects_malformed_pairs(self, sample_pptx):
+        with pytest.raises(ValueError, match="non-empty 'find'"):
+            replace_text_bulk(sample_pptx, [{"find": "", "replace": "x"}])
+
+    def test_accepts_find_replace_arrays(self, sample_pptx):
+        result = replace_text_bulk(sample_pptx, [["Cartography", "Maps"], ["class", "course"]])
+        assert result["replacements_made"] == 2
+        assert result["pairs"][1] == {
+            "find": "class", "replace": "course",
+            "match_case": False, "whole_words": False, "occurrences": 1
+        }
+
+
+class TestShapeScope:
+    """Tests for --shape targeting."""
+
+    def test_only_target_shape_is_touched(self, sample_pptx):
+        prs = Presentation(str(sample_pptx))
+        prs.slides[0].shapes.add_textbox(0, 0, 100, 100).text_frame.text = "art"
+        prs.save(str(sample_pptx))
+
+        result = replace_text(sample_pptx, "art", "X", slide_index=0, shape_index=1)
+        assert result["replacements_made"] == 1
+
+        shapes = Presentation(str(sample_pptx)).slides[0].shapes
+        assert shapes[0].text_frame.text == "Art and Cartography. ART class (art)"
+        assert shapes[1].text_frame.text == "X"
+
+    def test_out_of_range_shape(self, sample_pptx):
+        with pytest.raises(ValueError, match=r"Shape index 5 out of range \(0-0\)"):
+            replace_text(sample_pptx, "art", "X", slide_index=0, shape_index=5)
+
+    def test_prefilter_respects_per_pair_case(self):
+        may_match = _compile_bulk_prefilter([
+            {"find": "ART", "replace": "x", "match_case": True},
+            {"find": "straße", "replace": "x"},
+        ], match_case=False)
+
+        assert may_match("ART class")
+        assert not may_match("art class")
+        assert may_match("STRAẞE")
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""Tests for ppt_search_content.py v3.1.1"""
+
+import io
+import json
+import os
+import pytest
+import re
+import sys
+from pathlib import Path
+from pptx import Presentation
+from pptx.util import Inches
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+
+from ppt_search_content import (
+    search_content, search_content_stream, build_prefilter, build_ascii_needle, compile_pattern,
+    serve,
+    _iter_slide_matches, _iter_spans, _is_position_independent, PARALLEL_SEARCH_MIN_SLIDES
+)
+
+
+@pytest.fixture
+def sample_pptx(tmp_path):
+    """Create a presentation with text, a table and speaker notes."""
+    pptx_path = tmp_path / "test_search_content.pptx"
+    prs = Presentation()
+
+    slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank
+    slide.shapes.add_textbox(0, 0, 100, 100).text_frame.text = "Q4 Revenue grew\nrevenue targets"
+    table = slide.shapes.add_table(2, 2, Inches(1), Inches(2), Inches(4), Inches(1)).table
+    table.cell(0, 0).text = "Revenue"
+    table.cell(1, 1).text = "Costs"
+    slide.notes_slide.notes_text_frame.text = "Mention REVENUE twice: revenue"
+
+    other = prs.slides.add_slide(prs.slide_layouts[6])
+    other.shapes.add_textbox(0, 0, 100, 100).text_frame.text = "Nothing relevant"
+
+    prs.save(str(pptx_path))
+    return pptx_path
+
+
+class TestSearchContent:
+    """Tests for plain-text and regex search."""
+
+    def test_counts_text_table_and_notes(self, sample_pptx):
+        result = search_content(sample_pptx, "revenue")
+        locations = sorted(m["location"] for m in result["matches"])
+        assert locations == ["notes", "notes", "table", "text", "text"]
+        assert result["slides_with_matches"] == [0]
+
+    def test_case_sensitive(self, sample_pptx):
+        result = search_content(sample_pptx, "Revenue", case_sensitive=True)
+        assert result["total_matches"] == 2
+
+    def test_regex(self, sample_pptx):
+        result = search_content(sample_pptx, r"Q\d", is_regex=True)
+        assert result["total_matches"] == 1
+
+    def test_no_context(self, sample_pptx):
+        result = search_content(sample_pptx, "revenue", include_context=False)
+        assert result["total_matches"] == 5
+        assert all("context" not in m for m in result["matches"])
+
+
+class TestSearchContentStream:
+    """Tests for --stream NDJSON output."""
+
+    def test_stream_matches_batch_results(self, sample_pptx):
+        records = []
+        summary = search_content_stream(sample_pptx, "revenue", emit=records.append)
+
+        batch = search_content(sample_pptx, "revenue")
+        assert records[0]["header"]["presentation_version"] == batch["presentation_version"]
+        assert records[1:-1] == batch["matches"]
+        assert records[-1] == {"summary": summary}
+        assert summary["total_matches"] == batch["total_matches"]
+        assert summary["slides_with_matches"] == batch["slides_with_matches"]
+
+
+class TestMaxMatches:
+    """Tests for --max-matches early termination."""
+
+    def test_stops_at_limit(self, sample_pptx):
+        result = search_content(sample_pptx, "revenue", max_matches=3)
+        assert result["total_matches"] == 3
+        assert result["max_matches_reached"] is True
+        assert result["matches"] == search_content(sample_pptx, "revenue")["matches"][:3]
+
+    def test_stops_before_later_slides(self, sample_pptx):
+        result = search_content(sample_pptx, "revenue", max_matches=1)
+        assert result["slides_searched"] == 1
+
+        result = search_content(sample_pptx, "relevant", max_matches=5)
+        assert result["total_matches"] == 1
+        assert result["max_matches_reached"] is False
+        assert result["slides_searched"] == 2
+
+    def test_stream_stops_at_limit(self, sample_pptx):
+        records = []
+        summary = search_content_stream(sample_pptx, "revenue", emit=records.append, max_matches=2)
+        assert len(records) == 4
+        assert summary["total_matches"] == 2
+        assert summary["max_matches_reached"] is True
+
+    def test_rejects_non_positive_limit(self, sample_pptx):
+        with pytest.raises(ValueError, match="max_matches"):
+            search_content(sample_pptx, "revenue", max_matches=0)
+
+
+class TestPrefilter:
+    """Tests for the literal prefilter and ASCII fast path."""
+
+    def test_no_prefilter_for_regex(self):
+        assert build_prefilter(r"\d+", is_regex=True) is None
+
+    def test_never_rejects_ignorecase_matches(self):
+        prefilter = build_prefilter("s")
+        # re.IGNORECASE matches LATIN SMALL LETTER LONG S against "s"
+        assert prefilter("ſ")
+        assert not prefilter("xyz")
+
+    def test_dotted_and_dotless_i_are_not_rejected(self):
+        for query, text in [("i", "ı"), ("Link", "LİNK"), ("in", "İn"), ("ı", "I")]:
+            prefilter = build_prefilter(query)
+            assert re.search(re.escape(query), text, re.IGNORECASE)
+            assert prefilter is None or prefilter(text)
+
+    def test_ascii_fast_path_matches_regex(self):
+        pattern = re.compile(re.escape("ab"), re.IGNORECASE)
+        for text in ["xABab aB", "abab", "ÄB ab", "nothing"]:
+            assert list(_iter_spans(text, pattern, ascii_needle="ab")) == [
+                (m.group(), m.start(), m.end()) for m in pattern.finditer(text)
+            ]
+        assert build_ascii_needle("Ab") == "ab"
+        assert build_ascii_needle("Äb") is None
+        assert build_ascii_needle("Ab", case_sensitive=True) is None
+
+    def test_compiled_patterns_are_reused(self):
+        assert compile_pattern("a.b") is compile_pattern("a.b")
+        assert compile_pattern("a.b") is not compile_pattern("a.b", case_sensitive=True)
+        assert compile_pattern("a.b").match("aXb") is None
+        with pytest.raises(ValueError, match="Invalid regex"):
+            compile_pattern("(", is_regex=True)
+
+
+class TestRegexSlideFilter:
+    """Tests for rejecting slides with one regex search over their joined text."""
+
+    def test_results_match_per_shape_search(self, sample_pptx):
+        slide = Presentation(str(sample_pptx)).slides[0]
+        for query, expected in [
+            (r"rev\w+", 5), (r"^Nothing", 1), (r"(?<=Q4 )Revenue", 1),
+            (r"\bCosts\b", 1), (r"grew\s+revenue", 1), (r"absent\d", 0)
+        ]:
+            assert search_content(sample_pptx, query, is_regex=True)["total_matches"] == expected
+
+        # A match may not span two shapes through the joined text
+        assert list(_iter_slide_matches(
+            slide, 0, re.compile(r"targets.Revenue", re.DOTALL), None, "all"
+        )) == []
+
+    def test_anchors_and_lookarounds_bypass_filter(self):
+        assert _is_position_independent(r"[^a]+\d\b")
+        assert _is_position_independent(r"\++a+b?")
+        for source in [
+            r"^a", r"a$", r"\Aa", r"a\Z", r"(?=a)", r"(?<!a)b", r"\\^",
+            r"(?>a*)b", r"a*+b", r"a++", r"a?+", r"a{2}+"
+        ]:
+            assert not _is_position_independent(source)
+
+    @pytest.mark.parametrize("query", [r"(?>.*)\b", r".*+\b"])
+    def test_atomic_and_possessive_patterns_match_text_scope(self, tmp_path, query):
+        pptx_path = tmp_path / "atomic.pptx"
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        slide.shapes.add_textbox(0, 0, 100, 100).text_frame.text = "a"
+        slide.shapes.add_textbox(0, 200, 100, 100).text_frame.text = "b-"
+        prs.save(str(pptx_path))
+
+        text_result = search_content(pptx_path, query, is_regex=True, scope="text")
+        all_result = search_content(pptx_path, query, is_regex=True, scope="all")
+
+        assert text_result["total_matches"] == 2
+        assert all_result["total_matches"] == text_result["total_matches"]
+
+
+class TestNotesScope:
+    """Tests for speaker-notes search."""
+
+    def test_does_not_create_notes_slides(self, sample_pptx):
+        slide = Presentation(str(sample_pptx)).slides[1]
+        assert list(_iter_slide_matches(slide, 1, re.compile("x"), None, "notes")) == []
+        assert not slide.has_notes_slide
+
+
+class TestParallelSearch:
+    """Tests for the thread-pooled search on large decks."""
+
+    def test_large_deck_keeps_slide_order(self, tmp_path):
+        pptx_path = tmp_path / "large.pptx"
+        prs = Presentation()
+        slide_total = PARALLEL_SEARCH_MIN_SLIDES + 10
+        for i in range(slide_total):
+            slide = prs.slides.add_slide(prs.slide_layouts[6])
+            slide.shapes.add_textbox(0, 0, 100, 100).text_frame.text = "Acme " * (i % 3 + 1)
+        prs.save(str(pptx_path))
+
+        result = search_content(pptx_path, "acme")
+
+        assert result["slides_with_matches"] == list(range(slide_total))
+        assert result["total_matches"] == sum(i % 3 + 1 for i in range(slide_total))
+        assert [m["slide_index"] for m in result["matches"]] == sorted(
+            m["slide_index"] for m in result["matches"]
+        )
+
+
+class TestServe:
+    """Tests for --serve NDJSON request handling."""
+
+    def _serve(self, *requests):
+        responses = []
+        lines = "\n".join(r if isinstance(r, str) else json.dumps(r) for r in requests)
+        serve(io.StringIO(lines), emit=responses.append)
+        return responses
+
+    def test_answers_each_request_in_order(self, sample_pptx):
+        responses = self._serve(
+            {"id": "a", "file": str(sample_pptx), "query": "revenue"},
+            {"id": "b", "file": str(sample_pptx), "query": "Revenue", "case_sensitive": True},
+            "not json",
+            {"id": "c", "file": str(sample_pptx), "query": "x", "scope": "bogus"},
+        )
+
+        assert [r.get("id") for r in responses] == ["a", "b", None, "c"]
+        assert responses[0] == {"id": "a", **search_content(sample_pptx, "revenue")}
+        assert responses[1]["total_matches"] == 2
+        assert responses[2]["status"] == "error"
+        assert responses[3]["error_type"] == "ValueError"
+
+    def test_error_payloads(self, sample_pptx, tmp_path):
+        responses = self._serve(
+            {"file": str(sample_pptx), "query": "x", "slide": 9},
+            {"file": str(tmp_path / "missing.pptx"), "query": "x"},
+        )
+
+        assert responses[0]["error_type"] == "SlideNotFoundError"
+        assert responses[0]["details"]["requested_index"] == 9
+        assert responses[1]["error_type"] == "FileNotFoundError"
+        assert "details" not in responses[1]
+
+    def test_validation_errors_do_not_blame_the_regex(self, sample_pptx):
+        responses = self._serve(
+            "not json",
+            "[1]",
+            {"file": str(sample_pptx)},
+            {"file": str(sample_pptx), "query": "x", "scope": "bogus"},
+            {"file": str(sample_pptx), "query": "x", "max_matches": 0},
+            {"file": str(sample_pptx), "query": "x", "max_matches": "5"},
+            {"file": str(sample_pptx), "query": "x", "slide": "1"},
+            {"file": str(sample_pptx), "query": "x", "slide": True},
+            {"file": str(sample_pptx), "query": "(", "regex": True},
+        )
+
+        assert {r["error_type"] for r in responses} == {"ValueError"}
+        assert all("regex" not in r["suggestion"] for r in responses[:-1])
+        assert "regex" in responses[-1]["suggestion"]
+
+    def test_slide_text_memo_keeps_results(self, sample_pptx):
+        queries = ["costs", "Mention", "grew", "absent", "REVENUE"]
+        responses = self._serve(*(
+            {"file": str(sample_pptx), "query": q, "case_sensitive": q == "REVENUE"}
+            for q in queries
+        ))
+
+        assert [r["total_matches"] for r in responses] == [
+            search_content(sample_pptx, q, case_sensitive=q == "REVENUE")["total_matches"]
+            for q in queries
+        ] == [1, 1, 1, 0, 1]
+
+    def test_reopens_changed_file(self, sample_pptx):
+        request = {"file": str(sample_pptx), "query": "Costs"}
+        responses = []
+
+        def emit(response):
+            responses.append(response)
+            if len(responses) == 1:
+                prs = Presentation(str(sample_pptx))
+                prs.slides[1].shapes[0].text_frame.text = "Costs"
+                prs.save(str(sample_pptx))
+                stat = sample_pptx.stat()
+                os.utime(sample_pptx, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        serve(io.StringIO(json.dumps(request) + "\n" + json.dumps(request)), emit=emit)
+
+        assert [r["total_matches"] for r in responses] == [1, 2]
+        assert responses[0]["presentation_version"] != responses[1]["presentation_version"]
+
+
+class TestRepeatedText:
+    """Tests for reusing hits of text repeated across slides."""
+
+    def test_repeated_footer_reports_every_slide(self, tmp_path):
+        pptx_path = tmp_path / "boilerplate.pptx"
+        prs = Presentation()
+        for _ in range(3):
+            slide = prs.slides.add_slide(prs.slide_layouts[6])
+            slide.shapes.add_textbox(0, 0, 100, 100).text_frame.text = "Intro"
+            slide.shapes.add_textbox(0, 0, 100, 100).text_frame.text = "(c) Acme Corp"
+        prs.save(str(pptx_path))
+
+        result = search_content(pptx_path, "acme")
+
+        assert [(m["slide_index"], m["shape_index"]) for m in result["matches"]] == [
+            (0, 1), (1, 1), (2, 1)
+        ]
+        assert {m["context"] for m in result["matches"]} == {"(c) Acme Corp"}
+        assert result["matches"][0] is not result["matches"][1]
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Tests for ppt_set_background.py v3.1.0"""
+
+import pytest
+import sys
+from pathlib import Path
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.enum.dml import MSO_FILL
+from pptx.util import Inches
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+
+from ppt_set_background import set_background
+
+
+@pytest.fixture
+def sample_pptx(tmp_path):
+    """Create a presentation with three blank slides."""
+    pptx_path = tmp_path / "test_set_background.pptx"
+    prs = Presentation()
+    for _ in range(3):
+        prs.slides.add_slide(prs.slide_layouts[6])  # Blank
+    prs.save(str(pptx_path))
+    return pptx_path
+
+
+@pytest.fixture
+def image(tmp_path):
+    """Create a background image."""
+    png = tmp_path / "bg.png"
+    Image.new("RGB", (160, 90), (0, 64, 128)).save(png)
+    return png
+
+
+def _image_rels(slide):
+    return [rel for rel in slide.part.rels.values() if rel.reltype.endswith("/image")]
+
+
+class TestSetBackground:
+    """Tests for color and image backgrounds."""
+
+    def test_color_all_slides(self, sample_pptx):
+        result = set_background(sample_pptx, color="#112233", all_slides=True)
+        assert result["slide_indices"] == [0, 1, 2]
+
+        for slide in Presentation(str(sample_pptx)).slides:
+            assert slide.background.fill.type == MSO_FILL.SOLID
+            assert slide.background.fill.fore_color.rgb == RGBColor(0x11, 0x22, 0x33)
+
+    def test_image_shares_one_part(self, sample_pptx, image):
+        set_background(sample_pptx, image=image, all_slides=True)
+
+        slides = Presentation(str(sample_pptx)).slides
+        parts = {_image_rels(slide)[0].target_part.partname for slide in slides}
+        assert all(slide.background.fill.type == MSO_FILL.PICTURE for slide in slides)
+        assert len(parts) == 1
+
+    def test_color_replaces_image_and_drops_relationship(self, sample_pptx, image):
+        set_background(sample_pptx, image=image, slide_index=1)
+        set_background(sample_pptx, color="FFFFFF", slide_index=1)
+
+        slide = Presentation(str(sample_pptx)).slides[1]
+        assert slide.background.fill.type == MSO_FILL.SOLID
+        assert _image_rels(slide) == []
+
+    def test_color_keeps_relationship_shared_with_picture(self, sample_pptx, image):
+        prs = Presentation(str(sample_pptx))
+        prs.slides[0].shapes.add_picture(str(image), Inches(1), Inches(1))
+        prs.save(str(sample_pptx))
+
+        set_background(sample_pptx, image=image, slide_index=0)
+        set_background(sample_pptx, color="#00FF00", slide_index=0)
+
+        slide = Presentation(str(sample_pptx)).slides[0]
+        assert slide.background.fill.type == MSO_FILL.SOLID
+        assert slide.shapes[0].image.blob == image.read_bytes()
+        assert len(_image_rels(slide)) == 1
+
+    def test_unchanged_background_skips_save(self, sample_pptx, image):
+        first = set_background(sample_pptx, color="#112233", all_slides=True)
+        assert "no_changes" not in first
+        before = sample_pptx.read_bytes()
+
+        again = set_background(sample_pptx, color="112233", all_slides=True)
+        assert again["no_changes"] is True
+        assert again["presentation_version_after"] == again["presentation_version_before"]
+        assert sample_pptx.read_bytes() == before
+
+        set_background(sample_pptx, image=image, slide_index=0)
+        before = sample_pptx.read_bytes()
+        assert set_background(sample_pptx, image=image, slide_index=0)["no_changes"] is True
+        assert sample_pptx.read_bytes() == before
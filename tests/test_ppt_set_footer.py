@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""Tests for ppt_set_footer.py v3.1.0"""
+
+import copy
+import io
+import json
+import pytest
+import sys
+from pathlib import Path
+from pptx import Presentation
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+
+from ppt_set_footer import serve, set_footer
+
+FOOTER = 15  # PP_PLACEHOLDER.FOOTER
+
+
+def _footer_texts(placeholders_owner):
+    return [
+        shape.text for shape in placeholders_owner.placeholders
+        if shape.placeholder_format.type == FOOTER
+    ]
+
+
+@pytest.fixture
+def sample_pptx(tmp_path):
+    """Create a presentation whose first and last slides carry a footer placeholder."""
+    pptx_path = tmp_path / "test_set_footer.pptx"
+    prs = Presentation()
+    layout = prs.slide_layouts[1]  # Title and Content
+    layout_footer = next(
+        ph for ph in layout.placeholders if ph.placeholder_format.type == FOOTER
+    )
+    for i in range(3):
+        slide = prs.slides.add_slide(layout)
+        if i != 1:
+            slide.shapes._spTree.append(copy.deepcopy(layout_footer._element))
+    prs.save(str(pptx_path))
+    return pptx_path
+
+
+class TestPlaceholderStrategy:
+    """Tests for footer placeholders on slides and layouts."""
+
+    def test_updates_slide_and_layout_placeholders(self, sample_pptx):
+        result = set_footer(sample_pptx, text="Acme Confidential")
+        assert result["method_used"] == "placeholder"
+        assert result["slides_updated"] == 2
+
+        prs = Presentation(str(sample_pptx))
+        assert [_footer_texts(slide) for slide in prs.slides] == [
+            ["Acme Confidential"], [], ["Acme Confidential"]
+        ]
+        assert _footer_texts(prs.slide_layouts[1]) == ["Acme Confidential"]
+
+    def test_falls_back_to_text_boxes(self, tmp_path):
+        pptx_path = tmp_path / "blank.pptx"
+        prs = Presentation()
+        prs.slides.add_slide(prs.slide_layouts[6])
+        prs.save(str(pptx_path))
+
+        result = set_footer(pptx_path, text="Acme")
+        assert result["method_used"] == "text_box"
+        assert result["slides_updated"] == 1
+
+    def test_keeps_first_run_formatting(self, sample_pptx):
+        prs = Presentation(str(sample_pptx))
+        footer = next(
+            ph for ph in prs.slides[0].placeholders if ph.placeholder_format.type == FOOTER
+        )
+        paragraph = footer.text_frame.paragraphs[0]
+        first = paragraph.add_run()
+        first.text = "Old "
+        first.font.bold = True
+        paragraph.add_run().text = "footer"
+        footer.text_frame.add_paragraph().text = "second line"
+        prs.save(str(sample_pptx))
+
+        set_footer(sample_pptx, text="New footer")
+
+        footer = next(
+            ph for ph in Presentation(str(sample_pptx)).slides[0].placeholders
+            if ph.placeholder_format.type == FOOTER
+        )
+        runs = [run for p in footer.text_frame.paragraphs for run in p.runs]
+        assert footer.text == "New footer"
+        assert len(runs) == 1
+        assert runs[0].font.bold is True
+
+    @pytest.mark.parametrize("plain_run", [False, True])
+    def test_field_text_is_not_overwritten(self, sample_pptx, plain_run):
+        from pptx.oxml.ns import qn
+
+        prs = Presentation(str(sample_pptx))
+        footer = next(
+            ph for ph in prs.slides[0].placeholders if ph.placeholder_format.type == FOOTER
+        )
+        if plain_run:
+            footer.text_frame.paragraphs[0].add_run().text = "Old footer"
+        paragraph = footer.text_frame.paragraphs[0]._p
+        fld = paragraph.makeelement(qn("a:fld"), {"id": "{B6F15528-21DE-4FAA-801E-634DDDAF4B2B}", "type": "datetime1"})
+        fld.append(fld.makeelement(qn("a:t"), {}))
+        fld[0].text = "1/1/2024"
+        paragraph.insert(0, fld)
+        prs.save(str(sample_pptx))
+
+        set_footer(sample_pptx, text="Acme Confidential")
+
+        footer = next(
+            ph for ph in Presentation(str(sample_pptx)).slides[0].placeholders
+            if ph.placeholder_format.type == FOOTER
+        )
+        assert footer.text == "Acme Confidential"
+        assert footer._element.txBody.find(".//" + qn("a:fld")) is None
+
+    def test_unchanged_footer_skips_save(self, sample_pptx):
+        assert "no_changes" not in set_footer(sample_pptx, text="Acme")
+        before = sample_pptx.read_bytes()
+
+        result = set_footer(sample_pptx, text="Acme")
+        assert result["no_changes"] is True
+        assert result["slides_updated"] == 2
+        assert result["presentation_version_after"] == result["presentation_version_before"]
+        assert sample_pptx.read_bytes() == before
+
+    def test_nothing_to_do_is_a_warning_without_save(self, tmp_path):
+        pptx_path = tmp_path / "blank.pptx"
+        prs = Presentation()
+        prs.slides.add_slide(prs.slide_layouts[6])
+        prs.save(str(pptx_path))
+        before = pptx_path.read_bytes()
+
+        result = set_footer(pptx_path)
+        assert result["status"] == "warning"
+        assert result["method_used"] is None
+        assert result["no_changes"] is True
+        assert pptx_path.read_bytes() == before
+
+    def test_show_number_only_counts_footer_slides(self, sample_pptx):
+        before = sample_pptx.read_bytes()
+        result = set_footer(sample_pptx, show_number=True)
+        assert result["method_used"] == "placeholder"
+        assert result["slides_updated"] == 2
+        assert sample_pptx.read_bytes() == before
+
+    def test_text_box_copies_get_own_ids_and_numbers(self, tmp_path):
+        pptx_path = tmp_path / "blank.pptx"
+        prs = Presentation()
+        for _ in range(3):
+            prs.slides.add_slide(prs.slide_layouts[6])
+        prs.save(str(pptx_path))
+
+        result = set_footer(pptx_path, text="Acme", show_number=True)
+        assert result["slides_updated"] == 3
+
+        for i, slide in enumerate(Presentation(str(pptx_path)).slides):
+            assert [shape.text for shape in slide.shapes] == ["Acme", str(i + 1)]
+            assert len({shape.shape_id for shape in slide.shapes}) == 2
+            assert slide.shapes[0].text_frame.paragraphs[0].font.size.pt == 10
+
+
+class TestServe:
+    """Tests for --serve edits against one open presentation."""
+
+    def test_edits_are_saved_once(self, sample_pptx):
+        requests = [{"text": "Draft"}, {"text": "Final"}, {"text": "Final"}, {"cmd": "flush"}]
+        responses = []
+        serve(sample_pptx, io.StringIO("\n".join(map(json.dumps, requests))), emit=responses.append)
+
+        assert [r.get("pending_edits") for r in responses[:3]] == [1, 2, 2]
+        assert responses[2]["no_changes"] is True
+        assert responses[3]["edits_saved"] == 2
+        prs = Presentation(str(sample_pptx))
+        assert [_footer_texts(slide) for slide in prs.slides] == [["Final"], [], ["Final"]]
+
+    def test_rejects_unknown_commands(self, sample_pptx):
+        before = sample_pptx.read_bytes()
+        responses = []
+        serve(sample_pptx, io.StringIO('{"cmd": "save"}\n[1]\n'), emit=responses.append)
+
+        assert [r["error_type"] for r in responses] == ["ValueError", "ValueError"]
+        assert sample_pptx.read_bytes() == before
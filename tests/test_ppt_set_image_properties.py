@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Tests for ppt_set_image_properties.py v3.1.0"""
+
+import io
+import json
+import pytest
+import sys
+from pathlib import Path
+from pptx import Presentation
+from pptx.util import Inches
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+
+from core.powerpoint_agent_core import (
+    PowerPointAgentError, ShapeNotFoundError, SlideNotFoundError
+)
+from ppt_set_image_properties import serve, set_image_properties
+
+
+@pytest.fixture
+def sample_pptx(tmp_path):
+    """Create a presentation with one picture on a blank slide."""
+    png = tmp_path / "logo.png"
+    Image.new("RGB", (200, 100), (0, 128, 0)).save(png)
+    pptx_path = tmp_path / "test_set_image_properties.pptx"
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank
+    slide.shapes.add_picture(str(png), Inches(1), Inches(1))
+    prs.save(str(pptx_path))
+    return pptx_path
+
+
+class TestSetImageProperties:
+    """Tests for alt text, opacity support and index validation."""
+
+    def test_sets_alt_text(self, sample_pptx):
+        result = set_image_properties(sample_pptx, 0, 0, alt_text="Company Logo")
+        assert result["status"] == "success"
+        assert result["properties_set"] == {"alt_text": "Company Logo"}
+        assert result["presentation_version_before"] is not None
+
+    def test_unchanged_alt_text_skips_save(self, sample_pptx):
+        assert "no_changes" not in set_image_properties(sample_pptx, 0, 0, alt_text="Logo")
+        before = sample_pptx.read_bytes()
+
+        result = set_image_properties(sample_pptx, 0, 0, alt_text="Logo")
+        assert result["no_changes"] is True
+        assert result["presentation_version_after"] == result["presentation_version_before"]
+        assert sample_pptx.read_bytes() == before
+
+    def test_no_version_hash(self, sample_pptx):
+        result = set_image_properties(sample_pptx, 0, 0, alt_text="Logo", version_hash=False)
+        assert result["presentation_version_before"] is None
+        assert result["presentation_version_after"] is None
+
+    def test_unsupported_opacity_leaves_file_untouched(self, sample_pptx):
+        before = sample_pptx.read_bytes()
+        with pytest.raises(PowerPointAgentError, match="opacity is not supported"):
+            set_image_properties(sample_pptx, 0, 0, alt_text="Logo", opacity=0.5)
+        assert sample_pptx.read_bytes() == before
+
+    def test_shape_out_of_range(self, sample_pptx):
+        with pytest.raises(ShapeNotFoundError, match=r"out of range \(0-0\)"):
+            set_image_properties(sample_pptx, 0, 1, alt_text="x")
+
+    def test_slide_out_of_range(self, sample_pptx):
+        with pytest.raises(SlideNotFoundError):
+            set_image_properties(sample_pptx, 3, 0, alt_text="x")
+
+
+class TestServe:
+    """Tests for --serve edits against one open presentation."""
+
+    def test_saves_on_flush_and_eof(self, sample_pptx):
+        before = sample_pptx.read_bytes()
+        responses = []
+
+        def emit(response):
+            responses.append(response)
+            if len(responses) == 2:
+                # The edits so far are not on disk until the flush
+                assert sample_pptx.read_bytes() == before
+
+        requests = [
+            {"id": 1, "slide": 0, "shape": 0, "alt_text": "Logo"},
+            {"slide": 0, "shape": 5, "alt_text": "x"},
+            {"cmd": "flush"},
+            {"slide": 0, "shape": 0, "alt_text": "Final logo"},
+        ]
+        serve(sample_pptx, io.StringIO("\n".join(map(json.dumps, requests))), emit=emit)
+
+        assert responses[0]["id"] == 1
+        assert responses[0]["pending_edits"] == 1
+        assert responses[1]["error_type"] == "ShapeNotFoundError"
+        assert responses[2]["saved"] is True
+        assert responses[2]["edits_saved"] == 1
+        picture = Presentation(str(sample_pptx)).slides[0].shapes[0]
+        assert picture._element.get("descr") == "Final logo"
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Tests for ppt_set_slide_layout.py v3.1.0"""
+
+import io
+import json
+import pytest
+import sys
+from pathlib import Path
+from pptx import Presentation
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+
+from core.powerpoint_agent_core import LayoutNotFoundError, PowerPointAgentError
+from ppt_set_slide_layout import serve, set_slide_layout
+
+
+@pytest.fixture
+def sample_pptx(tmp_path):
+    """Create a presentation with one Title Slide."""
+    pptx_path = tmp_path / "test_set_slide_layout.pptx"
+    prs = Presentation()
+    prs.slides.add_slide(prs.slide_layouts[0])  # Title Slide
+    prs.save(str(pptx_path))
+    return pptx_path
+
+
+class TestLayoutMatching:
+    """Tests for case-insensitive and substring layout matching."""
+
+    def test_case_insensitive_exact_match(self, sample_pptx):
+        # "Blank" is destructive, so the matched name surfaces in the --force error
+        with pytest.raises(PowerPointAgentError, match="to 'Blank' requires --force"):
+            set_slide_layout(sample_pptx, 0, "BLANK")
+
+    def test_substring_match(self, sample_pptx):
+        with pytest.raises(PowerPointAgentError, match="to 'Blank' requires --force"):
+            set_slide_layout(sample_pptx, 0, "lan")
+
+    def test_unknown_layout_suggests_close_matches(self, sample_pptx):
+        with pytest.raises(LayoutNotFoundError) as excinfo:
+            set_slide_layout(sample_pptx, 0, "Tile Slide")
+        assert "Title Slide" in excinfo.value.details["suggestions"]
+
+
+class TestServe:
+    """Tests for --serve edits against one open presentation."""
+
+    def test_failed_edits_leave_file_untouched(self, sample_pptx):
+        before = sample_pptx.read_bytes()
+        responses = []
+        requests = [
+            {"id": "a", "slide": 0, "layout": "Tile Slide"},
+            {"slide": 0, "layout": "Blank"},
+            {"slide": 0},
+            {"cmd": "flush"},
+        ]
+        serve(sample_pptx, io.StringIO("\n".join(map(json.dumps, requests))), emit=responses.append)
+
+        assert [r["status"] for r in responses] == ["error", "error", "error", "success"]
+        assert responses[0]["id"] == "a"
+        assert responses[0]["error_type"] == "LayoutNotFoundError"
+        assert responses[2]["error_type"] == "ValueError"
+        assert responses[3]["saved"] is False
+        assert sample_pptx.read_bytes() == before
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Tests for ppt_set_title.py v3.1.0"""
+
+import io
+import json
+import pytest
+import sys
+from pathlib import Path
+from pptx import Presentation
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+
+from core.powerpoint_agent_core import SlideNotFoundError
+from ppt_set_title import serve, set_title, set_titles_batch, MAX_TITLE_LENGTH
+
+
+@pytest.fixture
+def sample_pptx(tmp_path):
+    """Create a title slide and a title-and-content slide."""
+    pptx_path = tmp_path / "test_set_title.pptx"
+    prs = Presentation()
+    prs.slides.add_slide(prs.slide_layouts[0])  # Title Slide
+    prs.slides.add_slide(prs.slide_layouts[1])  # Title and Content
+    prs.save(str(pptx_path))
+    return pptx_path
+
+
+class TestSetTitle:
+    """Tests for setting titles and subtitles."""
+
+    def test_sets_title_and_subtitle(self, sample_pptx):
+        result = set_title(sample_pptx, 0, "Q4 Results", subtitle="Growth")
+        assert result["status"] == "success"
+        assert result["placeholders_found"] == {"title": True, "subtitle": True}
+        assert result["shape_count"] == 2
+
+        slide = Presentation(str(sample_pptx)).slides[0]
+        assert slide.shapes.title.text == "Q4 Results"
+        assert slide.placeholders[1].text == "Growth"
+
+    def test_missing_subtitle_placeholder_warns(self, sample_pptx):
+        result = set_title(sample_pptx, 1, "Market Analysis", subtitle="Europe")
+        assert result["status"] == "warning"
+        assert result["placeholders_found"] == {"title": True, "subtitle": False}
+
+    def test_subtitle_placeholder_is_not_a_title(self, tmp_path):
+        pptx_path = tmp_path / "subtitle_only.pptx"
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[0])
+        slide.shapes._spTree.remove(slide.shapes.title._element)
+        prs.save(str(pptx_path))
+
+        result = set_title(pptx_path, 0, "Q4 Results", subtitle="Growth")
+        assert result["placeholders_found"] == {"title": False, "subtitle": True}
+
+
+class TestDryRun:
+    """Tests for --dry-run and string-only rejection."""
+
+    def test_dry_run_does_not_open_the_file(self, tmp_path):
+        not_a_deck = tmp_path / "broken.pptx"
+        not_a_deck.write_bytes(b"not a zip")
+
+        result = set_title(not_a_deck, 3, "A" * 70, dry_run=True)
+        assert result["dry_run"] is True
+        assert result["status"] == "warning"
+        assert result["layout"] is None
+        assert result["validation"]["title_length_ok"] is False
+        assert not_a_deck.read_bytes() == b"not a zip"
+
+    def test_overlong_title_rejected_before_open(self, tmp_path):
+        not_a_deck = tmp_path / "broken.pptx"
+        not_a_deck.write_bytes(b"not a zip")
+
+        with pytest.raises(ValueError, match="maximum"):
+            set_title(not_a_deck, 0, "A" * (MAX_TITLE_LENGTH + 1))
+
+
+class TestSetTitlesBatch:
+    """Tests for --titles-json manifests."""
+
+    def test_sets_all_titles(self, sample_pptx):
+        result = set_titles_batch(sample_pptx, [
+            {"slide": 0, "title": "Q4 Results", "subtitle": "Growth"},
+            {"slide": 1, "title": "Market Analysis"},
+        ])
+
+        assert result["operations_applied"] == 2
+        assert [r["slide_index"] for r in result["results"]] == [0, 1]
+        prs = Presentation(str(sample_pptx))
+        assert [slide.shapes.title.text for slide in prs.slides] == ["Q4 Results", "Market Analysis"]
+
+    def test_failure_saves_nothing(self, sample_pptx):
+        before = sample_pptx.read_bytes()
+
+        with pytest.raises(SlideNotFoundError):
+            set_titles_batch(sample_pptx, [
+                {"slide": 0, "title": "Q4 Results"},
+                {"slide": 4, "title": "Missing"},
+            ])
+
+        assert sample_pptx.read_bytes() == before
+
+    def test_rejects_malformed_entry_before_open(self, sample_pptx):
+        with pytest.raises(ValueError, match="missing required keys"):
+            set_titles_batch(sample_pptx, [{"slide": 0}])
+        with pytest.raises(ValueError, match="maximum"):
+            set_titles_batch(sample_pptx, [{"slide": 0, "title": "A" * (MAX_TITLE_LENGTH + 1)}])
+
+
+class TestServe:
+    """Tests for --serve edits against one open presentation."""
+
+    def test_edits_are_saved_once(self, sample_pptx):
+        requests = [
+            {"id": "a", "slide": 0, "title": "Q4 Results", "subtitle": "Growth"},
+            {"slide": 1, "title": "Market Analysis"},
+            {"slide": 5, "title": "Missing"},
+            {"cmd": "flush"},
+        ]
+        responses = []
+        serve(sample_pptx, io.StringIO("\n".join(map(json.dumps, requests))), emit=responses.append)
+
+        assert responses[0]["id"] == "a"
+        assert [r.get("pending_edits") for r in responses[:2]] == [1, 2]
+        assert responses[2]["error_type"] == "SlideNotFoundError"
+        assert responses[3]["edits_saved"] == 2
+
+        prs = Presentation(str(sample_pptx))
+        assert [slide.shapes.title.text for slide in prs.slides] == ["Q4 Results", "Market Analysis"]
+
+    def test_rejects_malformed_requests(self, sample_pptx):
+        before = sample_pptx.read_bytes()
+        responses = []
+        serve(sample_pptx, io.StringIO('{"slide": 0}\n{"cmd": "save"}\n'), emit=responses.append)
+
+        assert [r["error_type"] for r in responses] == ["ValueError", "ValueError"]
+        assert sample_pptx.read_bytes() == before
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Tests for ppt_set_z_order.py v3.1.0"""
+
+import io
+import json
+import pytest
+import sys
+import zipfile
+from pathlib import Path
+from lxml import etree
+from pptx import Presentation
+from pptx.oxml.ns import qn
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+
+from core.powerpoint_agent_core import ShapeNotFoundError
+from ppt_set_z_order import serve, set_z_order, set_z_order_batch
+
+
+@pytest.fixture
+def sample_pptx(tmp_path):
+    """Create a slide with three named text boxes."""
+    pptx_path = tmp_path / "test_set_z_order.pptx"
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank
+    for name in "ABC":
+        slide.shapes.add_textbox(0, 0, 100, 100).name = name
+    prs.save(str(pptx_path))
+    return pptx_path
+
+
+def _names(pptx_path):
+    return [shape.name for shape in Presentation(str(pptx_path)).slides[0].shapes]
+
+
+class TestSetZOrder:
+    """Tests for the four layering actions."""
+
+    @pytest.mark.parametrize("shape_index, action, expected", [
+        (0, "bring_to_front", ["B", "C", "A"]),
+        (2, "send_to_back", ["C", "A", "B"]),
+        (0, "bring_forward", ["B", "A", "C"]),
+        (2, "send_backward", ["A", "C", "B"]),
+    ])
+    def test_reorders_shapes(self, sample_pptx, shape_index, action, expected):
+        result = set_z_order(sample_pptx, 0, shape_index, action)
+        assert result["status"] == "success"
+        assert _names(sample_pptx) == expected
+
+    def test_reports_xml_positions(self, sample_pptx):
+        # nvGrpSpPr and grpSpPr precede the shapes in <p:spTree>
+        result = set_z_order(sample_pptx, 0, 0, "bring_forward")
+        assert result["z_order_change"] == {"from": 2, "to": 3}
+
+    @pytest.mark.parametrize("shape_index, action", [
+        (2, "bring_to_front"), (2, "bring_forward"), (0, "send_to_back"), (0, "send_backward"),
+    ])
+    def test_shape_already_at_the_end_skips_save(self, sample_pptx, shape_index, action):
+        before = sample_pptx.read_bytes()
+
+        result = set_z_order(sample_pptx, 0, shape_index, action)
+        assert result["no_changes"] is True
+        assert result["z_order_change"]["from"] == result["z_order_change"]["to"]
+        assert result["presentation_version_after"] == result["presentation_version_before"]
+        assert sample_pptx.read_bytes() == before
+
+    def test_shapes_stay_inside_the_shape_range(self, sample_pptx):
+        prs = Presentation(str(sample_pptx))
+        etree.SubElement(prs.slides[0].shapes._spTree, qn("p:extLst"))
+        prs.save(str(sample_pptx))
+
+        set_z_order(sample_pptx, 0, 2, "bring_forward")
+        set_z_order(sample_pptx, 0, 0, "send_backward")
+        set_z_order(sample_pptx, 0, 0, "bring_to_front")
+
+        sp_tree = Presentation(str(sample_pptx)).slides[0].shapes._spTree
+        assert [child.tag for child in sp_tree][:2] == [qn("p:nvGrpSpPr"), qn("p:grpSpPr")]
+        assert sp_tree[-1].tag == qn("p:extLst")
+        assert _names(sample_pptx) == ["B", "C", "A"]
+
+
+class TestSetZOrderBatch:
+    """Tests for --actions-json manifests."""
+
+    def test_applies_actions_in_order(self, sample_pptx):
+        result = set_z_order_batch(sample_pptx, [
+            {"slide": 0, "shape": 0, "action": "bring_to_front"},
+            {"slide": 0, "shape": 0, "action": "bring_forward"},
+        ])
+
+        assert result["operations_applied"] == 2
+        assert [r["z_order_change"] for r in result["results"]] == [
+            {"from": 2, "to": 4}, {"from": 2, "to": 3}
+        ]
+        assert _names(sample_pptx) == ["C", "B", "A"]
+
+    def test_failure_saves_nothing(self, sample_pptx):
+        before = sample_pptx.read_bytes()
+
+        with pytest.raises(ShapeNotFoundError):
+            set_z_order_batch(sample_pptx, [
+                {"slide": 0, "shape": 0, "action": "bring_to_front"},
+                {"slide": 0, "shape": 7, "action": "send_to_back"},
+            ])
+
+        assert sample_pptx.read_bytes() == before
+
+    def test_rejects_malformed_action(self, sample_pptx):
+        with pytest.raises(ValueError, match="missing required keys"):
+            set_z_order_batch(sample_pptx, [{"slide": 0, "shape": 1}])
+        with pytest.raises(ValueError, match="invalid action"):
+            set_z_order_batch(sample_pptx, [{"slide": 0, "shape": 1, "action": "raise"}])
+
+
+class TestServe:
+    """Tests for --serve changes against one open presentation."""
+
+    def test_changes_are_saved_at_eof(self, sample_pptx):
+        requests = [
+            {"id": 1, "slide": 0, "shape": 0, "action": "bring_to_front"},
+            {"slide": 0, "shape": 9, "action": "send_to_back"},
+            {"slide": 0, "shape": 0, "action": "raise"},
+            {"slide": 0, "shape": 0, "action": "bring_forward"},
+        ]
+        responses = []
+        serve(sample_pptx, io.StringIO("\n".join(map(json.dumps, requests))), emit=responses.append)
+
+        assert responses[0]["id"] == 1
+        assert [r.get("error_type") for r in responses] == [
+            None, "ShapeNotFoundError", "ValueError", None
+        ]
+        assert responses[3]["pending_edits"] == 2
+        assert _names(sample_pptx) == ["C", "B", "A"]
+
+    def test_no_op_changes_are_not_pending(self, sample_pptx):
+        before = sample_pptx.read_bytes()
+        requests = [{"slide": 0, "shape": 2, "action": "bring_to_front"}, {"cmd": "flush"}]
+        responses = []
+        serve(sample_pptx, io.StringIO("\n".join(map(json.dumps, requests))), emit=responses.append)
+
+        assert responses[0]["no_changes"] is True
+        assert responses[0]["pending_edits"] == 0
+        assert responses[1]["saved"] is False
+        assert sample_pptx.read_bytes() == before
+
+
+class TestIncrementalSave:
+    """Tests for saving only the touched slide."""
+
+    def test_other_slides_are_copied_unchanged(self, sample_pptx):
+        prs = Presentation(str(sample_pptx))
+        prs.slides.add_slide(prs.slide_layouts[6]).shapes.add_textbox(0, 0, 100, 100)
+        prs.save(str(sample_pptx))
+        with zipfile.ZipFile(sample_pptx) as archive:
+            before = {info.filename: info.CRC for info in archive.infolist()}
+
+        set_z_order_batch(sample_pptx, [{"slide": 0, "shape": 0, "action": "bring_to_front"}])
+
+        with zipfile.ZipFile(sample_pptx) as archive:
+            after = {info.filename: info.CRC for info in archive.infolist()}
+        assert {name for name in before if before[name] != after[name]} == {"ppt/slides/slide1.xml"}
+        assert _names(sample_pptx) == ["B", "C", "A"]
@@ -9,6 +9,7 @@ Version: 3.1.0
 
 Usage:
     uv run tools/ppt_replace_image.py --file presentation.pptx --slide 0 --old-image "logo" --new-image new_logo.png --json
+    uv run tools/ppt_replace_image.py --file presentation.pptx --batch replacements.json --json
 
 Exit Codes:
     0: Success
@@ -23,37 +24,118 @@ Use Cases:
 
 import sys
 import os
-
-# --- HYGIENE BLOCK START ---
-# CRITICAL: Redirect stderr to /dev/null to prevent library noise from corrupting JSON output
-sys.stderr = open(os.devnull, 'w')
-# --- HYGIENE BLOCK END ---
-
 import json
 import argparse
 from pathlib import Path
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Dict, Any, List
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from core.powerpoint_agent_core import (
-    PowerPointAgent, 
-    PowerPointAgentError, 
-    SlideNotFoundError
-)
+# NOTE: core.powerpoint_agent_core (python-pptx, lxml, PIL) is imported inside
+# the functions that need it, so --help and input-validation errors stay fast.
+if TYPE_CHECKING:
+    from core.powerpoint_agent_core import PowerPointAgent
 
 __version__ = "3.1.0"
 
-# Define fallback exception if not available in core
-try:
-    from core.powerpoint_agent_core import ImageNotFoundError
-except ImportError:
-    class ImageNotFoundError(PowerPointAgentError):
-        """Exception raised when image is not found."""
-        def __init__(self, message: str, details: Dict = None):
-            self.message = message
-            self.details = details or {}
-            super().__init__(message)
+
+def _write_json(payload: Dict[str, Any]) -> None:
+    """
+    Write a JSON payload to stdout, using orjson when it is installed.
+    
+    The encoded bytes go straight to file descriptor 1, skipping the
+    TextIOWrapper encode/buffer copy.
+    """
+    if HAS_ORJSON:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        data = (json.dumps(payload, indent=2) + "\n").encode("utf-8")
+    
+    # Keep ordering with anything already buffered on sys.stdout
+    sys.stdout.flush()
+    view = memoryview(data)
+    while view:
+        view = view[os.write(1, view):]
+
+
+VALID_IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.tif'}
+
+
+def _validate_new_image(new_image: Path) -> None:
+    """
+    Validate that a replacement image exists and has a supported format.
+    
+    Raises:
+        ImageNotFoundError: If the image file doesn't exist
+        ValueError: If the image format is not supported
+    """
+    if not new_image.exists():
+        from core.powerpoint_agent_core import ImageNotFoundError
+        raise ImageNotFoundError(
+            f"New image file not found: {new_image}",
+            details={"new_image_path": str(new_image)}
+        )
+    
+    if new_image.suffix.lower() not in VALID_IMAGE_EXTENSIONS:
+        raise ValueError(
+            f"Unsupported image format: {new_image.suffix}. "
+            f"Supported formats: {', '.join(sorted(VALID_IMAGE_EXTENSIONS))}"
+        )
+
+
+def _apply_replacement(
+    agent: "PowerPointAgent",
+    slide_index: int,
+    old_image: str,
+    new_image: Path,
+    compress: bool
+) -> Dict[str, Any]:
+    """
+    Replace one image on an already-open presentation (no save).
+    
+    Returns:
+        Replacement details from PowerPointAgent.replace_image
+        
+    Raises:
+        SlideNotFoundError: If slide index is out of range
+        ImageNotFoundError: If old image is not found on the slide
+    """
+    from core.powerpoint_agent_core import ImageNotFoundError, SlideNotFoundError
+    
+    total_slides = agent.get_slide_count()
+    if not 0 <= slide_index < total_slides:
+        raise SlideNotFoundError(
+            f"Slide index {slide_index} out of range (0-{total_slides - 1})",
+            details={
+                "requested_index": slide_index,
+                "available_slides": total_slides
+            }
+        )
+    
+    replacement = agent.replace_image(
+        slide_index=slide_index,
+        old_image_name=old_image,
+        new_image_path=new_image,
+        compress=compress
+    )
+    
+    if not replacement["replaced"]:
+        raise ImageNotFoundError(
+            f"Image matching '{old_image}' not found on slide {slide_index}. "
+            "Use ppt_get_slide_info.py to list available images.",
+            details={
+                "search_pattern": old_image,
+                "slide_index": slide_index
+            }
+        )
+    
+    return replacement
 
 
 def replace_image(
@@ -61,7 +143,8 @@ def replace_image(
     slide_index: int,
     old_image: str,
     new_image: Path,
-    compress: bool = False
+    compress: bool = False,
+    version_hash: bool = True
 ) -> Dict[str, Any]:
     """
     Replace an existing image with a new one.
@@ -75,6 +158,8 @@ def replace_image(
         old_image: Name or partial name of the image to replace
         new_image: Path to the new image file
         compress: Whether to compress the new image (default: False)
+        version_hash: Compute presentation version hashes (default: True).
+            Disable to skip the full-deck hashing passes; versions are None.
         
     Returns:
         Dict containing:
@@ -87,8 +172,8 @@ def replace_image(
             - new_image_size_mb: Size in MB
             - compressed: Whether compression was applied
             - replaced: True if replacement succeeded
-            - presentation_version_before: State hash before replacement
-            - presentation_version_after: State hash after replacement
+            - presentation_version_before: State hash before replacement (None if disabled)
+            - presentation_version_after: State hash after replacement (None if disabled)
             - tool_version: Version of this tool
             
     Raises:
@@ -110,63 +195,30 @@ def replace_image(
     if not filepath.exists():
         raise FileNotFoundError(f"Presentation file not found: {filepath}")
     
-    # Validate new image file exists
-    if not new_image.exists():
-        raise ImageNotFoundError(
-            f"New image file not found: {new_image}",
-            details={"new_image_path": str(new_image)}
-        )
+    # Validate new image file and format
+    _validate_new_image(new_image)
     
-    # Validate image format
-    valid_extensions = {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.tif'}
-    if new_image.suffix.lower() not in valid_extensions:
-        raise ValueError(
-            f"Unsupported image format: {new_image.suffix}. "
-            f"Supported formats: {', '.join(sorted(valid_extensions))}"
-        )
+    from core.powerpoint_agent_core import PowerPointAgent
+    
+    version_before = None
+    version_after = None
     
-    with PowerPointAgent(filepath) as agent:
+    with PowerPointAgent(filepath, track_versions=version_hash) as agent:
         agent.open(filepath)
         
         # Capture version BEFORE replacement
-        info_before = agent.get_presentation_info()
-        version_before = info_before.get("presentation_version")
-        
-        # Validate slide index
-        total_slides = agent.get_slide_count()
-        if not 0 <= slide_index < total_slides:
-            raise SlideNotFoundError(
-                f"Slide index {slide_index} out of range (0-{total_slides - 1})",
-                details={
-                    "requested_index": slide_index,
-                    "available_slides": total_slides
-                }
-            )
+        if version_hash:
+            version_before = agent.get_presentation_version()
         
         # Attempt replacement
-        replaced = agent.replace_image(
-            slide_index=slide_index,
-            old_image_name=old_image,
-            new_image_path=new_image,
-            compress=compress
-        )
-        
-        if not replaced:
-            raise ImageNotFoundError(
-                f"Image matching '{old_image}' not found on slide {slide_index}. "
-                "Use ppt_get_slide_info.py to list available images.",
-                details={
-                    "search_pattern": old_image,
-                    "slide_index": slide_index
-                }
-            )
+        _apply_replacement(agent, slide_index, old_image, new_image, compress)
         
         # Save changes
         agent.save()
         
         # Capture version AFTER replacement
-        info_after = agent.get_presentation_info()
-        version_after = info_after.get("presentation_version")
+        if version_hash:
+            version_after = agent.get_presentation_version()
     
     # Get new image size
     new_size = new_image.stat().st_size
@@ -187,6 +239,163 @@ def replace_image(
     }
 
 
+def replace_images_batch(
+    filepath: Path,
+    operations: List[Dict[str, Any]],
+    compress: bool = False,
+    version_hash: bool = True
+) -> Dict[str, Any]:
+    """
+    Apply several image replacements with a single open/save cycle.
+    
+    The presentation is parsed once, every operation mutates the in-memory
+    XML, and the file is written once at the end. If any operation fails,
+    nothing is saved.
+    
+    Args:
+        filepath: Path to the PowerPoint file to modify
+        operations: List of dicts with "slide", "old_image", "new_image"
+            and optional boolean "compress" (overrides the batch-wide flag)
+        compress: Default compression flag for all operations
+        version_hash: Compute presentation version hashes (default: True)
+        
+    Returns:
+        Dict containing status, per-operation results, operation count,
+        and presentation_version_before/after
+        
+    Raises:
+        FileNotFoundError: If the PowerPoint file doesn't exist
+        ValueError: If an operation is malformed or has an unsupported image
+        SlideNotFoundError: If an operation's slide index is out of range
+        ImageNotFoundError: If an operation's old image is not found
+    """
+    if not filepath.exists():
+        raise FileNotFoundError(f"Presentation file not found: {filepath}")
+    
+    if not isinstance(operations, list) or not operations:
+        raise ValueError("Batch manifest must be a non-empty JSON array of operations")
+    
+    # Validate every operation before touching the presentation
+    prepared: List[Dict[str, Any]] = []
+    for op_idx, op in enumerate(operations):
+        if not isinstance(op, dict):
+            raise ValueError(f"Batch operation {op_idx} must be a JSON object")
+        missing = [key for key in ("slide", "old_image", "new_image") if key not in op]
+        if missing:
+            raise ValueError(
+                f"Batch operation {op_idx} is missing required keys: {', '.join(missing)}"
+            )
+        op_compress = op.get("compress", compress)
+        if not isinstance(op_compress, bool):
+            raise ValueError(
+                f"Batch operation {op_idx} has non-boolean compress: {op_compress!r}"
+            )
+        new_image = Path(op["new_image"])
+        _validate_new_image(new_image)
+        prepared.append({
+            "slide_index": int(op["slide"]),
+            "old_image": str(op["old_image"]),
+            "new_image": new_image,
+            "compress": op_compress
+        })
+    
+    from core.powerpoint_agent_core import PowerPointAgent
+    
+    version_before = None
+    version_after = None
+    results: List[Dict[str, Any]] = []
+    
+    with PowerPointAgent(filepath, track_versions=False) as agent:
+        agent.open(filepath)
+        
+        if version_hash:
+            version_before = agent.get_presentation_version()
+        
+        for op in prepared:
+            replacement = _apply_replacement(
+                agent, op["slide_index"], op["old_image"], op["new_image"], op["compress"]
+            )
+            results.append({
+                "slide_index": op["slide_index"],
+                "old_image": op["old_image"],
+                "new_image": str(op["new_image"].resolve()),
+                "old_shape_index": replacement["old_shape_index"],
+                "new_shape_index": replacement["new_shape_index"],
+                "compressed": op["compress"],
+                "replaced": True
+            })
+        
+        # Single save for the whole batch
+        agent.save()
+        
+        if version_hash:
+            version_after = agent.get_presentation_version()
+    
+    return {
+        "status": "success",
+        "file": str(filepath.resolve()),
+        "mode": "batch",
+        "operations_applied": len(results),
+        "results": results,
+        "presentation_version_before": version_before,
+        "presentation_version_after": version_after,
+        "tool_version": __version__
+    }
+
+
+def _error_response(error: Exception) -> Dict[str, Any]:
+    """
+    Build the JSON error payload for an exception raised in main().
+    
+    Core exception types are only checked when the core library has been
+    imported; anything raised before that cannot be a core error.
+    """
+    core = sys.modules.get("core.powerpoint_agent_core")
+    
+    if isinstance(error, FileNotFoundError) or (
+        core is not None and isinstance(error, core.ImageNotFoundError)
+    ):
+        return {
+            "status": "error",
+            "error": str(error),
+            "error_type": type(error).__name__,
+            "details": getattr(error, 'details', {}),
+            "suggestion": "Use ppt_get_slide_info.py to list available images on the slide"
+        }
+    
+    if core is not None and isinstance(error, core.SlideNotFoundError):
+        return {
+            "status": "error",
+            "error": str(error),
+            "error_type": "SlideNotFoundError",
+            "details": getattr(error, 'details', {}),
+            "suggestion": "Use ppt_get_info.py to check available slide indices"
+        }
+    
+    if isinstance(error, ValueError):
+        return {
+            "status": "error",
+            "error": str(error),
+            "error_type": "ValueError",
+            "suggestion": "Check image file format (PNG, JPG, GIF, BMP supported)"
+        }
+    
+    if core is not None and isinstance(error, core.PowerPointAgentError):
+        return {
+            "status": "error",
+            "error": str(error),
+            "error_type": type(error).__name__,
+            "details": getattr(error, 'details', {})
+        }
+    
+    return {
+        "status": "error",
+        "error": str(error),
+        "error_type": type(error).__name__,
+        "tool_version": __version__
+    }
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Replace image in PowerPoint presentation",
@@ -210,6 +419,15 @@ Examples:
     --compress \\
     --json
   
+  # Scripted rebrand on a large deck (skip version hashing)
+  uv run tools/ppt_replace_image.py \\
+    --file presentation.pptx \\
+    --slide 0 \\
+    --old-image "logo" \\
+    --new-image rebrand_logo.png \\
+    --no-version-hash \\
+    --json
+  
   # Partial name match
   uv run tools/ppt_replace_image.py \\
     --file presentation.pptx \\
@@ -217,6 +435,21 @@ Examples:
     --old-image "logo" \\
     --new-image rebrand_logo.png \\
     --json
+  
+  # Batch rebrand (one open/save for all replacements)
+  uv run tools/ppt_replace_image.py \\
+    --file presentation.pptx \\
+    --batch replacements.json \\
+    --json
+
+Batch Manifest (--batch):
+  JSON array of operations, applied in order with a single save:
+  [
+    {"slide": 0, "old_image": "logo", "new_image": "new_logo.png"},
+    {"slide": 5, "old_image": "photo", "new_image": "photo.jpg", "compress": true}
+  ]
+  Image paths are resolved relative to the current directory.
+  If any operation fails, the presentation is left unchanged.
 
 Finding Images:
   Use ppt_get_slide_info.py to list images on a slide:
@@ -231,6 +464,8 @@ Search Strategy:
 Compression (--compress):
   - Resizes to max 1920px width
   - Converts to JPEG at 85% quality
+  - Re-optimizes losslessly with mozjpeg when
+    mozjpeg-lossless-optimization is installed
   - Typically reduces size 50-70%
   - Recommended for images > 1MB
 
@@ -267,30 +502,39 @@ Output Format:
     
     parser.add_argument(
         '--slide',
-        required=True,
         type=int,
         help='Slide index (0-based)'
     )
     
     parser.add_argument(
         '--old-image',
-        required=True,
         help='Name or partial name of image to replace'
     )
     
     parser.add_argument(
         '--new-image',
-        required=True,
         type=Path,
         help='Path to new image file'
     )
     
+    parser.add_argument(
+        '--batch',
+        type=Path,
+        help='JSON manifest of replacements to apply in one pass (replaces --slide/--old-image/--new-image)'
+    )
+    
     parser.add_argument(
         '--compress',
         action='store_true',
         help='Compress new image before inserting'
     )
     
+    parser.add_argument(
+        '--no-version-hash',
+        action='store_true',
+        help='Skip presentation version hashing (faster on large decks)'
+    )
+    
     parser.add_argument(
         '--json',
         action='store_true',
@@ -300,68 +544,53 @@ Output Format:
     
     args = parser.parse_args()
     
+    # --- HYGIENE BLOCK START ---
+    # CRITICAL: Redirect stderr to /dev/null to prevent library noise from corrupting JSON output.
+    # Applied after argument parsing so argparse usage errors still reach the terminal.
+    # fd 2 itself is redirected so C-level output (lxml, zlib) is silenced too;
+    # PPT_DEBUG=1 keeps stderr.
+    if not os.environ.get('PPT_DEBUG'):
+        _devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(_devnull, 2)
+        os.close(_devnull)
+    # --- HYGIENE BLOCK END ---
+    
     try:
-        result = replace_image(
-            filepath=args.file,
-            slide_index=args.slide,
-            old_image=args.old_image,
-            new_image=args.new_image,
-            compress=args.compress
-        )
+        if args.batch:
+            if not args.batch.exists():
+                raise FileNotFoundError(f"Batch manifest not found: {args.batch}")
+            try:
+                with open(args.batch, 'r', encoding='utf-8') as f:
+                    operations = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON in --batch manifest: {e}")
+            
+            result = replace_images_batch(
+                filepath=args.file,
+                operations=operations,
+                compress=args.compress,
+                version_hash=not args.no_version_hash
+            )
+        else:
+            if args.slide is None or not args.old_image or args.new_image is None:
+                raise ValueError(
+                    "--slide, --old-image and --new-image are required unless --batch is used"
+                )
+            
+            result = replace_image(
+                filepath=args.file,
+                slide_index=args.slide,
+                old_image=args.old_image,
+                new_image=args.new_image,
+                compress=args.compress,
+                version_hash=not args.no_version_hash
+            )
         
-        sys.stdout.write(json.dumps(result, indent=2) + "\n")
+        _write_json(result)
         sys.exit(0)
         
-    except (FileNotFoundError, ImageNotFoundError) as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "details": getattr(e, 'details', {}),
-            "suggestion": "Use ppt_get_slide_info.py to list available images on the slide"
-        }
-        sys.stdout.write(json.dumps(error_result, indent=2) + "\n")
-        sys.exit(1)
-        
-    except SlideNotFoundError as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": "SlideNotFoundError",
-            "details": getattr(e, 'details', {}),
-            "suggestion": "Use ppt_get_info.py to check available slide indices"
-        }
-        sys.stdout.write(json.dumps(error_result, indent=2) + "\n")
-        sys.exit(1)
-        
-    except ValueError as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": "ValueError",
-            "suggestion": "Check image file format (PNG, JPG, GIF, BMP supported)"
-        }
-        sys.stdout.write(json.dumps(error_result, indent=2) + "\n")
-        sys.exit(1)
-        
-    except PowerPointAgentError as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "details": getattr(e, 'details', {})
-        }
-        sys.stdout.write(json.dumps(error_result, indent=2) + "\n")
-        sys.exit(1)
-        
     except Exception as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "tool_version": __version__
-        }
-        sys.stdout.write(json.dumps(error_result, indent=2) + "\n")
+        _write_json(_error_response(e))
         sys.exit(1)
 
 
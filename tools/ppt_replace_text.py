@@ -13,6 +13,8 @@ Features:
     - Surgical replacement (specific shape)
     - Dry-run mode (preview without changes)
     - Case-sensitive matching option
+    - Whole-word matching option
+    - Bulk mode (many find/replace pairs from a JSON file in one pass)
     - Formatting-preserving replacement (run-level)
     - Location reporting
 
@@ -30,34 +32,113 @@ Safety:
 
 import sys
 import os
-
-# --- HYGIENE BLOCK START ---
-# CRITICAL: Redirect stderr to /dev/null to prevent library noise from corrupting JSON output
-sys.stderr = open(os.devnull, 'w')
-# --- HYGIENE BLOCK END ---
-
 import re
 import json
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Pattern, Tuple
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from core.powerpoint_agent_core import (
-    PowerPointAgent, 
-    PowerPointAgentError, 
-    SlideNotFoundError
-)
+# NOTE: core.powerpoint_agent_core (python-pptx, lxml, PIL) is imported inside
+# the functions that need it, so --help and input-validation errors stay fast.
 
 __version__ = "3.1.0"
 
+# Dry-run scans of decks at least this large are spread across a thread pool
+PARALLEL_SCAN_MIN_SLIDES = 50
+
+
+def _write_json(payload: Dict[str, Any]) -> None:
+    """
+    Write a JSON payload to stdout, using orjson when it is installed.
+    
+    The encoded bytes go straight to file descriptor 1, skipping the
+    TextIOWrapper encode/buffer copy.
+    """
+    if HAS_ORJSON:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        data = (json.dumps(payload, indent=2) + "\n").encode("utf-8")
+    
+    # Keep ordering with anything already buffered on sys.stdout
+    sys.stdout.flush()
+    view = memoryview(data)
+    while view:
+        view = view[os.write(1, view):]
+
+
+def _compile_matcher(find: str, match_case: bool, whole_words: bool) -> Pattern:
+    """
+    Compile the literal search pattern used for counting and replacement.
+    
+    Whole-word matching uses lookarounds instead of ``\\b`` so that needles
+    starting or ending with punctuation still match, and the pattern
+    contains no alternation or quantifiers, keeping the scan linear.
+    
+    Args:
+        find: Literal text to find
+        match_case: Whether to match case
+        whole_words: Only match when not surrounded by word characters
+        
+    Returns:
+        Compiled regex pattern
+    """
+    source = re.escape(find)
+    if whole_words:
+        source = rf'(?<!\w){source}(?!\w)'
+    return re.compile(source, 0 if match_case else re.IGNORECASE)
+
+
+# re.IGNORECASE equates dotted capital I and dotless i with ASCII "i", but
+# casefold() maps them elsewhere; with these two folded first, every character
+# an IGNORECASE pattern equates with an ASCII character casefolds to it
+_PREFILTER_FOLD = str.maketrans({"\u0130": "i", "\u0131": "i"})
+
+
+def _prefilter_needle(find: str, match_case: bool) -> Optional[str]:
+    """
+    Return the _may_contain needle for ``find``, or None when no literal test is exact.
+    
+    Case-insensitive needles are folded only when ASCII; for other needles
+    IGNORECASE and casefold() disagree on more characters, so the regex
+    alone decides.
+    """
+    if match_case:
+        return find
+    if find.isascii():
+        return find.casefold()
+    return None
+
+
+def _may_contain(text: str, needle: Optional[str], match_case: bool) -> bool:
+    """
+    Cheap literal containment test used to skip texts before any regex work.
+    
+    ``needle`` comes from _prefilter_needle; it never rejects a text the
+    matcher would match, and None accepts every text.
+    """
+    if needle is None:
+        return True
+    if match_case:
+        return needle in text
+    return needle in text.translate(_PREFILTER_FOLD).casefold()
+
 
 def perform_replacement_on_shape(
     shape, 
     find: str, 
     replace: str, 
-    match_case: bool
+    match_case: bool,
+    whole_words: bool = False,
+    pattern: Optional[Pattern] = None
 ) -> int:
     """
     Perform text replacement in a single shape.
@@ -71,29 +152,25 @@ def perform_replacement_on_shape(
         find: Text to find
         replace: Replacement text
         match_case: Whether to match case
+        whole_words: Only replace whole-word occurrences
+        pattern: Precompiled matcher from _compile_matcher; compiled here
+            when omitted (unused for case-sensitive substring replacement)
         
     Returns:
         Number of replacements made
     """
-    if not hasattr(shape, 'text_frame'):
+    from core.powerpoint_agent_core import replace_in_run_texts, substitute_text
+    
+    if not getattr(shape, 'has_text_frame', False):
         return 0
     
-    count = 0
-    text_frame = shape.text_frame
+    if match_case and not whole_words:
+        pattern = None
+    elif pattern is None:
+        pattern = _compile_matcher(find, match_case, whole_words)
     
     # Strategy 1: Replace in runs (preserves formatting)
-    for paragraph in text_frame.paragraphs:
-        for run in paragraph.runs:
-            if match_case:
-                if find in run.text:
-                    run.text = run.text.replace(find, replace)
-                    count += 1
-            else:
-                if find.lower() in run.text.lower():
-                    pattern = re.compile(re.escape(find), re.IGNORECASE)
-                    if pattern.search(run.text):
-                        run.text = pattern.sub(replace, run.text)
-                        count += 1
+    _, count = replace_in_run_texts(shape._element, find, replace, pattern)
     
     if count > 0:
         return count
@@ -101,32 +178,239 @@ def perform_replacement_on_shape(
     # Strategy 2: Shape-level replacement (if runs didn't catch it due to splitting)
     try:
         full_text = shape.text
-        should_replace = False
         
-        if match_case:
-            if find in full_text:
-                should_replace = True
-        else:
-            if find.lower() in full_text.lower():
-                should_replace = True
+        # Single pass: substitute and inspect the match count, no separate probe
+        new_text, matches = substitute_text(full_text, find, replace, pattern)
         
-        if should_replace:
-            if match_case:
-                new_text = full_text.replace(find, replace)
-            else:
-                pattern = re.compile(re.escape(find), re.IGNORECASE)
-                new_text = pattern.sub(replace, full_text)
-            
-            # Only apply if text actually changed
-            if new_text != full_text:
-                shape.text = new_text
-                count += 1
+        # Only apply if text actually changed
+        if matches and new_text != full_text:
+            shape.text = new_text
+            count += 1
     except Exception:
         pass  # Continue without shape-level replacement
     
     return count
 
 
+def _count_occurrences(
+    text: str,
+    find: str,
+    matcher: Optional[Pattern],
+    ascii_needle: Optional[bytes]
+) -> int:
+    """Count the occurrences of the search in one shape's text."""
+    if ascii_needle is not None and text.isascii():
+        # bytes.lower() folds ASCII only, which is exact for ASCII-only text
+        return text.encode('ascii').lower().count(ascii_needle)
+    if matcher is not None:
+        return len(matcher.findall(text))
+    return text.count(find)
+
+
+def _scan_slide(
+    slide,
+    s_idx: int,
+    find: str,
+    shape_index: Optional[int],
+    matcher: Optional[Pattern],
+    ascii_needle: Optional[bytes] = None,
+    target_shape=None,
+    count_memo: Optional[Dict[str, int]] = None,
+    needle: Optional[str] = None,
+    match_case: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Count occurrences on one slide straight from the slide XML (no shape proxies).
+    
+    When ``ascii_needle`` (the lowercased, ASCII-encoded find string of a
+    plain case-insensitive search) is given, ASCII-only texts are counted
+    with ``bytes.count``; other texts fall back to ``matcher``. With
+    ``count_memo`` (one dict per scan), each distinct shape text is counted
+    once, so boilerplate repeated across slides is not re-scanned.
+    ``needle`` is the same _may_contain prefilter the replace pass uses, so
+    both passes skip exactly the same texts.
+    
+    Returns:
+        List of dry-run location dicts for shapes with at least one match
+    """
+    locations: List[Dict[str, Any]] = []
+    
+    for sh_idx, _, text in _iter_candidate_texts(slide, shape_index, target_shape):
+        if not _may_contain(text, needle, match_case):
+            continue
+        
+        if count_memo is None:
+            occurrences = _count_occurrences(text, find, matcher, ascii_needle)
+        else:
+            occurrences = count_memo.get(text)
+            if occurrences is None:
+                occurrences = count_memo[text] = _count_occurrences(
+                    text, find, matcher, ascii_needle
+                )
+        
+        if occurrences > 0:
+            preview = text[:100] + "..." if len(text) > 100 else text
+            locations.append({
+                "slide": s_idx,
+                "shape": sh_idx,
+                "occurrences": occurrences,
+                "preview": preview
+            })
+    
+    return locations
+
+
+def _replace_in_slide(
+    slide,
+    s_idx: int,
+    find: str,
+    replace: str,
+    match_case: bool,
+    whole_words: bool,
+    shape_index: Optional[int],
+    pattern: Optional[Pattern] = None,
+    target_shape=None,
+    needle: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Perform replacements on one slide (or only on ``target_shape``).
+    
+    ``needle`` is the prefilter string from _prefilter_needle; derived here
+    if omitted.
+    
+    Returns:
+        List of location dicts for shapes where replacements were made
+    """
+    locations: List[Dict[str, Any]] = []
+    shapes = slide.shapes
+    
+    # Shapes in scope whose raw text can contain the needle; the literal
+    # check is far cheaper than running the regex on every run
+    if needle is None:
+        needle = _prefilter_needle(find, match_case)
+    target_shapes = (
+        (sh_idx, shapes._shape_factory(shape_elm))
+        for sh_idx, shape_elm, text in _iter_candidate_texts(slide, shape_index, target_shape)
+        if _may_contain(text, needle, match_case)
+    )
+    
+    # Process each target shape (perform_replacement_on_shape skips non-text shapes)
+    for sh_idx, shape in target_shapes:
+        replacements = perform_replacement_on_shape(
+            shape, find, replace, match_case, whole_words, pattern
+        )
+        
+        if replacements > 0:
+            locations.append({
+                "slide": s_idx,
+                "shape": sh_idx,
+                "replacements": replacements
+            })
+    
+    return locations
+
+
+def _validate_target(
+    filepath: Path,
+    slide_index: Optional[int],
+    shape_index: Optional[int]
+) -> None:
+    """
+    Validate the presentation path and slide/shape scope arguments.
+    
+    Raises:
+        ValueError: If the file format or scope combination is invalid
+        FileNotFoundError: If the file doesn't exist
+    """
+    # Validate file extension
+    valid_extensions = {'.pptx', '.pptm', '.potx'}
+    if filepath.suffix.lower() not in valid_extensions:
+        raise ValueError(
+            f"Invalid PowerPoint file format: {filepath.suffix}. "
+            f"Supported formats: {', '.join(valid_extensions)}"
+        )
+    
+    # Validate file exists
+    if not filepath.exists():
+        raise FileNotFoundError(f"File not found: {filepath}")
+    
+    if shape_index is not None and slide_index is None:
+        raise ValueError(
+            "If --shape is specified, --slide must also be specified. "
+            "Shape indices are slide-specific."
+        )
+
+
+def _resolve_target_slides(agent, slide_index: Optional[int]) -> List[tuple]:
+    """
+    Determine the (index, slide) pairs in scope.
+    
+    Raises:
+        SlideNotFoundError: If slide index is out of range
+    """
+    from core.powerpoint_agent_core import SlideNotFoundError
+    
+    slide_count = agent.get_slide_count()
+    
+    if slide_index is not None:
+        # Single slide scope
+        if not 0 <= slide_index < slide_count:
+            raise SlideNotFoundError(
+                f"Slide index {slide_index} out of range (0-{slide_count - 1})",
+                details={
+                    "requested_index": slide_index,
+                    "available_slides": slide_count
+                }
+            )
+        # NOTE: Direct prs access required for shape-level text manipulation
+        target_slides = [(slide_index, agent.prs.slides[slide_index])]
+    else:
+        # Global scope
+        target_slides = [(i, slide) for i, slide in enumerate(agent.prs.slides)]
+    
+    return target_slides
+
+
+def _resolve_target_shape(slide, slide_index: int, shape_index: int):
+    """
+    Look up the single shape targeted by --shape.
+    
+    The shape is fetched directly; the shape count is only computed for
+    the error message.
+    
+    Raises:
+        ValueError: If shape index is out of range
+    """
+    try:
+        if shape_index < 0:
+            raise IndexError(shape_index)
+        return slide.shapes[shape_index]
+    except IndexError:
+        shape_count = len(slide.shapes)
+        raise ValueError(
+            f"Shape index {shape_index} out of range (0-{shape_count - 1}) on slide {slide_index}"
+        )
+
+
+def _iter_candidate_texts(
+    slide,
+    shape_index: Optional[int] = None,
+    target_shape=None
+) -> Iterator[Tuple[int, Any, str]]:
+    """
+    Yield (shape_index, shape_element, text) for the text shapes in scope.
+    
+    With a resolved target shape only that shape is read; otherwise every
+    text shape on the slide is read straight from the XML.
+    """
+    from core.powerpoint_agent_core import iter_shape_texts
+    
+    if target_shape is None:
+        yield from iter_shape_texts(slide)
+    elif target_shape.has_text_frame:
+        yield shape_index, target_shape._element, target_shape.text_frame.text
+
+
 def replace_text(
     filepath: Path,
     find: str,
@@ -134,7 +418,9 @@ def replace_text(
     slide_index: Optional[int] = None,
     shape_index: Optional[int] = None,
     match_case: bool = False,
-    dry_run: bool = False
+    dry_run: bool = False,
+    whole_words: bool = False,
+    dry_run_and_apply: bool = False
 ) -> Dict[str, Any]:
     """
     Find and replace text with optional targeting.
@@ -152,16 +438,20 @@ def replace_text(
         shape_index: Optional specific shape index (requires slide_index)
         match_case: Whether to match case (default: False)
         dry_run: Preview without making changes (default: False)
+        whole_words: Only match whole words (default: False)
+        dry_run_and_apply: Scan, then apply only if matches were found, all
+            within a single open of the file (default: False)
         
     Returns:
         Dict containing:
             - status: "success"
             - file: Path to file
-            - action: "dry_run" or "replace"
+            - action: "dry_run", "replace" or "dry_run_and_apply"
             - find/replace: Search parameters
             - scope: Target scope information
             - total_matches/replacements_made: Count
             - locations: List of affected locations
+            - preview_locations: Scan results (dry_run_and_apply only)
             - presentation_version_before: State hash before (if not dry_run)
             - presentation_version_after: State hash after (if not dry_run)
             - tool_version: Version of this tool
@@ -181,34 +471,41 @@ def replace_text(
         >>> print(result["total_matches"])
         15
     """
-    # Validate file extension
-    valid_extensions = {'.pptx', '.pptm', '.potx'}
-    if filepath.suffix.lower() not in valid_extensions:
-        raise ValueError(
-            f"Invalid PowerPoint file format: {filepath.suffix}. "
-            f"Supported formats: {', '.join(valid_extensions)}"
-        )
-    
-    # Validate file exists
-    if not filepath.exists():
-        raise FileNotFoundError(f"File not found: {filepath}")
+    _validate_target(filepath, slide_index, shape_index)
     
     # Validate find text
     if not find:
         raise ValueError("Find text cannot be empty")
     
     # Validate parameters
-    if shape_index is not None and slide_index is None:
-        raise ValueError(
-            "If --shape is specified, --slide must also be specified. "
-            "Shape indices are slide-specific."
-        )
+    if dry_run and dry_run_and_apply:
+        raise ValueError("--dry-run and --dry-run-and-apply are mutually exclusive")
     
-    action = "dry_run" if dry_run else "replace"
+    if dry_run_and_apply:
+        action = "dry_run_and_apply"
+    else:
+        action = "dry_run" if dry_run else "replace"
     total_count = 0
     locations: List[Dict[str, Any]] = []
+    preview_locations: Optional[List[Dict[str, Any]]] = None
     version_before = None
     version_after = None
+    # Compiled once and shared by the scan and replace passes. Case-insensitive
+    # scans fold case inside the regex engine rather than lowercasing a copy
+    # of every shape's text
+    if match_case and not whole_words:
+        matcher = None
+    else:
+        matcher = _compile_matcher(find, match_case, whole_words)
+    
+    # Plain case-insensitive ASCII searches can skip the regex engine entirely
+    if not match_case and not whole_words and find.isascii():
+        ascii_needle = find.lower().encode('ascii')
+    else:
+        ascii_needle = None
+    prefilter_needle = _prefilter_needle(find, match_case)
+    
+    from core.powerpoint_agent_core import PowerPointAgent
     
     with PowerPointAgent(filepath) as agent:
         # Open with appropriate locking
@@ -216,94 +513,63 @@ def replace_text(
         
         # Capture version BEFORE (only for actual replacements)
         if not dry_run:
-            info_before = agent.get_presentation_info()
-            version_before = info_before.get("presentation_version")
+            version_before = agent.get_presentation_version()
         
         slide_count = agent.get_slide_count()
         
         # Include performance note in response for large presentations
         large_presentation = slide_count > 50
         
-        # Determine target slides
-        target_slides: List[tuple] = []
+        target_slides = _resolve_target_slides(agent, slide_index)
+        target_shape = None
+        if shape_index is not None:
+            target_shape = _resolve_target_shape(target_slides[0][1], slide_index, shape_index)
         
-        if slide_index is not None:
-            # Single slide scope
-            if not 0 <= slide_index < slide_count:
-                raise SlideNotFoundError(
-                    f"Slide index {slide_index} out of range (0-{slide_count - 1})",
-                    details={
-                        "requested_index": slide_index,
-                        "available_slides": slide_count
-                    }
+        # Scan pass (dry-run, or preview before applying)
+        if dry_run or dry_run_and_apply:
+            # Shared by the scan workers; a racing duplicate only recounts
+            count_memo: Dict[str, int] = {}
+            
+            def scan(target: tuple) -> List[Dict[str, Any]]:
+                s_idx, slide = target
+                return _scan_slide(
+                    slide, s_idx, find, shape_index, matcher, ascii_needle,
+                    target_shape, count_memo, prefilter_needle, match_case
                 )
-            # NOTE: Direct prs access required for shape-level text manipulation
-            target_slides = [(slide_index, agent.prs.slides[slide_index])]
-        else:
-            # Global scope
-            target_slides = [(i, slide) for i, slide in enumerate(agent.prs.slides)]
-        
-        # Process each target slide
-        for s_idx, slide in target_slides:
-            # Determine target shapes
-            target_shapes: List[tuple] = []
             
-            if shape_index is not None:
-                # Single shape scope
-                if not 0 <= shape_index < len(slide.shapes):
-                    raise ValueError(
-                        f"Shape index {shape_index} out of range (0-{len(slide.shapes) - 1}) on slide {s_idx}"
-                    )
-                target_shapes = [(shape_index, slide.shapes[shape_index])]
+            # Slides are read-only during the scan; map() keeps slide order
+            if len(target_slides) >= PARALLEL_SCAN_MIN_SLIDES:
+                with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                    per_slide = list(executor.map(scan, target_slides))
             else:
-                # All shapes on slide
-                target_shapes = [(i, shape) for i, shape in enumerate(slide.shapes)]
+                per_slide = [scan(target) for target in target_slides]
             
-            # Process each target shape
-            for sh_idx, shape in target_shapes:
-                if not hasattr(shape, 'text_frame'):
-                    continue
-                
-                if dry_run:
-                    # Count occurrences without modifying
-                    text = shape.text_frame.text
-                    occurrences = 0
-                    
-                    if match_case:
-                        occurrences = text.count(find)
-                    else:
-                        occurrences = text.lower().count(find.lower())
-                    
-                    if occurrences > 0:
-                        total_count += occurrences
-                        preview = text[:100] + "..." if len(text) > 100 else text
-                        locations.append({
-                            "slide": s_idx,
-                            "shape": sh_idx,
-                            "occurrences": occurrences,
-                            "preview": preview
-                        })
-                else:
-                    # Perform actual replacement
-                    replacements = perform_replacement_on_shape(
-                        shape, find, replace, match_case
-                    )
-                    
-                    if replacements > 0:
-                        total_count += replacements
-                        locations.append({
-                            "slide": s_idx,
-                            "shape": sh_idx,
-                            "replacements": replacements
-                        })
+            scan_locations = [loc for slide_locs in per_slide for loc in slide_locs]
+            
+            if dry_run:
+                locations = scan_locations
+                total_count = sum(loc["occurrences"] for loc in scan_locations)
+            else:
+                preview_locations = scan_locations
         
-        # Save changes (only for actual replacements)
-        if not dry_run:
+        # Replace pass; the combined mode reuses the already-parsed presentation
+        # and skips the write entirely when the scan found nothing
+        if not dry_run and (not dry_run_and_apply or preview_locations):
+            for s_idx, slide in target_slides:
+                locations.extend(
+                    _replace_in_slide(
+                        slide, s_idx, find, replace, match_case, whole_words,
+                        shape_index, matcher, target_shape, prefilter_needle
+                    )
+                )
+            total_count = sum(loc["replacements"] for loc in locations)
+            
             agent.save()
             
             # Capture version AFTER
-            info_after = agent.get_presentation_info()
-            version_after = info_after.get("presentation_version")
+            version_after = agent.get_presentation_version()
+        elif not dry_run:
+            version_after = version_before
     
     # Build result
     result: Dict[str, Any] = {
@@ -313,6 +579,7 @@ def replace_text(
         "find": find,
         "replace": replace,
         "match_case": match_case,
+        "whole_words": whole_words,
         "scope": {
             "slide": slide_index if slide_index is not None else "all",
             "shape": shape_index if shape_index is not None else "all"
@@ -325,6 +592,9 @@ def replace_text(
     if dry_run:
         result["total_matches"] = total_count
     else:
+        if dry_run_and_apply:
+            result["total_matches"] = sum(loc["occurrences"] for loc in preview_locations)
+            result["preview_locations"] = preview_locations
         result["replacements_made"] = total_count
         result["presentation_version_before"] = version_before
         result["presentation_version_after"] = version_after
@@ -336,6 +606,330 @@ def replace_text(
     return result
 
 
+def _compile_bulk_matcher(
+    pairs: List[Dict[str, Any]],
+    match_case: bool,
+    whole_words: bool
+) -> Pattern:
+    """
+    Compile every find string of a replacements manifest into one pattern.
+    
+    Each pair becomes a named group ``p<N>`` (N = position in ``pairs``)
+    carrying its own case/whole-word options, so one scan of the text
+    finds all needles. Longer find strings are tried first, so overlapping
+    needles prefer the longest match at a position.
+    """
+    alternatives = []
+    order = sorted(range(len(pairs)), key=lambda i: len(pairs[i]["find"]), reverse=True)
+    
+    for i in order:
+        pair = pairs[i]
+        pair_case = pair.get("match_case", match_case)
+        source = _compile_matcher(
+            pair["find"], True, pair.get("whole_words", whole_words)
+        ).pattern
+        if not pair_case:
+            source = f"(?i:{source})"
+        alternatives.append(f"(?P<p{i}>{source})")
+    
+    return re.compile("|".join(alternatives))
+
+
+def _compile_bulk_prefilter(
+    pairs: List[Dict[str, Any]],
+    match_case: bool
+) -> Callable[[str], bool]:
+    """
+    Build a literal test that rejects texts containing none of the find strings.
+    
+    A case-insensitive alternation of many needles is slow to reject a
+    non-matching text, so each text is folded once and the needles are
+    checked with ``str.__contains__`` first (see _prefilter_needle;
+    whole-word needles still contain their literal). Non-ASCII
+    case-insensitive needles have no exact literal test and are checked
+    with one IGNORECASE regex instead. The dry-run and replace passes
+    share this test.
+    """
+    exact = []
+    folded = []
+    unfoldable = []
+    for pair in pairs:
+        pair_case = pair.get("match_case", match_case)
+        needle = _prefilter_needle(pair["find"], pair_case)
+        if pair_case:
+            exact.append(needle)
+        elif needle is not None:
+            folded.append(needle)
+        else:
+            unfoldable.append(re.escape(pair["find"]))
+    
+    unfoldable_search = (
+        re.compile("|".join(unfoldable), re.IGNORECASE).search if unfoldable else None
+    )
+    
+    def may_match(text: str) -> bool:
+        if any(needle in text for needle in exact):
+            return True
+        if unfoldable_search is not None and unfoldable_search(text):
+            return True
+        if folded:
+            text = text.translate(_PREFILTER_FOLD).casefold()
+            return any(needle in text for needle in folded)
+        return False
+    
+    return may_match
+
+
+def _validate_replacement_pairs(pairs: Any) -> List[Dict[str, Any]]:
+    """
+    Validate a --replacements-file manifest.
+    
+    Pairs may be objects ({"find", "replace", ...}) or two-element
+    [find, replace] arrays; arrays are normalized to objects.
+    
+    Returns:
+        List of pair dicts
+        
+    Raises:
+        ValueError: If the manifest or any pair is malformed
+    """
+    if not isinstance(pairs, list) or not pairs:
+        raise ValueError("Replacements file must be a non-empty JSON array of pairs")
+    
+    normalized: List[Dict[str, Any]] = []
+    for pair_idx, pair in enumerate(pairs):
+        if isinstance(pair, list) and len(pair) == 2:
+            pair = {"find": pair[0], "replace": pair[1]}
+        if not isinstance(pair, dict):
+            raise ValueError(
+                f"Replacement pair {pair_idx} must be a JSON object or a [find, replace] array"
+            )
+        if not isinstance(pair.get("find"), str) or not pair["find"]:
+            raise ValueError(f"Replacement pair {pair_idx} needs a non-empty 'find' string")
+        if not isinstance(pair.get("replace"), str):
+            raise ValueError(f"Replacement pair {pair_idx} needs a 'replace' string")
+        for flag in ("match_case", "whole_words"):
+            if flag in pair and not isinstance(pair[flag], bool):
+                raise ValueError(f"Replacement pair {pair_idx}: '{flag}' must be true or false")
+        normalized.append(pair)
+    
+    return normalized
+
+
+def perform_bulk_replacement_on_shape(shape, matcher: Pattern, replacer) -> int:
+    """
+    Apply a bulk matcher to a single shape.
+    
+    Uses the same two strategies as perform_replacement_on_shape: run-level
+    replacement first, then a shape-level fallback for text split across runs.
+    
+    Args:
+        shape: PowerPoint shape object with text_frame
+        matcher: Pattern from _compile_bulk_matcher
+        replacer: Match callback returning the replacement text
+        
+    Returns:
+        Number of occurrences replaced
+    """
+    from core.powerpoint_agent_core import replace_in_run_texts
+    
+    if not getattr(shape, 'has_text_frame', False):
+        return 0
+    
+    # Strategy 1: Replace in runs (preserves formatting)
+    count, _ = replace_in_run_texts(shape._element, "", replacer, matcher)
+    if count > 0:
+        return count
+    
+    # Strategy 2: Shape-level replacement (if runs didn't catch it due to splitting)
+    try:
+        new_text, count = matcher.subn(replacer, shape.text)
+        if count > 0:
+            shape.text = new_text
+    except Exception:
+        count = 0  # Continue without shape-level replacement
+    
+    return count
+
+
+def replace_text_bulk(
+    filepath: Path,
+    pairs: List[Dict[str, Any]],
+    slide_index: Optional[int] = None,
+    shape_index: Optional[int] = None,
+    match_case: bool = False,
+    whole_words: bool = False,
+    dry_run: bool = False
+) -> Dict[str, Any]:
+    """
+    Apply many find/replace pairs in a single pass over the presentation.
+    
+    All find strings are combined into one compiled pattern, so each text
+    is scanned once regardless of the number of pairs, and the file is
+    opened and saved once.
+    
+    Args:
+        filepath: Path to PowerPoint file
+        pairs: List of {"find", "replace"} dicts with optional per-pair
+            "match_case"/"whole_words" overrides, or [find, replace] arrays
+        slide_index: Optional slide index to limit scope
+        shape_index: Optional shape index (requires slide_index)
+        match_case: Default case-sensitivity for pairs (default: False)
+        whole_words: Default whole-word matching for pairs (default: False)
+        dry_run: Preview without modifying (default: False)
+        
+    Returns:
+        Dict containing per-pair occurrence counts, affected locations and,
+        for actual replacements, presentation versions before/after
+        
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        SlideNotFoundError: If slide index is out of range
+        ValueError: If the pairs or parameters are invalid
+    """
+    _validate_target(filepath, slide_index, shape_index)
+    pairs = _validate_replacement_pairs(pairs)
+    
+    matcher = _compile_bulk_matcher(pairs, match_case, whole_words)
+    may_match = _compile_bulk_prefilter(pairs, match_case)
+    counts = [0] * len(pairs)
+    
+    def replacer(match) -> str:
+        pair_idx = int(match.lastgroup[1:])
+        counts[pair_idx] += 1
+        return pairs[pair_idx]["replace"]
+    
+    locations: List[Dict[str, Any]] = []
+    version_before = None
+    version_after = None
+    
+    from core.powerpoint_agent_core import PowerPointAgent
+    
+    with PowerPointAgent(filepath) as agent:
+        agent.open(filepath, acquire_lock=not dry_run)
+        
+        if not dry_run:
+            version_before = agent.get_presentation_version()
+        
+        target_slides = _resolve_target_slides(agent, slide_index)
+        target_shape = None
+        if shape_index is not None:
+            target_shape = _resolve_target_shape(target_slides[0][1], slide_index, shape_index)
+        
+        for s_idx, slide in target_slides:
+            shapes = slide.shapes
+            for sh_idx, shape_elm, text in _iter_candidate_texts(slide, shape_index, target_shape):
+                if not may_match(text):
+                    continue
+                
+                if dry_run:
+                    occurrences = 0
+                    for match in matcher.finditer(text):
+                        counts[int(match.lastgroup[1:])] += 1
+                        occurrences += 1
+                elif matcher.search(text):
+                    occurrences = perform_bulk_replacement_on_shape(
+                        shapes._shape_factory(shape_elm), matcher, replacer
+                    )
+                else:
+                    occurrences = 0
+                
+                if occurrences > 0:
+                    locations.append({
+                        "slide": s_idx,
+                        "shape": sh_idx,
+                        "occurrences": occurrences
+                    })
+        
+        if not dry_run:
+            agent.save()
+            version_after = agent.get_presentation_version()
+    
+    result: Dict[str, Any] = {
+        "status": "success",
+        "file": str(filepath.resolve()),
+        "action": "dry_run" if dry_run else "replace",
+        "mode": "bulk",
+        "match_case": match_case,
+        "whole_words": whole_words,
+        "scope": {
+            "slide": slide_index if slide_index is not None else "all",
+            "shape": shape_index if shape_index is not None else "all"
+        },
+        "pairs": [
+            {
+                "find": pair["find"],
+                "replace": pair["replace"],
+                "match_case": pair.get("match_case", match_case),
+                "whole_words": pair.get("whole_words", whole_words),
+                "occurrences": counts[pair_idx]
+            }
+            for pair_idx, pair in enumerate(pairs)
+        ],
+        "locations": locations,
+        "tool_version": __version__
+    }
+    
+    if dry_run:
+        result["total_matches"] = sum(counts)
+    else:
+        result["replacements_made"] = sum(counts)
+        result["presentation_version_before"] = version_before
+        result["presentation_version_after"] = version_after
+    
+    return result
+
+
+def _error_response(error: Exception) -> Dict[str, Any]:
+    """
+    Build the JSON error payload for an exception raised in main().
+    
+    Core exception types are only checked when the core library has been
+    imported; anything raised before that cannot be a core error.
+    """
+    core = sys.modules.get("core.powerpoint_agent_core")
+    
+    if isinstance(error, FileNotFoundError):
+        return {
+            "status": "error",
+            "error": str(error),
+            "error_type": "FileNotFoundError",
+            "suggestion": "Verify the file path exists and is accessible"
+        }
+    
+    if core is not None and isinstance(error, core.SlideNotFoundError):
+        return {
+            "status": "error",
+            "error": str(error),
+            "error_type": "SlideNotFoundError",
+            "details": getattr(error, 'details', {}),
+            "suggestion": "Use ppt_get_info.py to check available slide indices"
+        }
+    
+    if isinstance(error, ValueError):
+        return {
+            "status": "error",
+            "error": str(error),
+            "error_type": "ValueError",
+            "suggestion": "Check file format and parameter values"
+        }
+    
+    if core is not None and isinstance(error, core.PowerPointAgentError):
+        return {
+            "status": "error",
+            "error": str(error),
+            "error_type": type(error).__name__,
+            "details": getattr(error, 'details', {})
+        }
+    
+    return {
+        "status": "error",
+        "error": str(error),
+        "error_type": type(error).__name__,
+        "tool_version": __version__
+    }
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Find and replace text in PowerPoint",
@@ -381,6 +975,38 @@ Examples:
     --replace "REST API" \\
     --match-case \\
     --json
+  
+  # Whole-word replacement (skips "Cartography" when finding "Art")
+  uv run tools/ppt_replace_text.py \\
+    --file presentation.pptx \\
+    --find "Art" \\
+    --replace "Design" \\
+    --whole-words \\
+    --json
+  
+  # Preview and apply in one pass (file is parsed once, untouched if no matches)
+  uv run tools/ppt_replace_text.py \\
+    --file presentation.pptx \\
+    --find "2023" \\
+    --replace "2024" \\
+    --dry-run-and-apply \\
+    --json
+  
+  # Bulk rebrand: many pairs, one parse and one scan per text
+  uv run tools/ppt_replace_text.py \\
+    --file presentation.pptx \\
+    --replacements-file pairs.json \\
+    --json
+
+Replacements File Format (--replacements-file):
+  [
+    {"find": "Acme Corp", "replace": "Globex"},
+    {"find": "ACME", "replace": "GLOBEX", "match_case": true},
+    {"find": "Art", "replace": "Design", "whole_words": true},
+    ["Q3 2023", "Q3 2024"]
+  ]
+  Plain [find, replace] arrays are accepted too. --pairs is an alias.
+  match_case/whole_words default to the --match-case/--whole-words flags.
 
 Scope Options:
   Global (default):     All slides, all shapes
@@ -442,13 +1068,17 @@ Output Format (replace):
     )
     parser.add_argument(
         '--find', 
-        required=True, 
-        help='Text to find'
+        help='Text to find (required unless --replacements-file is used)'
     )
     parser.add_argument(
         '--replace', 
-        required=True, 
-        help='Replacement text'
+        help='Replacement text (required unless --replacements-file is used)'
+    )
+    parser.add_argument(
+        '--replacements-file', '--pairs', 
+        dest='replacements_file', 
+        type=Path, 
+        help='JSON array of {"find", "replace"} pairs to apply in a single pass'
     )
     parser.add_argument(
         '--slide', 
@@ -465,11 +1095,21 @@ Output Format (replace):
         action='store_true', 
         help='Case-sensitive matching'
     )
+    parser.add_argument(
+        '--whole-words', 
+        action='store_true', 
+        help='Only match whole words (not substrings of longer words)'
+    )
     parser.add_argument(
         '--dry-run', 
         action='store_true', 
         help='Preview changes without modifying (RECOMMENDED first step)'
     )
+    parser.add_argument(
+        '--dry-run-and-apply', 
+        action='store_true', 
+        help='Report matches, then apply them in the same run (single file parse)'
+    )
     parser.add_argument(
         '--json', 
         action='store_true', 
@@ -479,7 +1119,46 @@ Output Format (replace):
     
     args = parser.parse_args()
     
+    # --- HYGIENE BLOCK START ---
+    # CRITICAL: Redirect stderr to /dev/null to prevent library noise from corrupting JSON output.
+    # Applied after argument parsing so argparse usage errors still reach the terminal.
+    # fd 2 itself is redirected so C-level output (lxml, zlib) is silenced too;
+    # PPT_DEBUG=1 keeps stderr.
+    if not os.environ.get('PPT_DEBUG'):
+        _devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(_devnull, 2)
+        os.close(_devnull)
+    # --- HYGIENE BLOCK END ---
+    
     try:
+        if args.replacements_file:
+            if args.find is not None or args.replace is not None:
+                raise ValueError("--replacements-file cannot be combined with --find/--replace")
+            if args.dry_run_and_apply:
+                raise ValueError("--dry-run-and-apply is not supported with --replacements-file")
+            if not args.replacements_file.exists():
+                raise FileNotFoundError(f"Replacements file not found: {args.replacements_file}")
+            try:
+                with open(args.replacements_file, 'r', encoding='utf-8') as f:
+                    pairs = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON in --replacements-file: {e}")
+            
+            result = replace_text_bulk(
+                filepath=args.file,
+                pairs=pairs,
+                slide_index=args.slide,
+                shape_index=args.shape,
+                match_case=args.match_case,
+                whole_words=args.whole_words,
+                dry_run=args.dry_run
+            )
+            _write_json(result)
+            sys.exit(0)
+        
+        if args.find is None or args.replace is None:
+            raise ValueError("--find and --replace are required unless --replacements-file is used")
+        
         result = replace_text(
             filepath=args.file,
             find=args.find,
@@ -487,61 +1166,16 @@ Output Format (replace):
             slide_index=args.slide,
             shape_index=args.shape,
             match_case=args.match_case,
-            dry_run=args.dry_run
+            dry_run=args.dry_run,
+            whole_words=args.whole_words,
+            dry_run_and_apply=args.dry_run_and_apply
         )
         
-        sys.stdout.write(json.dumps(result, indent=2) + "\n")
+        _write_json(result)
         sys.exit(0)
         
-    except FileNotFoundError as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": "FileNotFoundError",
-            "suggestion": "Verify the file path exists and is accessible"
-        }
-        sys.stdout.write(json.dumps(error_result, indent=2) + "\n")
-        sys.exit(1)
-        
-    except SlideNotFoundError as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": "SlideNotFoundError",
-            "details": getattr(e, 'details', {}),
-            "suggestion": "Use ppt_get_info.py to check available slide indices"
-        }
-        sys.stdout.write(json.dumps(error_result, indent=2) + "\n")
-        sys.exit(1)
-        
-    except ValueError as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": "ValueError",
-            "suggestion": "Check file format and parameter values"
-        }
-        sys.stdout.write(json.dumps(error_result, indent=2) + "\n")
-        sys.exit(1)
-        
-    except PowerPointAgentError as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "details": getattr(e, 'details', {})
-        }
-        sys.stdout.write(json.dumps(error_result, indent=2) + "\n")
-        sys.exit(1)
-        
     except Exception as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "tool_version": __version__
-        }
-        sys.stdout.write(json.dumps(error_result, indent=2) + "\n")
+        _write_json(_error_response(e))
         sys.exit(1)
 
 
@@ -27,23 +27,30 @@ navigate large presentations efficiently.
 import sys
 import os
 
-# --- HYGIENE BLOCK START ---
-# CRITICAL: Redirect stderr to /dev/null to prevent library noise from corrupting JSON output
-sys.stderr = open(os.devnull, 'w')
-# --- HYGIENE BLOCK END ---
-
 import json
 import argparse
 import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Pattern
+from typing import Any, Callable, Dict, IO, Iterator, List, Optional, Pattern, Tuple
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.powerpoint_agent_core import (
     PowerPointAgent,
     PowerPointAgentError,
-    SlideNotFoundError
+    SlideNotFoundError,
+    iter_shape_texts,
+    iter_table_cell_texts
 )
 
 # ============================================================================
@@ -52,6 +59,46 @@ from core.powerpoint_agent_core import (
 
 __version__ = "3.1.1"
 
+# Decks at least this large are searched across a thread pool
+PARALLEL_SEARCH_MIN_SLIDES = 50
+
+# Presentations kept open between requests in --serve mode
+SERVE_CACHE_SIZE = 8
+
+SEARCH_SCOPES = ("all", "text", "notes", "tables")
+
+# Distinct (query, options) combinations whose compiled pattern and
+# lowercased needle are kept between calls in one process
+PATTERN_CACHE_SIZE = 128
+
+
+def _write_bytes(data: bytes) -> None:
+    """Write bytes straight to file descriptor 1, after anything buffered on sys.stdout."""
+    sys.stdout.flush()
+    view = memoryview(data)
+    while view:
+        view = view[os.write(1, view):]
+
+
+def _write_json(payload: Dict[str, Any]) -> None:
+    """Write an indented JSON payload to stdout, using orjson when it is installed."""
+    if HAS_ORJSON:
+        _write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    else:
+        # json.dump writes the encoder's chunks as they are produced instead
+        # of first building the whole document as one string
+        json.dump(payload, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+
+
+def _write_json_line(payload: Dict[str, Any]) -> None:
+    """Write one compact NDJSON record to stdout."""
+    if HAS_ORJSON:
+        _write_bytes(orjson.dumps(payload, option=orjson.OPT_APPEND_NEWLINE))
+    else:
+        _write_bytes((json.dumps(payload, separators=(",", ":")) + "\n").encode("utf-8"))
+
 
 # ============================================================================
 # TYPE DEFINITIONS
@@ -60,10 +107,15 @@ __version__ = "3.1.1"
 Match = Dict[str, Any]
 
 
+class InvalidPatternError(ValueError):
+    """Raised by compile_pattern for a --regex query that does not compile."""
+
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
 def compile_pattern(
     query: str,
     is_regex: bool = False,
@@ -72,6 +124,9 @@ def compile_pattern(
     """
     Compile search pattern from query string.
     
+    Results are memoized, so library callers and --serve repeating a query
+    skip re.escape and the re module's own cache lookup.
+    
     Args:
         query: Search query (plain text or regex)
         is_regex: If True, treat query as regular expression
@@ -81,7 +136,7 @@ def compile_pattern(
         Compiled regex pattern
         
     Raises:
-        ValueError: If regex is invalid
+        InvalidPatternError: If regex is invalid
     """
     flags = 0 if case_sensitive else re.IGNORECASE
     
@@ -89,12 +144,102 @@ def compile_pattern(
         try:
             return re.compile(query, flags)
         except re.error as e:
-            raise ValueError(f"Invalid regex pattern: {e}")
+            raise InvalidPatternError(f"Invalid regex pattern: {e}")
     else:
         escaped = re.escape(query)
         return re.compile(escaped, flags)
 
 
+# re.IGNORECASE equates dotted capital I and dotless i with ASCII "i", but
+# casefold() maps them elsewhere; with these two folded first, every character
+# an IGNORECASE pattern equates with an ASCII character casefolds to it
+_PREFILTER_FOLD = str.maketrans({"\u0130": "i", "\u0131": "i"})
+
+
+def _fold(text: str) -> str:
+    """Casefold text for the literal prefilters (see _PREFILTER_FOLD)."""
+    return text.translate(_PREFILTER_FOLD).casefold()
+
+
+def build_prefilter(
+    query: str,
+    is_regex: bool = False,
+    case_sensitive: bool = False
+) -> Optional[Callable[[str], bool]]:
+    """
+    Build a cheap literal containment test for plain-text queries.
+    
+    ``str.__contains__`` rejects non-matching text far faster than the regex
+    engine, so texts that fail it are skipped before ``finditer``. Returns
+    None for regex queries, which have no literal needle, and for
+    case-insensitive non-ASCII queries, where IGNORECASE and casefold()
+    disagree on more characters than _PREFILTER_FOLD covers.
+    
+    Args:
+        query: Search query
+        is_regex: If True, no prefilter is built
+        case_sensitive: If True, compare exactly; otherwise via _fold()
+        
+    Returns:
+        Callable returning False only when the text cannot match, or None
+    """
+    if is_regex:
+        return None
+    
+    if case_sensitive:
+        return lambda text: query in text
+    
+    if not query.isascii():
+        return None
+    
+    needle = query.casefold()
+    return lambda text: needle in _fold(text)
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def build_ascii_needle(
+    query: str,
+    is_regex: bool = False,
+    case_sensitive: bool = False
+) -> Optional[str]:
+    """
+    Lowercase a plain case-insensitive ASCII query once for _iter_spans.
+    
+    For ASCII-only text, lowercasing the text and using ``str.find`` gives
+    the same spans as the IGNORECASE pattern at a fraction of the cost.
+    Returns None when the regex must be used.
+    """
+    if is_regex or case_sensitive or not query or not query.isascii():
+        return None
+    return query.lower()
+
+
+def _iter_spans(
+    text: str,
+    pattern: Pattern,
+    prefilter: Optional[Callable[[str], bool]] = None,
+    ascii_needle: Optional[str] = None
+) -> Iterator[Tuple[str, int, int]]:
+    """
+    Yield (match_text, start, end) for every non-overlapping match in text.
+    """
+    if ascii_needle is not None and text.isascii():
+        # ASCII lower() keeps offsets and folds exactly like IGNORECASE here
+        lowered = text.lower()
+        size = len(ascii_needle)
+        start = lowered.find(ascii_needle)
+        while start != -1:
+            yield text[start:start + size], start, start + size
+            start = lowered.find(ascii_needle, start + size)
+        return
+    
+    if prefilter is not None and not prefilter(text):
+        return
+    
+    for match in pattern.finditer(text):
+        yield match.group(), match.start(), match.end()
+
+
 def extract_context(text: str, match_start: int, match_end: int, context_chars: int = 50) -> str:
     """
     Extract text context around a match.
@@ -108,117 +253,149 @@ def extract_context(text: str, match_start: int, match_end: int, context_chars:
     Returns:
         Context string with match highlighted
     """
-    start = max(0, match_start - context_chars)
-    end = min(len(text), match_end + context_chars)
-    
-    prefix = "..." if start > 0 else ""
-    suffix = "..." if end < len(text) else ""
+    start = match_start - context_chars
+    end = match_end + context_chars
     
-    context = text[start:end]
+    # Slicing clamps the end itself; only a negative start needs clamping
+    return (
+        ("..." if start > 0 else "")
+        + text[start if start > 0 else 0:end]
+        + ("..." if end < len(text) else "")
+    )
+
+
+# Shape-type label per MSO_SHAPE_TYPE member, built on first use
+_SHAPE_TYPE_LABELS: Dict[Any, str] = {}
+
+
+def _shape_type_label(shape_type) -> str:
+    """Return the match-record label for a shape type, formatting each member once."""
+    label = _SHAPE_TYPE_LABELS.get(shape_type)
+    if label is None:
+        label = _SHAPE_TYPE_LABELS[shape_type] = str(shape_type).replace('MSO_SHAPE_TYPE.', '')
+    return label
+
+
+def describe_shape(shape, shape_index: int) -> Tuple[str, str]:
+    """
+    Get the name and type labels reported for a shape in match records.
     
-    return f"{prefix}{context}{suffix}"
+    Args:
+        shape: Shape object
+        shape_index: Shape index (used for the fallback name)
+        
+    Returns:
+        Tuple of (shape_name, shape_type)
+    """
+    shape_name = getattr(shape, 'name', f'Shape_{shape_index}')
+    shape_type = _shape_type_label(shape.shape_type)
+    return shape_name, shape_type
 
 
-def search_text_frame(
-    text_frame,
+def _search_text(
+    full_text: str,
     pattern: Pattern,
     slide_index: int,
     shape_index: int,
-    shape_name: str,
-    shape_type: str,
-    location: str = "text"
+    labels: Callable[[], Tuple[str, str]],
+    location: str,
+    prefilter: Optional[Callable[[str], bool]],
+    include_context: bool = True,
+    text_memo: Optional[Dict[str, List[Tuple[str, int, int, Optional[str]]]]] = None,
+    ascii_needle: Optional[str] = None
 ) -> List[Match]:
     """
-    Search within a text frame.
+    Search one shape's text; ``labels`` supplies (name, type) on the first match.
     
-    Args:
-        text_frame: TextFrame object
-        pattern: Compiled search pattern
-        slide_index: Parent slide index
-        shape_index: Parent shape index
-        shape_name: Shape name
-        shape_type: Shape type string
-        location: Location identifier ("text" or "notes")
-        
-    Returns:
-        List of match dictionaries
+    With ``text_memo`` (one dict per search), the (match_text, start, end,
+    context) hits of each distinct text are computed once, so boilerplate
+    repeated across slides (footers, template placeholders) is matched once.
     """
     matches = []
     
     try:
-        full_text = ""
-        for paragraph in text_frame.paragraphs:
-            for run in paragraph.runs:
-                full_text += run.text
-            full_text += "\n"
-        
         full_text = full_text.strip()
         
         if not full_text:
             return matches
         
-        for match in pattern.finditer(full_text):
-            matches.append({
+        hits = text_memo.get(full_text) if text_memo is not None else None
+        if hits is None:
+            hits = [
+                (match_text, start, end,
+                 extract_context(full_text, start, end) if include_context else None)
+                for match_text, start, end in _iter_spans(
+                    full_text, pattern, prefilter, ascii_needle
+                )
+            ]
+            if text_memo is not None:
+                text_memo[full_text] = hits
+        
+        if not hits:
+            return matches
+        
+        shape_name, shape_type = labels()
+        for match_text, start, end, context in hits:
+            entry = {
                 "slide_index": slide_index,
                 "shape_index": shape_index,
                 "shape_name": shape_name,
                 "shape_type": shape_type,
                 "location": location,
-                "match_text": match.group(),
-                "match_start": match.start(),
-                "match_end": match.end(),
-                "context": extract_context(full_text, match.start(), match.end())
-            })
+                "match_text": match_text,
+                "match_start": start,
+                "match_end": end
+            }
+            if include_context:
+                entry["context"] = context
+            matches.append(entry)
     except Exception:
         pass
     
     return matches
 
 
-def search_table(
-    table,
+def _search_cells(
+    cell_texts: Iterator[Tuple[int, int, str]],
     pattern: Pattern,
     slide_index: int,
     shape_index: int,
-    shape_name: str
+    name: Callable[[], str],
+    prefilter: Optional[Callable[[str], bool]],
+    include_context: bool = True,
+    ascii_needle: Optional[str] = None
 ) -> List[Match]:
     """
-    Search within a table.
-    
-    Args:
-        table: Table object
-        pattern: Compiled search pattern
-        slide_index: Parent slide index
-        shape_index: Parent shape index
-        shape_name: Shape name
-        
-    Returns:
-        List of match dictionaries
+    Search (row, col, text) table cells; ``name`` supplies the shape name on the first match.
     """
     matches = []
+    shape_name = None
     
     try:
-        for row_idx, row in enumerate(table.rows):
-            for col_idx, cell in enumerate(row.cells):
-                cell_text = cell.text_frame.text if cell.text_frame else ""
-                
-                if not cell_text:
-                    continue
-                
-                for match in pattern.finditer(cell_text):
-                    matches.append({
-                        "slide_index": slide_index,
-                        "shape_index": shape_index,
-                        "shape_name": shape_name,
-                        "shape_type": "TABLE_CELL",
-                        "location": "table",
-                        "cell_row": row_idx,
-                        "cell_col": col_idx,
-                        "match_text": match.group(),
-                        "match_start": match.start(),
-                        "match_end": match.end(),
-                        "context": extract_context(cell_text, match.start(), match.end())
-                    })
+        for row_idx, col_idx, cell_text in cell_texts:
+            if not cell_text:
+                continue
+            
+            for match_text, start, end in _iter_spans(
+                cell_text, pattern, prefilter, ascii_needle
+            ):
+                if shape_name is None:
+                    shape_name = name()
+                entry = {
+                    "slide_index": slide_index,
+                    "shape_index": shape_index,
+                    "shape_name": shape_name,
+                    "shape_type": "TABLE_CELL",
+                    "location": "table",
+                    "cell_row": row_idx,
+                    "cell_col": col_idx,
+                    "match_text": match_text,
+                    "match_start": start,
+                    "match_end": end
+                }
+                if include_context:
+                    entry["context"] = extract_context(cell_text, start, end)
+                matches.append(entry)
     except Exception:
         pass
     
@@ -229,13 +406,216 @@ def search_table(
 # MAIN LOGIC
 # ============================================================================
 
+def _iter_slide_matches(
+    slide,
+    slide_idx: int,
+    pattern: Pattern,
+    prefilter: Optional[Callable[[str], bool]],
+    scope: str,
+    include_context: bool = True,
+    text_memo: Optional[Dict[str, List[Tuple[str, int, int, Optional[str]]]]] = None,
+    ascii_needle: Optional[str] = None
+) -> Iterator[Match]:
+    """
+    Yield the matches on one slide, in shape order, then speaker notes.
+    
+    Args:
+        slide: Slide object
+        slide_idx: Slide index
+        pattern: Compiled search pattern
+        prefilter: Optional literal test from build_prefilter
+        scope: Search scope - "text", "notes", "tables", or "all"
+        include_context: Add a "context" snippet to each match
+        text_memo: Optional per-search cache of hits by shape text (see _search_text)
+        ascii_needle: Optional lowered query from build_ascii_needle
+        
+    Yields:
+        Match dictionaries
+    """
+    # Regex queries have no literal prefilter; one search over the whole
+    # slide's text rejects slides without a hit in a single C call
+    if (
+        scope == "all" and prefilter is None
+        and _is_position_independent(pattern.pattern)
+        and pattern.search(_slide_text(slide)) is None
+    ):
+        return
+    
+    if scope in ["text", "all"]:
+        # Text and table cells are read straight from the slide XML; shape
+        # proxies are only built to label matches
+        shapes = slide.shapes
+        include_tables = scope in ["tables", "all"]
+        for shape_idx, shape_elm, text in iter_shape_texts(slide, include_non_text=include_tables):
+            if text is not None:
+                yield from _search_text(
+                    text,
+                    pattern,
+                    slide_idx,
+                    shape_idx,
+                    lambda: describe_shape(shapes._shape_factory(shape_elm), shape_idx),
+                    "text",
+                    prefilter,
+                    include_context,
+                    text_memo,
+                    ascii_needle
+                )
+                continue
+            
+            # Non-table shapes have no cells, so no proxy is needed to tell
+            yield from _search_cells(
+                iter_table_cell_texts(shape_elm),
+                pattern,
+                slide_idx,
+                shape_idx,
+                lambda: getattr(
+                    shapes._shape_factory(shape_elm), 'name', f'Shape_{shape_idx}'
+                ),
+                prefilter,
+                include_context,
+                ascii_needle
+            )
+    
+    # slide.notes_slide would create an empty notes part on notes-less slides
+    if scope in ["notes", "all"] and slide.has_notes_slide:
+        notes_matches: List[Match] = []
+        try:
+            notes_slide = slide.notes_slide
+            if notes_slide and notes_slide.notes_text_frame:
+                notes_text = notes_slide.notes_text_frame.text
+                if notes_text:
+                    for match_text, start, end in _iter_spans(
+                        notes_text, pattern, prefilter, ascii_needle
+                    ):
+                        entry = {
+                            "slide_index": slide_idx,
+                            "shape_index": None,
+                            "shape_name": "Speaker Notes",
+                            "shape_type": "NOTES",
+                            "location": "notes",
+                            "match_text": match_text,
+                            "match_start": start,
+                            "match_end": end
+                        }
+                        if include_context:
+                            entry["context"] = extract_context(notes_text, start, end)
+                        notes_matches.append(entry)
+        except Exception:
+            pass
+        yield from notes_matches
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def _is_position_independent(source: str) -> bool:
+    r"""
+    Return True if a regex matches a text the same way wherever the text sits.
+    
+    Without anchors (^, $, \A, \Z, \z), lookarounds, atomic groups or
+    possessive quantifiers, whether a substring matches depends on that
+    substring alone (\b and \B treat the "\x00" separator of _slide_text
+    like a string edge). Any match in one shape's text is then also found in
+    the joined slide text, so a miss there proves the slide has no match.
+    Atomic groups and possessive quantifiers cannot backtrack out of text
+    that follows the shape's, so they are excluded too. The scan is
+    conservative: a "^" or "$" anywhere other than a class-negating "[^"
+    counts as an anchor, and a "+" after any "*", "+", "?" or "}" counts as
+    possessive.
+    """
+    i = 0
+    prev = ""
+    while i < len(source):
+        ch = source[i]
+        if ch == "\\":
+            if source[i + 1:i + 2] in ("A", "Z", "z"):
+                return False
+            i += 2
+            prev = ""
+            continue
+        if ch == "$" or (ch == "^" and prev != "["):
+            return False
+        if ch == "(" and source.startswith(("(?=", "(?!", "(?<=", "(?<!", "(?>"), i):
+            return False
+        if ch == "+" and prev in ("*", "+", "?", "}"):
+            return False
+        prev = ch
+        i += 1
+    return True
+
+
+def _slide_text(slide) -> str:
+    """
+    Join all searchable text on a slide (shapes, table cells, notes) into one string.
+    """
+    parts: List[str] = []
+    for _, shape_elm, text in iter_shape_texts(slide, include_non_text=True):
+        if text is not None:
+            parts.append(text)
+        else:
+            parts.extend(cell_text for _, _, cell_text in iter_table_cell_texts(shape_elm))
+    
+    if slide.has_notes_slide:
+        notes_frame = slide.notes_slide.notes_text_frame
+        if notes_frame is not None:
+            parts.append(notes_frame.text)
+    
+    return "\x00".join(parts)
+
+
+def _slide_folded_text(slide) -> str:
+    """
+    Fold all searchable text on a slide (shapes, table cells, notes) into one string.
+    """
+    return _fold(_slide_text(slide))
+
+
+def _select_slides(agent, slide_index: Optional[int]) -> List[Tuple[int, Any]]:
+    """
+    Resolve the (index, slide) pairs to search.
+    
+    Raises:
+        SlideNotFoundError: If specified slide index is invalid
+    """
+    # Materialize once; Slides.__getitem__ rebuilds the sldId list per call
+    # NOTE: Direct prs access required for shape-level text search
+    all_slides = list(agent.prs.slides)
+    total_slides = len(all_slides)
+    
+    if slide_index is not None:
+        if not 0 <= slide_index < total_slides:
+            raise SlideNotFoundError(
+                f"Slide index {slide_index} out of range (0-{total_slides - 1})",
+                details={
+                    "requested_index": slide_index,
+                    "available_slides": total_slides
+                }
+            )
+        return [(slide_index, all_slides[slide_index])]
+    
+    return list(enumerate(all_slides))
+
+
+def _check_max_matches(max_matches: Optional[int]) -> None:
+    """
+    Validate a max_matches limit.
+    
+    Raises:
+        ValueError: If the limit is not a positive integer
+    """
+    if max_matches is not None and (
+        isinstance(max_matches, bool) or not isinstance(max_matches, int) or max_matches < 1
+    ):
+        raise ValueError(f"max_matches must be a positive integer, got {max_matches!r}")
+
+
 def search_content(
     filepath: Path,
     query: str,
     is_regex: bool = False,
     case_sensitive: bool = False,
     scope: str = "all",
-    slide_index: Optional[int] = None
+    slide_index: Optional[int] = None,
+    include_context: bool = True,
+    max_matches: Optional[int] = None
 ) -> Dict[str, Any]:
     """
     Search for content across a PowerPoint presentation.
@@ -247,6 +627,8 @@ def search_content(
         case_sensitive: If True, perform case-sensitive search
         scope: Search scope - "text", "notes", "tables", or "all"
         slide_index: Optional specific slide to search (None = all slides)
+        include_context: Add a "context" snippet to each match
+        max_matches: Stop searching once this many matches are found (None = all)
         
     Returns:
         Dict with search results
@@ -259,87 +641,101 @@ def search_content(
     if not filepath.exists():
         raise FileNotFoundError(f"File not found: {filepath}")
     
+    with PowerPointAgent(filepath) as agent:
+        agent.open(filepath, acquire_lock=False)
+        
+        return _search_presentation(
+            agent, agent.get_presentation_version(), filepath, query,
+            is_regex, case_sensitive, scope, slide_index, include_context,
+            max_matches=max_matches
+        )
+
+
+def _search_presentation(
+    agent,
+    presentation_version: str,
+    filepath: Path,
+    query: str,
+    is_regex: bool,
+    case_sensitive: bool,
+    scope: str,
+    slide_index: Optional[int],
+    include_context: bool,
+    slide_texts: Optional[Dict[int, str]] = None,
+    max_matches: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Run a search against an already opened presentation.
+    
+    Shared by search_content and --serve, which keeps presentations open
+    between requests. --serve also passes ``slide_texts``, a per-file memo
+    of each slide's folded text (see _slide_folded_text): once a slide
+    is in it, plain-text queries skip the slide with one substring test
+    when it cannot contain the query.
+    
+    With ``max_matches`` the slides are searched one by one and the scan
+    stops at the max_matches-th match, so later shapes and slides are
+    never read.
+    """
+    _check_max_matches(max_matches)
     pattern = compile_pattern(query, is_regex, case_sensitive)
+    prefilter = build_prefilter(query, is_regex, case_sensitive)
+    ascii_needle = build_ascii_needle(query, is_regex, case_sensitive)
     
     all_matches: List[Match] = []
     slides_searched: List[int] = []
     slides_with_matches: List[int] = []
     
-    with PowerPointAgent(filepath) as agent:
-        agent.open(filepath, acquire_lock=False)
-        
-        presentation_version = agent.get_presentation_version()
-        total_slides = agent.get_slide_count()
-        
-        if slide_index is not None:
-            if not 0 <= slide_index < total_slides:
-                raise SlideNotFoundError(
-                    f"Slide index {slide_index} out of range (0-{total_slides - 1})",
-                    details={
-                        "requested_index": slide_index,
-                        "available_slides": total_slides
-                    }
-                )
-            slides_to_search = [slide_index]
-        else:
-            slides_to_search = list(range(total_slides))
+    target_slides = _select_slides(agent, slide_index)
+    
+    # Shared across slides (and worker threads); a racing duplicate only
+    # recomputes the same hits
+    text_memo: Dict[str, List[Tuple[str, int, int, Optional[str]]]] = {}
+    
+    # _fold() works per character, so a slide whose folded text lacks the
+    # folded query cannot contain it exactly, nor (for ASCII queries, see
+    # _PREFILTER_FOLD) case-insensitively
+    slide_needle = None
+    if slide_texts is not None and not is_regex and query and (case_sensitive or query.isascii()):
+        slide_needle = _fold(query)
+    
+    def search_slide(target: Tuple[int, Any], limit: Optional[int] = None) -> List[Match]:
+        slide_idx, slide = target
+        if slide_needle is not None:
+            folded = slide_texts.get(slide_idx)
+            if folded is None:
+                folded = slide_texts[slide_idx] = _slide_folded_text(slide)
+            if slide_needle not in folded:
+                return []
+        return list(islice(_iter_slide_matches(
+            slide, slide_idx, pattern, prefilter, scope, include_context, text_memo,
+            ascii_needle
+        ), limit))
+    
+    if max_matches is not None:
+        per_slide = []
+        remaining = max_matches
+        for target in target_slides:
+            slide_matches = search_slide(target, remaining)
+            per_slide.append(slide_matches)
+            remaining -= len(slide_matches)
+            if remaining == 0:
+                break
+        # zip() below then stops at the last slide searched
+        target_slides = target_slides[:len(per_slide)]
+    # Slides are only read; map() keeps slide order
+    elif len(target_slides) >= PARALLEL_SEARCH_MIN_SLIDES:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            per_slide = list(executor.map(search_slide, target_slides))
+    else:
+        per_slide = [search_slide(target) for target in target_slides]
+    
+    for (slide_idx, _), slide_matches in zip(target_slides, per_slide):
+        slides_searched.append(slide_idx)
         
-        for slide_idx in slides_to_search:
-            slides_searched.append(slide_idx)
-            slide = agent.prs.slides[slide_idx]
-            slide_matches: List[Match] = []
-            
-            if scope in ["text", "all"]:
-                for shape_idx, shape in enumerate(slide.shapes):
-                    shape_name = getattr(shape, 'name', f'Shape_{shape_idx}')
-                    shape_type = str(shape.shape_type).replace('MSO_SHAPE_TYPE.', '')
-                    
-                    if hasattr(shape, 'text_frame') and shape.has_text_frame:
-                        matches = search_text_frame(
-                            shape.text_frame,
-                            pattern,
-                            slide_idx,
-                            shape_idx,
-                            shape_name,
-                            shape_type,
-                            "text"
-                        )
-                        slide_matches.extend(matches)
-                    
-                    if scope in ["tables", "all"] and hasattr(shape, 'table') and shape.has_table:
-                        matches = search_table(
-                            shape.table,
-                            pattern,
-                            slide_idx,
-                            shape_idx,
-                            shape_name
-                        )
-                        slide_matches.extend(matches)
-            
-            if scope in ["notes", "all"]:
-                try:
-                    notes_slide = slide.notes_slide
-                    if notes_slide and notes_slide.notes_text_frame:
-                        notes_text = notes_slide.notes_text_frame.text
-                        if notes_text:
-                            for match in pattern.finditer(notes_text):
-                                slide_matches.append({
-                                    "slide_index": slide_idx,
-                                    "shape_index": None,
-                                    "shape_name": "Speaker Notes",
-                                    "shape_type": "NOTES",
-                                    "location": "notes",
-                                    "match_text": match.group(),
-                                    "match_start": match.start(),
-                                    "match_end": match.end(),
-                                    "context": extract_context(notes_text, match.start(), match.end())
-                                })
-                except Exception:
-                    pass
-            
-            if slide_matches:
-                slides_with_matches.append(slide_idx)
-                all_matches.extend(slide_matches)
+        if slide_matches:
+            slides_with_matches.append(slide_idx)
+            all_matches.extend(slide_matches)
     
     return {
         "status": "success",
@@ -348,9 +744,11 @@ def search_content(
         "options": {
             "regex": is_regex,
             "case_sensitive": case_sensitive,
-            "scope": scope
+            "scope": scope,
+            "max_matches": max_matches
         },
         "total_matches": len(all_matches),
+        "max_matches_reached": max_matches is not None and len(all_matches) >= max_matches,
         "slides_searched": len(slides_searched),
         "slides_with_matches": slides_with_matches,
         "matches": all_matches,
@@ -359,6 +757,291 @@ def search_content(
     }
 
 
+def search_content_stream(
+    filepath: Path,
+    query: str,
+    is_regex: bool = False,
+    case_sensitive: bool = False,
+    scope: str = "all",
+    slide_index: Optional[int] = None,
+    emit: Optional[Callable[[Dict[str, Any]], None]] = None,
+    include_context: bool = True,
+    max_matches: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Search like search_content, emitting NDJSON records instead of collecting them.
+    
+    Emits a {"header": {...}} record, then one record per match as soon as
+    it is found, then a {"summary": {...}} record. Only the current shape's
+    matches are held in memory.
+    
+    Args:
+        filepath: Path to the PowerPoint file
+        query: Search query (text or regex pattern)
+        is_regex: If True, treat query as regular expression
+        case_sensitive: If True, perform case-sensitive search
+        scope: Search scope - "text", "notes", "tables", or "all"
+        slide_index: Optional specific slide to search (None = all slides)
+        emit: Record writer (default: one compact JSON line on stdout)
+        include_context: Add a "context" snippet to each match
+        max_matches: Stop searching once this many matches are found (None = all)
+        
+    Returns:
+        The summary record
+        
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        SlideNotFoundError: If specified slide index is invalid
+        ValueError: If regex pattern is invalid
+    """
+    if not filepath.exists():
+        raise FileNotFoundError(f"File not found: {filepath}")
+    
+    emit = emit or _write_json_line
+    _check_max_matches(max_matches)
+    pattern = compile_pattern(query, is_regex, case_sensitive)
+    prefilter = build_prefilter(query, is_regex, case_sensitive)
+    ascii_needle = build_ascii_needle(query, is_regex, case_sensitive)
+    
+    total_matches = 0
+    slides_searched = 0
+    slides_with_matches: List[int] = []
+    
+    with PowerPointAgent(filepath) as agent:
+        agent.open(filepath, acquire_lock=False)
+        
+        target_slides = _select_slides(agent, slide_index)
+        
+        emit({"header": {
+            "status": "success",
+            "file": str(filepath.resolve()),
+            "query": query,
+            "options": {
+                "regex": is_regex,
+                "case_sensitive": case_sensitive,
+                "scope": scope,
+                "max_matches": max_matches
+            },
+            "presentation_version": agent.get_presentation_version(),
+            "tool_version": __version__
+        }})
+        
+        for slide_idx, slide in target_slides:
+            if max_matches is not None and total_matches >= max_matches:
+                break
+            slides_searched += 1
+            slide_total = 0
+            limit = None if max_matches is None else max_matches - total_matches
+            # No text memo here: it would hold every distinct text until the end
+            for match in islice(_iter_slide_matches(
+                slide, slide_idx, pattern, prefilter, scope, include_context,
+                ascii_needle=ascii_needle
+            ), limit):
+                emit(match)
+                slide_total += 1
+            
+            if slide_total:
+                slides_with_matches.append(slide_idx)
+                total_matches += slide_total
+    
+    summary = {
+        "total_matches": total_matches,
+        "max_matches_reached": max_matches is not None and total_matches >= max_matches,
+        "slides_searched": slides_searched,
+        "slides_with_matches": slides_with_matches
+    }
+    emit({"summary": summary})
+    
+    return summary
+
+
+# ============================================================================
+# SERVE MODE
+# ============================================================================
+
+class _PresentationCache:
+    """
+    Read-only presentations kept open across --serve requests.
+    
+    Entries are keyed by resolved path and reused while the file's mtime and
+    size are unchanged, so repeated queries skip re-parsing the package and
+    re-hashing its version. Each entry also carries the file's slide-text
+    memo for _search_presentation. The least recently used entry is closed
+    once more than ``max_size`` files are open.
+    """
+    
+    def __init__(self, max_size: int = SERVE_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries: "OrderedDict[Path, Tuple[Tuple[int, int], Any, str, Dict[int, str]]]" = (
+            OrderedDict()
+        )
+    
+    def get(self, filepath: Path) -> Tuple[Any, str, Dict[int, str]]:
+        """
+        Return (agent, presentation_version, slide_texts) for a file, opening it if needed.
+        
+        Raises:
+            FileNotFoundError: If file doesn't exist
+        """
+        try:
+            stat = filepath.stat()
+        except FileNotFoundError:
+            self._discard(filepath)
+            raise FileNotFoundError(f"File not found: {filepath}")
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        
+        entry = self._entries.get(filepath)
+        if entry is not None and entry[0] == stamp:
+            self._entries.move_to_end(filepath)
+            return entry[1], entry[2], entry[3]
+        
+        self._discard(filepath)
+        agent = PowerPointAgent(filepath)
+        agent.open(filepath, acquire_lock=False)
+        version = agent.get_presentation_version()
+        slide_texts: Dict[int, str] = {}
+        self._entries[filepath] = (stamp, agent, version, slide_texts)
+        
+        while len(self._entries) > self.max_size:
+            _, (_, evicted, _, _) = self._entries.popitem(last=False)
+            evicted.close()
+        
+        return agent, version, slide_texts
+    
+    def _discard(self, filepath: Path) -> None:
+        entry = self._entries.pop(filepath, None)
+        if entry is not None:
+            entry[1].close()
+    
+    def close(self) -> None:
+        """Close every cached presentation."""
+        while self._entries:
+            _, (_, agent, _, _) = self._entries.popitem()
+            agent.close()
+
+
+# (exception class, fixed error_type or None for the class name, suggestion,
+# include details); checked in order, so subclasses come before their bases
+_ERROR_KINDS = (
+    (FileNotFoundError, "FileNotFoundError",
+     "Verify the file path exists and is accessible", False),
+    (SlideNotFoundError, "SlideNotFoundError",
+     "Use ppt_get_info.py to check available slide indices", True),
+    (InvalidPatternError, "ValueError", "Check regex syntax if using --regex flag", False),
+    (ValueError, "ValueError",
+     "Check the request fields and argument values (file, query, scope, slide, max_matches)",
+     False),
+    (PowerPointAgentError, None, "Check file integrity and format", True),
+)
+
+
+def _error_response(e: Exception) -> Dict[str, Any]:
+    """Build the JSON error payload for an exception."""
+    for error_class, error_type, suggestion, with_details in _ERROR_KINDS:
+        if isinstance(e, error_class):
+            break
+    else:
+        error_type, suggestion, with_details = (
+            None, "Check logs for detailed error information", False
+        )
+    
+    response = {
+        "status": "error",
+        "error": str(e),
+        "error_type": error_type or type(e).__name__
+    }
+    if with_details:
+        response["details"] = getattr(e, 'details', {})
+    response["suggestion"] = suggestion
+    response["tool_version"] = __version__
+    return response
+
+
+def _handle_serve_request(request: Any, cache: _PresentationCache) -> Dict[str, Any]:
+    """
+    Answer one --serve request.
+    
+    Raises:
+        ValueError: If the request is malformed
+    """
+    if not isinstance(request, dict):
+        raise ValueError("Request must be a JSON object")
+    if not request.get("file") or not isinstance(request.get("query"), str):
+        raise ValueError("Request needs 'file' and 'query'")
+    
+    scope = request.get("scope", "all")
+    if scope not in SEARCH_SCOPES:
+        raise ValueError(f"Invalid scope {scope!r}; expected one of {', '.join(SEARCH_SCOPES)}")
+    
+    slide = request.get("slide")
+    if slide is not None and (isinstance(slide, bool) or not isinstance(slide, int)):
+        raise ValueError(f"slide must be an integer, got {slide!r}")
+    _check_max_matches(request.get("max_matches"))
+    
+    filepath = Path(request["file"]).resolve()
+    agent, version, slide_texts = cache.get(filepath)
+    
+    return _search_presentation(
+        agent, version, filepath, request["query"],
+        bool(request.get("regex", False)),
+        bool(request.get("case_sensitive", False)),
+        scope,
+        slide,
+        bool(request.get("context", True)),
+        slide_texts,
+        request.get("max_matches")
+    )
+
+
+def serve(
+    requests: IO[str],
+    emit: Optional[Callable[[Dict[str, Any]], None]] = None,
+    cache_size: int = SERVE_CACHE_SIZE
+) -> int:
+    """
+    Answer NDJSON search requests until EOF, keeping presentations open.
+    
+    Each input line is a JSON object with "file" and "query", plus the
+    optional keys "regex", "case_sensitive", "scope", "slide", "context"
+    (false = --no-context), "max_matches" and "id". Each line gets exactly one response
+    line: the search_content result, or an error payload. An "id" is
+    echoed back so responses can be matched to requests.
+    
+    Args:
+        requests: Text stream of NDJSON requests (normally stdin)
+        emit: Record writer (default: one compact JSON line on stdout)
+        cache_size: Maximum number of presentations kept open
+        
+    Returns:
+        Number of requests answered
+    """
+    emit = emit or _write_json_line
+    cache = _PresentationCache(cache_size)
+    answered = 0
+    
+    try:
+        for line in requests:
+            if not line.strip():
+                continue
+            
+            request = None
+            try:
+                request = json.loads(line)
+                response = _handle_serve_request(request, cache)
+            except Exception as e:
+                response = _error_response(e)
+            
+            if isinstance(request, dict) and "id" in request:
+                response = {"id": request["id"], **response}
+            
+            emit(response)
+            answered += 1
+    finally:
+        cache.close()
+    
+    return answered
+
+
 # ============================================================================
 # CLI INTERFACE
 # ============================================================================
@@ -389,6 +1072,22 @@ Examples:
   uv run tools/ppt_search_content.py \\
     --file presentation.pptx --query "Summary" --slide 5 --json
 
+  # Only check whether the query occurs at all (stops at the first hit)
+  uv run tools/ppt_search_content.py \\
+    --file presentation.pptx --query "Confidential" --max-matches 1 --json
+
+  # Positions only, without context snippets
+  uv run tools/ppt_search_content.py \\
+    --file presentation.pptx --query "Acme" --no-context --json
+
+  # Answer many queries from one process (no per-call import/parse cost)
+  printf '%s\\n' '{"file": "deck.pptx", "query": "Acme"}' \\
+    | uv run tools/ppt_search_content.py --serve
+
+  # Stream matches as NDJSON for very large result sets
+  uv run tools/ppt_search_content.py \\
+    --file presentation.pptx --query "Acme" --stream | jq -c .
+
 Scope Options:
   all    - Search everywhere (default)
   text   - Search only in text shapes
@@ -423,21 +1122,28 @@ Output Format:
     "presentation_version": "a1b2c3...",
     "tool_version": "3.1.1"
   }
+
+Serve Mode (--serve, one JSON request per stdin line, one response line each):
+  {"id": 1, "file": "deck.pptx", "query": "Acme", "scope": "text", "context": false}
+  Presentations stay open between requests and are re-read when the file changes.
+
+Stream Format (--stream, one JSON object per line):
+  {"header": {"status": "success", "file": ..., "query": ..., ...}}
+  {"slide_index": 0, "shape_index": 3, "match_text": "Revenue", ...}
+  {"summary": {"total_matches": 5, "slides_searched": 12, ...}}
         """
     )
     
     parser.add_argument(
         '--file',
-        required=True,
         type=Path,
-        help='PowerPoint file to search'
+        help='PowerPoint file to search (required unless --serve)'
     )
     
     parser.add_argument(
         '--query',
-        required=True,
         type=str,
-        help='Search query (text or regex pattern)'
+        help='Search query (text or regex pattern; required unless --serve)'
     )
     
     parser.add_argument(
@@ -466,6 +1172,33 @@ Output Format:
         help='Limit search to specific slide index'
     )
     
+    parser.add_argument(
+        '--no-context',
+        dest='include_context',
+        action='store_false',
+        help='Omit the "context" snippet from each match'
+    )
+    
+    parser.add_argument(
+        '--max-matches',
+        type=int,
+        default=None,
+        metavar='N',
+        help='Stop after the first N matches (e.g. 1 to check whether the query occurs at all)'
+    )
+    
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Write NDJSON (header, one line per match, summary) as matches are found'
+    )
+    
+    parser.add_argument(
+        '--serve',
+        action='store_true',
+        help='Answer NDJSON requests from stdin, keeping presentations open between them'
+    )
+    
     parser.add_argument(
         '--json',
         action='store_true',
@@ -475,80 +1208,54 @@ Output Format:
     
     args = parser.parse_args()
     
+    if not args.serve and (args.file is None or args.query is None):
+        parser.error("--file and --query are required unless --serve is used")
+    
+    # --- HYGIENE BLOCK START ---
+    # CRITICAL: Redirect stderr to /dev/null to prevent library noise from corrupting JSON output.
+    # Applied after argument parsing so argparse usage errors still reach the terminal.
+    # fd 2 itself is redirected so C-level output (lxml, zlib) is silenced too;
+    # PPT_DEBUG=1 keeps stderr.
+    if not os.environ.get('PPT_DEBUG'):
+        _devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(_devnull, 2)
+        os.close(_devnull)
+    # --- HYGIENE BLOCK END ---
+    
+    if args.serve:
+        serve(sys.stdin)
+        sys.exit(0)
+    
     try:
+        if args.stream:
+            search_content_stream(
+                filepath=args.file.resolve(),
+                query=args.query,
+                is_regex=args.regex,
+                case_sensitive=args.case_sensitive,
+                scope=args.scope,
+                slide_index=args.slide,
+                include_context=args.include_context,
+                max_matches=args.max_matches
+            )
+            sys.exit(0)
+        
         result = search_content(
             filepath=args.file.resolve(),
             query=args.query,
             is_regex=args.regex,
             case_sensitive=args.case_sensitive,
             scope=args.scope,
-            slide_index=args.slide
+            slide_index=args.slide,
+            include_context=args.include_context,
+            max_matches=args.max_matches
         )
         
-        sys.stdout.write(json.dumps(result, indent=2) + "\n")
-        sys.stdout.flush()
+        _write_json(result)
         sys.exit(0)
         
-    except FileNotFoundError as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": "FileNotFoundError",
-            "suggestion": "Verify the file path exists and is accessible",
-            "tool_version": __version__
-        }
-        sys.stdout.write(json.dumps(error_result, indent=2) + "\n")
-        sys.stdout.flush()
-        sys.exit(1)
-        
-    except SlideNotFoundError as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": "SlideNotFoundError",
-            "details": getattr(e, 'details', {}),
-            "suggestion": "Use ppt_get_info.py to check available slide indices",
-            "tool_version": __version__
-        }
-        sys.stdout.write(json.dumps(error_result, indent=2) + "\n")
-        sys.stdout.flush()
-        sys.exit(1)
-        
-    except ValueError as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": "ValueError",
-            "suggestion": "Check regex syntax if using --regex flag",
-            "tool_version": __version__
-        }
-        sys.stdout.write(json.dumps(error_result, indent=2) + "\n")
-        sys.stdout.flush()
-        sys.exit(1)
-        
-    except PowerPointAgentError as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "details": getattr(e, 'details', {}),
-            "suggestion": "Check file integrity and format",
-            "tool_version": __version__
-        }
-        sys.stdout.write(json.dumps(error_result, indent=2) + "\n")
-        sys.stdout.flush()
-        sys.exit(1)
-        
     except Exception as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "suggestion": "Check logs for detailed error information",
-            "tool_version": __version__
-        }
-        sys.stdout.write(json.dumps(error_result, indent=2) + "\n")
-        sys.stdout.flush()
+        _write_json(_error_response(e))
         sys.exit(1)
 
 
@@ -20,13 +20,23 @@ Exit Codes:
 import sys
 import os
 
-sys.stderr = open(os.devnull, 'w')
-
 import json
 import argparse
+from copy import deepcopy
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
+from lxml import etree
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.powerpoint_agent_core import (
@@ -39,6 +49,95 @@ from core.powerpoint_agent_core import (
 __version__ = "3.1.0"
 
 
+def _write_json(payload: Dict[str, Any]) -> None:
+    """Write an indented JSON payload to stdout, using orjson when it is installed."""
+    if HAS_ORJSON:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        sys.stdout.flush()
+        view = memoryview(data)
+        while view:
+            view = view[os.write(1, view):]
+    else:
+        # json.dump writes the encoder's chunks as they are produced
+        json.dump(payload, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+
+
+def _build_background(color: Optional[str] = None):
+    """
+    Build a ``<p:bg>`` element to copy into each target slide.
+    
+    A solid fill when ``color`` is given, otherwise a stretched picture
+    fill whose ``r:embed`` is set per slide.
+    """
+    if color:
+        fill = f'<a:solidFill><a:srgbClr val="{str(ColorHelper.from_hex(color))}"/></a:solidFill>'
+    else:
+        fill = (
+            '<a:blipFill dpi="0" rotWithShape="1"><a:blip r:embed=""/><a:srcRect/>'
+            '<a:stretch><a:fillRect/></a:stretch></a:blipFill>'
+        )
+    return parse_xml(
+        f'<p:bg {nsdecls("p", "a", "r")}><p:bgPr>{fill}<a:effectLst/></p:bgPr></p:bg>'
+    )
+
+
+def _canonical(element) -> bytes:
+    """Serialize an element independently of the namespace declarations in scope."""
+    return etree.tostring(element, method="c14n", exclusive=True)
+
+
+def _background_matches(slide, existing, background, image_part=None) -> bool:
+    """Return True if a slide's current ``<p:bg>`` already is ``background``."""
+    if image_part is not None:
+        blip = existing.find('.//' + qn('a:blip'))
+        rId = blip.get(qn('r:embed')) if blip is not None else None
+        if not rId or rId not in slide.part.rels or slide.part.related_part(rId) is not image_part:
+            return False
+        background = deepcopy(background)
+        background.find('.//' + qn('a:blip')).set(qn('r:embed'), rId)
+    return _canonical(existing) == _canonical(background)
+
+
+def _rel_in_use(slide, rId: str) -> bool:
+    """Return True if any r:embed, r:link or r:id in the slide XML names ``rId``."""
+    return bool(slide._element.xpath(
+        f'.//@r:embed[.="{rId}"] | .//@r:link[.="{rId}"] | .//@r:id[.="{rId}"]'
+    ))
+
+
+def _apply_background(slide, background, image_part=None) -> bool:
+    """
+    Replace a slide's ``<p:bg>`` with a copy of ``background``.
+    
+    Returns False, leaving the slide untouched, when it already has
+    exactly this background.
+    """
+    c_sld = slide._element.cSld
+    existing = c_sld.find(qn('p:bg'))
+    if existing is not None:
+        if _background_matches(slide, existing, background, image_part):
+            return False
+        c_sld.remove(existing)
+        # Release the previous background picture once nothing left on the
+        # slide refers to it; a picture shape reusing the same image part
+        # shares its rId through r:embed, which drop_rel does not count
+        for old_blip in existing.iter(qn('a:blip')):
+            old_rId = old_blip.get(qn('r:embed'))
+            if old_rId and not _rel_in_use(slide, old_rId):
+                slide.part.drop_rel(old_rId)
+    
+    bg = deepcopy(background)
+    if image_part is not None:
+        blip = bg.find('.//' + qn('a:blip'))
+        blip.set(qn('r:embed'), slide.part.relate_to(image_part, RT.IMAGE))
+    
+    # <p:bg> must be the first child of <p:cSld>
+    c_sld.insert(0, bg)
+    return True
+
+
 def set_background(
     filepath: Path,
     color: Optional[str] = None,
@@ -67,6 +166,8 @@ def set_background(
             - presentation_version_before: Version hash before changes
             - presentation_version_after: Version hash after changes
             - tool_version: Tool version string
+            - no_changes: True if every target slide already had this background
+              (the file is not rewritten)
             - deprecated_default_used: True if defaulted to all slides (backward compat)
             
     Raises:
@@ -109,6 +210,9 @@ def set_background(
     if image and not image.exists():
         raise FileNotFoundError(f"Image file not found: {image}")
     
+    # Resolved once for both the image part and the result
+    image_str = str(image.resolve()) if image else None
+    
     deprecated_default_used = False
     
     with PowerPointAgent(filepath) as agent:
@@ -134,20 +238,24 @@ def set_background(
             target_indices = list(range(slide_count))
             deprecated_default_used = True
         
-        for idx in target_indices:
-            slide = agent.prs.slides[idx]
-            bg = slide.background
-            fill = bg.fill
-            
-            if color:
-                fill.solid()
-                fill.fore_color.rgb = ColorHelper.from_hex(color)
-            elif image:
-                fill.user_picture(str(image.resolve()))
+        # Build the fill once; for images, add the image part once and only
+        # relate it to each slide
+        background = _build_background(color)
+        image_part = None
+        if image:
+            image_part = agent.prs.part.package.get_or_add_image_part(image_str)
         
-        agent.save()
+        slides = list(agent.prs.slides)
+        dirty = False
+        for idx in target_indices:
+            if _apply_background(slides[idx], background, image_part):
+                dirty = True
         
-        version_after = agent.get_presentation_version()
+        if dirty:
+            agent.save()
+            version_after = agent.get_presentation_version()
+        else:
+            version_after = version_before
     
     result = {
         "status": "success",
@@ -155,12 +263,15 @@ def set_background(
         "slides_affected": len(target_indices),
         "slide_indices": target_indices,
         "type": "color" if color else "image",
-        "value": color if color else str(image.resolve()),
+        "value": color if color else image_str,
         "presentation_version_before": version_before,
         "presentation_version_after": version_after,
         "tool_version": __version__
     }
     
+    if not dirty:
+        result["no_changes"] = True
+    
     if deprecated_default_used:
         result["deprecated_default_used"] = True
         result["deprecation_warning"] = (
@@ -246,6 +357,17 @@ Notes:
     
     args = parser.parse_args()
     
+    # --- HYGIENE BLOCK START ---
+    # CRITICAL: Redirect stderr to /dev/null to prevent library noise from corrupting JSON output.
+    # Applied after argument parsing so argparse usage errors still reach the terminal.
+    # fd 2 itself is redirected so C-level output (lxml, zlib) is silenced too;
+    # PPT_DEBUG=1 keeps stderr.
+    if not os.environ.get('PPT_DEBUG'):
+        _devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(_devnull, 2)
+        os.close(_devnull)
+    # --- HYGIENE BLOCK END ---
+    
     try:
         result = set_background(
             filepath=args.file,
@@ -254,7 +376,7 @@ Notes:
             slide_index=args.slide_index,
             all_slides=args.all_slides
         )
-        print(json.dumps(result, indent=2))
+        _write_json(result)
         sys.exit(0)
         
     except FileNotFoundError as e:
@@ -264,7 +386,7 @@ Notes:
             "error_type": "FileNotFoundError",
             "suggestion": "Verify the file and image paths exist and are accessible."
         }
-        print(json.dumps(error_result, indent=2))
+        _write_json(error_result)
         sys.exit(1)
         
     except SlideNotFoundError as e:
@@ -275,7 +397,7 @@ Notes:
             "details": getattr(e, 'details', {}),
             "suggestion": "Use ppt_get_info.py to check available slide count."
         }
-        print(json.dumps(error_result, indent=2))
+        _write_json(error_result)
         sys.exit(1)
         
     except ValueError as e:
@@ -285,7 +407,7 @@ Notes:
             "error_type": "ValueError",
             "suggestion": "Check color format (#RRGGBB), ensure only one of --color or --image is used."
         }
-        print(json.dumps(error_result, indent=2))
+        _write_json(error_result)
         sys.exit(1)
         
     except PowerPointAgentError as e:
@@ -295,7 +417,7 @@ Notes:
             "error_type": "PowerPointAgentError",
             "suggestion": "Verify the file is not corrupted and has at least one slide."
         }
-        print(json.dumps(error_result, indent=2))
+        _write_json(error_result)
         sys.exit(1)
         
     except Exception as e:
@@ -305,7 +427,7 @@ Notes:
             "error_type": type(e).__name__,
             "tool_version": __version__
         }
-        print(json.dumps(error_result, indent=2))
+        _write_json(error_result)
         sys.exit(1)
 
 
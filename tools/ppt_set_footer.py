@@ -19,26 +19,256 @@ Exit Codes:
 import sys
 import os
 
-sys.stderr = open(os.devnull, 'w')
-
+import re
 import json
 import argparse
+from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Set
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from core.powerpoint_agent_core import PowerPointAgent
+from typing import Dict, Any, List, Optional, Tuple, IO, Callable
 
 try:
-    from pptx.enum.shapes import PP_PLACEHOLDER
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    class PP_PLACEHOLDER:
-        FOOTER = 15
-        SLIDE_NUMBER = 13
+    HAS_ORJSON = False
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# NOTE: core.powerpoint_agent_core (python-pptx, lxml, PIL) is imported inside
+# the functions that need it, so --help and input-validation errors stay fast.
 
 __version__ = "3.1.0"
 
+# Fallback text box geometry as (position, size); add_text_box resolves the
+# percentages once per box kind, later slides reuse its shape
+FOOTER_TEXT_BOX = ({"left": "5%", "top": "92%"}, {"width": "60%", "height": "5%"})
+FOOTER_NUMBER_BOX = ({"left": "92%", "top": "92%"}, {"width": "5%", "height": "5%"})
+
+# Line breaks and control characters need the escaping done by the .text setter
+_SETTER_ONLY_CHARS = re.compile(r"[\x00-\x08\x0a-\x1f]")
+
+
+@lru_cache(maxsize=1)
+def _footer_placeholder_xpath():
+    """Compile the XPath for footer placeholders (<p:ph type="ftr">) in a shape tree."""
+    from lxml import etree
+    from core.powerpoint_agent_core import XML_NAMESPACES
+    
+    return etree.XPath(
+        './p:cSld/p:spTree/p:sp[p:nvSpPr/p:nvPr/p:ph[@type="ftr"]]',
+        namespaces=XML_NAMESPACES
+    )
+
+
+def _footer_placeholders(slide_or_layout) -> List[Any]:
+    """
+    Return the footer placeholder shapes of a slide or slide layout.
+    
+    One compiled XPath query finds them, so only the footer placeholders
+    get shape proxies, rather than every placeholder on the slide or layout.
+    """
+    shapes = slide_or_layout.shapes
+    return [
+        shapes._shape_factory(sp)
+        for sp in _footer_placeholder_xpath()(slide_or_layout._element)
+    ]
+
+
+def _set_footer_text(shape, text: str) -> bool:
+    """
+    Replace a footer placeholder's text in place.
+    
+    The first plain run's <a:t> takes the new text and the other runs,
+    fields and paragraphs are dropped, so the first run keeps its
+    formatting. Field text (<a:fld>, e.g. a date) is never patched, since
+    PowerPoint recomputes it; a placeholder without plain runs gets one
+    minimal run instead. Text with line breaks or control characters still
+    goes through the .text setter.
+    
+    Returns False, leaving the placeholder untouched, if it already shows
+    exactly ``text``.
+    """
+    from pptx.oxml.ns import qn
+    
+    txBody = shape._element.txBody
+    if txBody is not None and shape.text_frame.text == text:
+        return False
+    if txBody is None or _SETTER_ONLY_CHARS.search(text):
+        shape.text = text
+        return True
+    
+    t = txBody.find(f"{qn('a:p')}/{qn('a:r')}/{qn('a:t')}")
+    if t is None:
+        p = txBody.find(qn('a:p'))
+        if p is None:
+            p = txBody.add_p()
+        run = p.add_r()
+        run.text = text
+    else:
+        t.text = text
+        run = t.getparent()
+        p = run.getparent()
+    for other_p in txBody.findall(qn('a:p')):
+        if other_p is not p:
+            txBody.remove(other_p)
+    for child in p.findall('*'):
+        if child is not run and child.tag in (qn('a:r'), qn('a:br'), qn('a:fld')):
+            p.remove(child)
+    return True
+
+
+def _add_footer_box(
+    agent,
+    slide_idx: int,
+    slide,
+    text: str,
+    position: Dict[str, str],
+    size: Dict[str, str],
+    template: Optional[Tuple[Any, str]] = None
+) -> Tuple[Any, str]:
+    """
+    Add one fallback footer text box to a slide.
+    
+    Without a ``template`` the box is built by agent.add_text_box, and its
+    <p:sp> and text are returned as the template for the remaining slides.
+    Those get a deep copy with a fresh shape id (and new text when it
+    differs, as for slide numbers), which skips the shape proxies and the
+    presentation hashes add_text_box computes on every call.
+    """
+    from pptx.oxml.ns import qn
+    
+    if template is None:
+        result = agent.add_text_box(
+            slide_index=slide_idx,
+            text=text,
+            position=position,
+            size=size,
+            font_size=10,
+            color="#595959"
+        )
+        return slide.shapes[result["shape_index"]]._element, text
+    
+    template_sp, template_text = template
+    sp = deepcopy(template_sp)
+    shape_id = slide.shapes._next_shape_id
+    c_nv_pr = sp.find('.//' + qn('p:cNvPr'))
+    c_nv_pr.set('id', str(shape_id))
+    c_nv_pr.set('name', f'TextBox {shape_id - 1}')
+    if text != template_text:
+        sp.find('.//' + qn('a:t')).text = text
+    slide.shapes._spTree.insert_element_before(sp, 'p:extLst')
+    return template
+
+
+def _write_json(payload: Dict[str, Any]) -> None:
+    """Write an indented JSON payload to stdout, using orjson when it is installed."""
+    if HAS_ORJSON:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        sys.stdout.flush()
+        view = memoryview(data)
+        while view:
+            view = view[os.write(1, view):]
+    else:
+        # json.dump writes the encoder's chunks as they are produced
+        json.dump(payload, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+
+
+def _write_json_line(payload: Dict[str, Any]) -> None:
+    """Write one compact NDJSON record to stdout."""
+    if HAS_ORJSON:
+        data = orjson.dumps(payload, option=orjson.OPT_APPEND_NEWLINE)
+    else:
+        data = (json.dumps(payload, separators=(",", ":")) + "\n").encode("utf-8")
+    sys.stdout.flush()
+    view = memoryview(data)
+    while view:
+        view = view[os.write(1, view):]
+
+
+def _apply_footer(
+    agent,
+    text: Optional[str],
+    show_number: bool
+) -> Tuple[Optional[str], int, Dict[str, Any]]:
+    """
+    Apply the Dual Strategy to an open presentation without saving it.
+    
+    Shared by set_footer and --serve, which keeps the presentation open
+    across edits.
+    
+    Returns:
+        (method_used, slides_updated, dirty_parts), where dirty_parts maps
+        the partname of every slide and layout actually changed to its
+        part, for agent.save_incremental
+    """
+    # Each strategy visits every slide once, so a count is all that is kept
+    slides_updated = 0
+    method_used = None
+    dirty_parts: Dict[str, Any] = {}
+    
+    # Strategy 1: Try footer placeholders on slide layouts
+    if text:
+        try:
+            for master in agent.prs.slide_masters:
+                for layout in master.slide_layouts:
+                    for shape in _footer_placeholders(layout):
+                        if _set_footer_text(shape, text):
+                            dirty_parts[layout.part.partname] = layout.part
+        except Exception:
+            pass
+    
+    # Try footer placeholders on slides; without text only their
+    # presence matters, so no shape proxies are built
+    for slide_idx, slide in enumerate(agent.prs.slides):
+        try:
+            if not text:
+                if _footer_placeholder_xpath()(slide._element):
+                    slides_updated += 1
+                continue
+            footers = _footer_placeholders(slide)
+            if footers:
+                for shape in footers:
+                    if _set_footer_text(shape, text):
+                        dirty_parts[slide.part.partname] = slide.part
+                slides_updated += 1
+        except Exception:
+            pass
+    
+    # Strategy 2: Fallback to text boxes if placeholders didn't work
+    if slides_updated == 0:
+        method_used = "text_box"
+        text_template = None
+        number_template = None
+        for slide_idx, slide in enumerate(agent.prs.slides):
+            slide_updated = False
+            try:
+                if text:
+                    text_template = _add_footer_box(
+                        agent, slide_idx, slide, text, *FOOTER_TEXT_BOX, text_template
+                    )
+                    slide_updated = True
+                    dirty_parts[slide.part.partname] = slide.part
+                if show_number:
+                    number_template = _add_footer_box(
+                        agent, slide_idx, slide, str(slide_idx + 1), *FOOTER_NUMBER_BOX,
+                        number_template
+                    )
+                    slide_updated = True
+                    dirty_parts[slide.part.partname] = slide.part
+            except Exception:
+                pass
+            if slide_updated:
+                slides_updated += 1
+        if slides_updated == 0:
+            method_used = None
+    else:
+        method_used = "placeholder"
+    
+    return method_used, slides_updated, dirty_parts
+
 
 def set_footer(
     filepath: Path,
@@ -66,87 +296,169 @@ def set_footer(
     if filepath.suffix.lower() != '.pptx':
         raise ValueError("Only .pptx files are supported")
     
-    slide_indices_updated: Set[int] = set()
-    method_used = None
+    from core.powerpoint_agent_core import PowerPointAgent
     
     with PowerPointAgent(filepath) as agent:
         agent.open(filepath)
         
         version_before = agent.get_presentation_version()
         
-        # Strategy 1: Try placeholders on slide masters
-        try:
-            for master in agent.prs.slide_masters:
-                for layout in master.slide_layouts:
-                    for shape in layout.placeholders:
-                        try:
-                            if shape.placeholder_format.type == PP_PLACEHOLDER.FOOTER:
-                                if text:
-                                    shape.text = text
-                        except Exception:
-                            pass
-        except Exception:
-            pass
-        
-        # Try placeholders on slides
-        for slide_idx, slide in enumerate(agent.prs.slides):
-            try:
-                for shape in slide.placeholders:
-                    try:
-                        if shape.placeholder_format.type == PP_PLACEHOLDER.FOOTER:
-                            if text:
-                                shape.text = text
-                            slide_indices_updated.add(slide_idx)
-                    except Exception:
-                        pass
-            except Exception:
-                pass
+        method_used, slides_updated, dirty_parts = _apply_footer(agent, text, show_number)
         
-        # Strategy 2: Fallback to text boxes if placeholders didn't work
-        if len(slide_indices_updated) == 0:
-            method_used = "text_box"
-            for slide_idx in range(len(agent.prs.slides)):
-                try:
-                    if text:
-                        agent.add_text_box(
-                            slide_index=slide_idx,
-                            text=text,
-                            position={"left": "5%", "top": "92%"},
-                            size={"width": "60%", "height": "5%"},
-                            font_size=10,
-                            color="#595959"
-                        )
-                        slide_indices_updated.add(slide_idx)
-                    if show_number:
-                        agent.add_text_box(
-                            slide_index=slide_idx,
-                            text=str(slide_idx + 1),
-                            position={"left": "92%", "top": "92%"},
-                            size={"width": "5%", "height": "5%"},
-                            font_size=10,
-                            color="#595959"
-                        )
-                        slide_indices_updated.add(slide_idx)
-                except Exception:
-                    pass
+        # Nothing to write when no slide was updated or every footer
+        # already had this text; otherwise only the changed parts are
+        # re-serialized
+        if dirty_parts:
+            agent.save_incremental(dirty_parts.values())
+            version_after = agent.get_presentation_version()
         else:
-            method_used = "placeholder"
-        
-        agent.save()
-        
-        version_after = agent.get_presentation_version()
+            version_after = version_before
     
-    return {
-        "status": "success" if len(slide_indices_updated) > 0 else "warning",
+    result = {
+        "status": "success" if slides_updated > 0 else "warning",
         "file": str(filepath.resolve()),
         "method_used": method_used,
-        "slides_updated": len(slide_indices_updated),
+        "slides_updated": slides_updated,
         "footer_text": text,
         "show_number": show_number,
         "presentation_version_before": version_before,
         "presentation_version_after": version_after,
         "tool_version": __version__
     }
+    
+    if not dirty_parts:
+        result["no_changes"] = True
+    
+    return result
+
+
+def serve(
+    filepath: Path,
+    requests: IO[str],
+    emit: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> int:
+    """
+    Apply NDJSON footer edits to one presentation kept open until EOF.
+    
+    Each input line is a JSON object with the optional keys "text",
+    "show_number" and "id", or {"cmd": "flush"}. Edits change the open
+    presentation only; a flush saves it when anything changed and reports
+    the new presentation_version. Edits still pending at EOF are saved as
+    if a final flush had been sent. Each line gets exactly one response
+    line, and an "id" is echoed back.
+    
+    Args:
+        filepath: Path to PowerPoint file (.pptx)
+        requests: Text stream of NDJSON requests (normally stdin)
+        emit: Record writer (default: one compact JSON line on stdout)
+        
+    Returns:
+        Number of requests answered
+        
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ValueError: If file format invalid
+    """
+    if not filepath.exists():
+        raise FileNotFoundError(f"File not found: {filepath}")
+    
+    if filepath.suffix.lower() != '.pptx':
+        raise ValueError("Only .pptx files are supported")
+    
+    from core.powerpoint_agent_core import PowerPointAgent
+    
+    emit = emit or _write_json_line
+    answered = 0
+    pending = 0
+    dirty_parts: Dict[str, Any] = {}
+    
+    # Edit results carry no version hashes, so the agent skips them too
+    with PowerPointAgent(filepath, track_versions=False) as agent:
+        agent.open(filepath)
+        
+        for line in requests:
+            if not line.strip():
+                continue
+            
+            request = None
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("Request must be a JSON object")
+                
+                if request.get("cmd") == "flush":
+                    if pending:
+                        agent.save_incremental(dirty_parts.values())
+                        dirty_parts.clear()
+                    response = {
+                        "status": "success",
+                        "cmd": "flush",
+                        "file": str(filepath.resolve()),
+                        "saved": pending > 0,
+                        "edits_saved": pending,
+                        "presentation_version": agent.get_presentation_version(),
+                        "tool_version": __version__
+                    }
+                    pending = 0
+                elif "cmd" in request:
+                    raise ValueError(f"Unknown cmd {request['cmd']!r}; expected 'flush'")
+                else:
+                    text = request.get("text")
+                    show_number = bool(request.get("show_number", False))
+                    method_used, slides_updated, changed = _apply_footer(agent, text, show_number)
+                    dirty_parts.update(changed)
+                    pending += bool(changed)
+                    response = {
+                        "status": "success" if slides_updated > 0 else "warning",
+                        "file": str(filepath.resolve()),
+                        "method_used": method_used,
+                        "slides_updated": slides_updated,
+                        "footer_text": text,
+                        "show_number": show_number,
+                        "pending_edits": pending,
+                        "tool_version": __version__
+                    }
+                    if not changed:
+                        response["no_changes"] = True
+            except Exception as e:
+                response = _error_response(e)
+            
+            if isinstance(request, dict) and "id" in request:
+                response = {"id": request["id"], **response}
+            
+            emit(response)
+            answered += 1
+        
+        if pending:
+            agent.save_incremental(dirty_parts.values())
+    
+    return answered
+
+
+def _error_response(error: Exception) -> Dict[str, Any]:
+    """Build the JSON error payload for an exception raised in main() or --serve."""
+    if isinstance(error, FileNotFoundError):
+        return {
+            "status": "error",
+            "error": str(error),
+            "error_type": "FileNotFoundError",
+            "suggestion": "Verify file path exists and is accessible."
+        }
+    
+    if isinstance(error, ValueError):
+        return {
+            "status": "error",
+            "error": str(error),
+            "error_type": "ValueError",
+            "suggestion": "Ensure file has .pptx extension and each --serve request is a JSON object."
+        }
+    
+    return {
+        "status": "error",
+        "error": str(error),
+        "error_type": type(error).__name__,
+        "tool_version": __version__
+    }
 
 
 def main():
@@ -164,9 +476,18 @@ Examples:
   # Both footer text and page numbers
   uv run tools/ppt_set_footer.py --file deck.pptx --text "Confidential" --show-number --json
 
+  # Several edits against one open presentation, saved once
+  printf '%s\\n' '{"text": "Draft"}' '{"text": "Final"}' '{"cmd": "flush"}' \\
+    | uv run tools/ppt_set_footer.py --file deck.pptx --serve
+
 Strategy:
   1. Tries to use slide placeholders first (preserves template formatting)
   2. Falls back to text boxes if placeholders not available
+
+Serve Mode (--serve, one JSON request per stdin line, one response line each):
+  {"id": 1, "text": "Confidential", "show_number": true}
+  {"cmd": "flush"}
+  Edits are saved on flush and at EOF, not after every line.
         """
     )
     
@@ -174,47 +495,40 @@ Strategy:
     parser.add_argument('--text', help='Footer text')
     parser.add_argument('--show-number', action='store_true', help='Show slide numbers')
     parser.add_argument('--show-date', action='store_true', help='Show date (placeholder only)')
+    parser.add_argument(
+        '--serve', action='store_true',
+        help='Apply NDJSON edits from stdin to the open file, saving on {"cmd": "flush"} and EOF'
+    )
     parser.add_argument('--json', action='store_true', default=True, help='Output JSON (default: true)')
     
     args = parser.parse_args()
     
+    # --- HYGIENE BLOCK START ---
+    # CRITICAL: Redirect stderr to /dev/null to prevent library noise from corrupting JSON output.
+    # Applied after argument parsing so argparse usage errors still reach the terminal.
+    # fd 2 itself is redirected so C-level output (lxml, zlib) is silenced too;
+    # PPT_DEBUG=1 keeps stderr.
+    if not os.environ.get('PPT_DEBUG'):
+        _devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(_devnull, 2)
+        os.close(_devnull)
+    # --- HYGIENE BLOCK END ---
+    
     try:
+        if args.serve:
+            serve(args.file, sys.stdin)
+            sys.exit(0)
+        
         result = set_footer(
             filepath=args.file,
             text=args.text,
             show_number=args.show_number
         )
-        print(json.dumps(result, indent=2))
+        _write_json(result)
         sys.exit(0)
         
-    except FileNotFoundError as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": "FileNotFoundError",
-            "suggestion": "Verify file path exists and is accessible."
-        }
-        print(json.dumps(error_result, indent=2))
-        sys.exit(1)
-        
-    except ValueError as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": "ValueError",
-            "suggestion": "Ensure file has .pptx extension."
-        }
-        print(json.dumps(error_result, indent=2))
-        sys.exit(1)
-        
     except Exception as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "tool_version": __version__
-        }
-        print(json.dumps(error_result, indent=2))
+        _write_json(_error_response(e))
         sys.exit(1)
 
 
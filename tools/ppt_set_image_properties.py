@@ -22,37 +22,178 @@ Accessibility:
 import sys
 import os
 
-# --- HYGIENE BLOCK START ---
-# CRITICAL: Redirect stderr to /dev/null to prevent library noise from corrupting JSON output
-sys.stderr = open(os.devnull, 'w')
-# --- HYGIENE BLOCK END ---
-
 import json
 import argparse
+import inspect
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple, IO, Callable
 import warnings
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from core.powerpoint_agent_core import (
-    PowerPointAgent, 
-    PowerPointAgentError, 
-    SlideNotFoundError
-)
+# NOTE: core.powerpoint_agent_core (python-pptx, lxml, PIL) is imported inside
+# the functions that need it, so --help and input-validation errors stay fast.
 
 __version__ = "3.1.0"
 
-# Define fallback exception if not available in core
-try:
-    from core.powerpoint_agent_core import ShapeNotFoundError
-except ImportError:
-    class ShapeNotFoundError(PowerPointAgentError):
-        """Exception raised when shape is not found."""
-        def __init__(self, message: str, details: Dict = None):
-            self.message = message
-            self.details = details or {}
-            super().__init__(message)
+
+@lru_cache(maxsize=1)
+def _core_opacity_kwarg() -> Optional[str]:
+    """
+    Name the opacity keyword PowerPointAgent.set_image_properties accepts.
+    
+    Returns "fill_opacity" or "transparency" (1.0 - opacity), or None when
+    the core cannot set image opacity. Inspected once per process.
+    """
+    from core.powerpoint_agent_core import PowerPointAgent
+    
+    parameters = inspect.signature(PowerPointAgent.set_image_properties).parameters
+    for name in ("fill_opacity", "transparency"):
+        if name in parameters:
+            return name
+    return None
+
+
+def _resolve_properties(
+    alt_text: Optional[str],
+    opacity: Optional[float],
+    transparency: Optional[float]
+) -> Tuple[Dict[str, float], Dict[str, Any]]:
+    """
+    Validate the requested properties before any presentation is opened.
+    
+    Returns:
+        (opacity_kwargs, properties_set): the opacity keyword for the core's
+        set_image_properties, and the properties to report
+        
+    Raises:
+        ValueError: If no properties specified or invalid values
+        PowerPointAgentError: If opacity is requested but the core cannot set it
+    """
+    # Handle deprecated transparency parameter
+    effective_opacity = opacity
+    transparency_converted = False
+    
+    if transparency is not None:
+        if opacity is not None:
+            raise ValueError(
+                "Cannot specify both 'opacity' and 'transparency'. "
+                "Use 'opacity' (transparency is deprecated)."
+            )
+        # Convert transparency to opacity (inverse relationship)
+        effective_opacity = 1.0 - transparency
+        transparency_converted = True
+    
+    # Validate at least one property is being set
+    if alt_text is None and effective_opacity is None:
+        raise ValueError(
+            "At least one property must be set (--alt-text or --opacity)"
+        )
+    
+    # Validate opacity range
+    if effective_opacity is not None:
+        if not (0.0 <= effective_opacity <= 1.0):
+            raise ValueError(
+                f"Opacity must be between 0.0 and 1.0, got: {effective_opacity}"
+            )
+    
+    # Resolve the core's opacity keyword before anything is opened or changed
+    opacity_kwargs: Dict[str, float] = {}
+    if effective_opacity is not None:
+        opacity_kwarg = _core_opacity_kwarg()
+        if opacity_kwarg is None:
+            from core.powerpoint_agent_core import PowerPointAgentError
+            
+            raise PowerPointAgentError(
+                "Setting image opacity is not supported by the installed core library",
+                details={"requested_opacity": effective_opacity}
+            )
+        opacity_kwargs[opacity_kwarg] = (
+            effective_opacity if opacity_kwarg == "fill_opacity" else 1.0 - effective_opacity
+        )
+    
+    # Build properties dict
+    properties_set: Dict[str, Any] = {}
+    if alt_text is not None:
+        properties_set["alt_text"] = alt_text
+    if effective_opacity is not None:
+        properties_set["opacity"] = effective_opacity
+        if transparency_converted:
+            properties_set["transparency_converted"] = True
+            properties_set["original_transparency"] = transparency
+    
+    return opacity_kwargs, properties_set
+
+
+def _apply_image_properties(
+    agent,
+    slide_index: int,
+    shape_index: int,
+    alt_text: Optional[str],
+    opacity_kwargs: Dict[str, float]
+) -> bool:
+    """
+    Validate the indices and set the properties on an open presentation.
+    
+    Shared by set_image_properties and --serve, which keeps the
+    presentation open across edits; nothing is saved here.
+    
+    Returns:
+        False when the shape's XML is byte-identical afterwards (the
+        properties already had these values), so there is nothing to save
+        
+    Raises:
+        SlideNotFoundError: If the slide index is out of range
+        ShapeNotFoundError: If the shape index is out of range
+    """
+    from lxml import etree
+    from core.powerpoint_agent_core import SlideNotFoundError, ShapeNotFoundError
+    
+    # Validate slide index
+    total_slides = agent.get_slide_count()
+    if not 0 <= slide_index < total_slides:
+        raise SlideNotFoundError(
+            f"Slide index {slide_index} out of range (0-{total_slides - 1})",
+            details={
+                "requested_index": slide_index,
+                "available_slides": total_slides
+            }
+        )
+    
+    # Count shapes directly; get_slide_info would also read every
+    # shape's geometry, text and image blob just to be counted
+    shapes = agent.prs.slides[slide_index].shapes
+    shape_count = len(shapes)
+    
+    if not 0 <= shape_index < shape_count:
+        raise ShapeNotFoundError(
+            f"Shape index {shape_index} out of range (0-{shape_count - 1})",
+            details={
+                "requested_index": shape_index,
+                "available_shapes": shape_count
+            }
+        )
+    
+    # The core only edits the target shape, so its XML is all that is compared
+    shape_element = shapes[shape_index]._element
+    before = etree.tostring(shape_element)
+    
+    # Set image properties
+    agent.set_image_properties(
+        slide_index=slide_index,
+        shape_index=shape_index,
+        alt_text=alt_text,
+        **opacity_kwargs
+    )
+    
+    return etree.tostring(shape_element) != before
 
 
 def set_image_properties(
@@ -61,7 +202,8 @@ def set_image_properties(
     shape_index: int,
     alt_text: Optional[str] = None,
     opacity: Optional[float] = None,
-    transparency: Optional[float] = None  # Deprecated, for backward compat
+    transparency: Optional[float] = None,  # Deprecated, for backward compat
+    version_hash: bool = True
 ) -> Dict[str, Any]:
     """
     Set properties on an image shape.
@@ -76,6 +218,8 @@ def set_image_properties(
         alt_text: Alternative text for accessibility (recommended for all images)
         opacity: Image opacity from 0.0 (invisible) to 1.0 (opaque)
         transparency: DEPRECATED - use opacity instead. If provided, converted to opacity.
+        version_hash: Compute presentation version hashes (default: True).
+            Disable to skip the full-deck hashing passes; versions are None.
         
     Returns:
         Dict containing:
@@ -87,6 +231,8 @@ def set_image_properties(
             - presentation_version_before: State hash before modification
             - presentation_version_after: State hash after modification
             - tool_version: Version of this tool
+            - no_changes: True when the image already had these properties
+              (nothing is saved)
             
     Raises:
         FileNotFoundError: If the PowerPoint file doesn't exist
@@ -108,101 +254,37 @@ def set_image_properties(
     if not filepath.exists():
         raise FileNotFoundError(f"File not found: {filepath}")
     
-    # Handle deprecated transparency parameter
-    effective_opacity = opacity
-    transparency_converted = False
+    opacity_kwargs, properties_set = _resolve_properties(alt_text, opacity, transparency)
     
-    if transparency is not None:
-        if opacity is not None:
-            raise ValueError(
-                "Cannot specify both 'opacity' and 'transparency'. "
-                "Use 'opacity' (transparency is deprecated)."
-            )
-        # Convert transparency to opacity (inverse relationship)
-        effective_opacity = 1.0 - transparency
-        transparency_converted = True
+    from core.powerpoint_agent_core import PowerPointAgent
     
-    # Validate at least one property is being set
-    if alt_text is None and effective_opacity is None:
-        raise ValueError(
-            "At least one property must be set (--alt-text or --opacity)"
-        )
+    version_before = None
+    version_after = None
     
-    # Validate opacity range
-    if effective_opacity is not None:
-        if not (0.0 <= effective_opacity <= 1.0):
-            raise ValueError(
-                f"Opacity must be between 0.0 and 1.0, got: {effective_opacity}"
-            )
-
-    with PowerPointAgent(filepath) as agent:
+    # The agent's own before/after hashes are not reported, so it skips them
+    with PowerPointAgent(filepath, track_versions=False) as agent:
         agent.open(filepath)
         
         # Capture version BEFORE modification
-        info_before = agent.get_presentation_info()
-        version_before = info_before.get("presentation_version")
-        
-        # Validate slide index
-        total_slides = agent.get_slide_count()
-        if not 0 <= slide_index < total_slides:
-            raise SlideNotFoundError(
-                f"Slide index {slide_index} out of range (0-{total_slides - 1})",
-                details={
-                    "requested_index": slide_index,
-                    "available_slides": total_slides
-                }
-            )
+        if version_hash:
+            version_before = agent.get_presentation_version()
         
-        # Get slide info to validate shape index
-        slide_info = agent.get_slide_info(slide_index)
-        shape_count = slide_info.get("shape_count", 0)
-        
-        if not 0 <= shape_index < shape_count:
-            raise ShapeNotFoundError(
-                f"Shape index {shape_index} out of range (0-{shape_count - 1})",
-                details={
-                    "requested_index": shape_index,
-                    "available_shapes": shape_count
-                }
-            )
-        
-        # Set image properties
-        # Note: Core method may use different parameter names
-        try:
-            agent.set_image_properties(
-                slide_index=slide_index,
-                shape_index=shape_index,
-                alt_text=alt_text,
-                # Pass opacity as fill_opacity if core supports it
-                fill_opacity=effective_opacity
-            )
-        except TypeError:
-            # Fallback if core uses different signature
-            agent.set_image_properties(
-                slide_index=slide_index,
-                shape_index=shape_index,
-                alt_text=alt_text,
-                transparency=1.0 - effective_opacity if effective_opacity is not None else None
-            )
-        
-        # Save changes
-        agent.save()
+        changed = _apply_image_properties(
+            agent, slide_index, shape_index, alt_text, opacity_kwargs
+        )
         
-        # Capture version AFTER modification
-        info_after = agent.get_presentation_info()
-        version_after = info_after.get("presentation_version")
-    
-    # Build properties dict
-    properties_set = {}
-    if alt_text is not None:
-        properties_set["alt_text"] = alt_text
-    if effective_opacity is not None:
-        properties_set["opacity"] = effective_opacity
-        if transparency_converted:
-            properties_set["transparency_converted"] = True
-            properties_set["original_transparency"] = transparency
+        # Save changes; setting values the image already has is a pure read,
+        # and otherwise only this slide's XML is re-serialized
+        if changed:
+            agent.save_incremental([agent.prs.slides[slide_index].part])
+            
+            # Capture version AFTER modification
+            if version_hash:
+                version_after = agent.get_presentation_version()
+        else:
+            version_after = version_before
     
-    return {
+    result = {
         "status": "success",
         "file": str(filepath.resolve()),
         "slide_index": slide_index,
@@ -212,6 +294,203 @@ def set_image_properties(
         "presentation_version_after": version_after,
         "tool_version": __version__
     }
+    
+    if not changed:
+        result["no_changes"] = True
+    
+    return result
+
+
+def serve(
+    filepath: Path,
+    requests: IO[str],
+    emit: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> int:
+    """
+    Apply NDJSON image property edits to one presentation kept open until EOF.
+    
+    Each input line is a JSON object with "slide" and "shape", plus the
+    optional keys "alt_text", "opacity", "transparency" and "id", or
+    {"cmd": "flush"}. Edits change the open presentation only; a flush
+    saves it when anything changed and reports the new
+    presentation_version. Edits still pending at EOF are saved as if a
+    final flush had been sent. Each line gets exactly one response line,
+    and an "id" is echoed back.
+    
+    Args:
+        filepath: Path to the PowerPoint file to modify
+        requests: Text stream of NDJSON requests (normally stdin)
+        emit: Record writer (default: one compact JSON line on stdout)
+        
+    Returns:
+        Number of requests answered
+        
+    Raises:
+        FileNotFoundError: If the PowerPoint file doesn't exist
+    """
+    if not filepath.exists():
+        raise FileNotFoundError(f"File not found: {filepath}")
+    
+    from core.powerpoint_agent_core import PowerPointAgent
+    
+    emit = emit or _write_json_line
+    answered = 0
+    pending = 0
+    dirty_parts: Dict[str, Any] = {}
+    
+    with PowerPointAgent(filepath, track_versions=False) as agent:
+        agent.open(filepath)
+        
+        for line in requests:
+            if not line.strip():
+                continue
+            
+            request = None
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("Request must be a JSON object")
+                
+                if request.get("cmd") == "flush":
+                    if pending:
+                        agent.save_incremental(dirty_parts.values())
+                        dirty_parts.clear()
+                    response = {
+                        "status": "success",
+                        "cmd": "flush",
+                        "file": str(filepath.resolve()),
+                        "saved": pending > 0,
+                        "edits_saved": pending,
+                        "presentation_version": agent.get_presentation_version(),
+                        "tool_version": __version__
+                    }
+                    pending = 0
+                elif "cmd" in request:
+                    raise ValueError(f"Unknown cmd {request['cmd']!r}; expected 'flush'")
+                else:
+                    if not all(isinstance(request.get(key), int) for key in ("slide", "shape")):
+                        raise ValueError("Request needs integer 'slide' and 'shape'")
+                    opacity_kwargs, properties_set = _resolve_properties(
+                        request.get("alt_text"), request.get("opacity"), request.get("transparency")
+                    )
+                    changed = _apply_image_properties(
+                        agent, request["slide"], request["shape"],
+                        request.get("alt_text"), opacity_kwargs
+                    )
+                    if changed:
+                        slide_part = agent.prs.slides[request["slide"]].part
+                        dirty_parts[slide_part.partname] = slide_part
+                        pending += 1
+                    response = {
+                        "status": "success",
+                        "file": str(filepath.resolve()),
+                        "slide_index": request["slide"],
+                        "shape_index": request["shape"],
+                        "properties_set": properties_set,
+                        "pending_edits": pending,
+                        "tool_version": __version__
+                    }
+                    if not changed:
+                        response["no_changes"] = True
+            except Exception as e:
+                response = _error_response(e)
+            
+            if isinstance(request, dict) and "id" in request:
+                response = {"id": request["id"], **response}
+            
+            emit(response)
+            answered += 1
+        
+        if pending:
+            agent.save_incremental(dirty_parts.values())
+    
+    return answered
+
+
+def _write_json(payload: Dict[str, Any]) -> None:
+    """Write an indented JSON payload to stdout, using orjson when it is installed."""
+    if HAS_ORJSON:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        sys.stdout.flush()
+        view = memoryview(data)
+        while view:
+            view = view[os.write(1, view):]
+    else:
+        # json.dump writes the encoder's chunks as they are produced
+        json.dump(payload, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+
+
+def _write_json_line(payload: Dict[str, Any]) -> None:
+    """Write one compact NDJSON record to stdout."""
+    if HAS_ORJSON:
+        data = orjson.dumps(payload, option=orjson.OPT_APPEND_NEWLINE)
+    else:
+        data = (json.dumps(payload, separators=(",", ":")) + "\n").encode("utf-8")
+    sys.stdout.flush()
+    view = memoryview(data)
+    while view:
+        view = view[os.write(1, view):]
+
+
+def _error_response(error: Exception) -> Dict[str, Any]:
+    """
+    Build the JSON error payload for an exception raised in main() or --serve.
+    
+    Core exception types are only checked when the core library has been
+    imported; anything raised before that cannot be a core error.
+    """
+    core = sys.modules.get("core.powerpoint_agent_core")
+    
+    if isinstance(error, FileNotFoundError):
+        return {
+            "status": "error",
+            "error": str(error),
+            "error_type": "FileNotFoundError",
+            "suggestion": "Verify the file path exists and is accessible"
+        }
+    
+    if core is not None and isinstance(error, core.SlideNotFoundError):
+        return {
+            "status": "error",
+            "error": str(error),
+            "error_type": "SlideNotFoundError",
+            "details": getattr(error, 'details', {}),
+            "suggestion": "Use ppt_get_info.py to check available slide indices"
+        }
+    
+    if core is not None and isinstance(error, core.ShapeNotFoundError):
+        return {
+            "status": "error",
+            "error": str(error),
+            "error_type": "ShapeNotFoundError",
+            "details": getattr(error, 'details', {}),
+            "suggestion": "Use ppt_get_slide_info.py to check available shape indices"
+        }
+    
+    if isinstance(error, ValueError):
+        return {
+            "status": "error",
+            "error": str(error),
+            "error_type": "ValueError",
+            "suggestion": "Specify at least --alt-text or --opacity (0.0-1.0)"
+        }
+    
+    if core is not None and isinstance(error, core.PowerPointAgentError):
+        return {
+            "status": "error",
+            "error": str(error),
+            "error_type": type(error).__name__,
+            "details": getattr(error, 'details', {})
+        }
+    
+    return {
+        "status": "error",
+        "error": str(error),
+        "error_type": type(error).__name__,
+        "tool_version": __version__
+    }
 
 
 def main():
@@ -245,6 +524,10 @@ Examples:
     --opacity 0.15 \\
     --json
 
+  # Several edits against one open presentation, saved once
+  printf '%s\\n' '{"slide": 0, "shape": 0, "alt_text": "Logo"}' '{"cmd": "flush"}' \\
+    | uv run tools/ppt_set_image_properties.py --file presentation.pptx --serve
+
 Finding Shape Indices:
   Use ppt_get_slide_info.py to identify shape indices:
   uv run tools/ppt_get_slide_info.py --file deck.pptx --slide 0 --json
@@ -285,6 +568,11 @@ Output Format:
     "presentation_version_after": "e5f6g7h8...",
     "tool_version": "3.1.0"
   }
+
+Serve Mode (--serve, one JSON request per stdin line, one response line each):
+  {"id": 1, "slide": 0, "shape": 1, "alt_text": "Company Logo"}
+  {"cmd": "flush"}
+  Edits are saved on flush and at EOF, not after every line.
         """
     )
     
@@ -296,15 +584,13 @@ Output Format:
     )
     parser.add_argument(
         '--slide', 
-        required=True, 
         type=int, 
-        help='Slide index (0-based)'
+        help='Slide index (0-based; required unless --serve)'
     )
     parser.add_argument(
         '--shape', 
-        required=True, 
         type=int, 
-        help='Shape index (0-based)'
+        help='Shape index (0-based; required unless --serve)'
     )
     parser.add_argument(
         '--alt-text', 
@@ -320,6 +606,16 @@ Output Format:
         type=float, 
         help='DEPRECATED: Use --opacity instead. Transparency from 0.0 to 1.0'
     )
+    parser.add_argument(
+        '--no-version-hash',
+        action='store_true',
+        help='Skip presentation version hashing (faster on large decks)'
+    )
+    parser.add_argument(
+        '--serve',
+        action='store_true',
+        help='Apply NDJSON edits from stdin to the open file, saving on {"cmd": "flush"} and EOF'
+    )
     parser.add_argument(
         '--json', 
         action='store_true', 
@@ -329,78 +625,39 @@ Output Format:
     
     args = parser.parse_args()
     
+    if not args.serve and (args.slide is None or args.shape is None):
+        parser.error("--slide and --shape are required unless --serve is used")
+    
+    # --- HYGIENE BLOCK START ---
+    # CRITICAL: Redirect stderr to /dev/null to prevent library noise from corrupting JSON output.
+    # Applied after argument parsing so argparse usage errors still reach the terminal.
+    # fd 2 itself is redirected so C-level output (lxml, zlib) is silenced too;
+    # PPT_DEBUG=1 keeps stderr.
+    if not os.environ.get('PPT_DEBUG'):
+        _devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(_devnull, 2)
+        os.close(_devnull)
+    # --- HYGIENE BLOCK END ---
+    
     try:
+        if args.serve:
+            serve(args.file, sys.stdin)
+            sys.exit(0)
+        
         result = set_image_properties(
             filepath=args.file, 
             slide_index=args.slide, 
             shape_index=args.shape,
             alt_text=args.alt_text,
             opacity=args.opacity,
-            transparency=args.transparency
+            transparency=args.transparency,
+            version_hash=not args.no_version_hash
         )
-        sys.stdout.write(json.dumps(result, indent=2) + "\n")
+        _write_json(result)
         sys.exit(0)
         
-    except FileNotFoundError as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": "FileNotFoundError",
-            "suggestion": "Verify the file path exists and is accessible"
-        }
-        sys.stdout.write(json.dumps(error_result, indent=2) + "\n")
-        sys.exit(1)
-        
-    except SlideNotFoundError as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": "SlideNotFoundError",
-            "details": getattr(e, 'details', {}),
-            "suggestion": "Use ppt_get_info.py to check available slide indices"
-        }
-        sys.stdout.write(json.dumps(error_result, indent=2) + "\n")
-        sys.exit(1)
-        
-    except ShapeNotFoundError as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": "ShapeNotFoundError",
-            "details": getattr(e, 'details', {}),
-            "suggestion": "Use ppt_get_slide_info.py to check available shape indices"
-        }
-        sys.stdout.write(json.dumps(error_result, indent=2) + "\n")
-        sys.exit(1)
-        
-    except ValueError as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": "ValueError",
-            "suggestion": "Specify at least --alt-text or --opacity (0.0-1.0)"
-        }
-        sys.stdout.write(json.dumps(error_result, indent=2) + "\n")
-        sys.exit(1)
-        
-    except PowerPointAgentError as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "details": getattr(e, 'details', {})
-        }
-        sys.stdout.write(json.dumps(error_result, indent=2) + "\n")
-        sys.exit(1)
-        
     except Exception as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "tool_version": __version__
-        }
-        sys.stdout.write(json.dumps(error_result, indent=2) + "\n")
+        _write_json(_error_response(e))
         sys.exit(1)
 
 
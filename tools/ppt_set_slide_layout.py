@@ -30,42 +30,190 @@ Safety:
 import sys
 import os
 
-# --- HYGIENE BLOCK START ---
-# CRITICAL: Redirect stderr to /dev/null to prevent library noise from corrupting JSON output
-sys.stderr = open(os.devnull, 'w')
-# --- HYGIENE BLOCK END ---
-
 import json
 import argparse
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, IO, Callable
 from difflib import get_close_matches
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from core.powerpoint_agent_core import (
-    PowerPointAgent, 
-    PowerPointAgentError, 
-    SlideNotFoundError
-)
+# NOTE: core.powerpoint_agent_core (python-pptx, lxml, PIL) is imported inside
+# the functions that need it, so --help and input-validation errors stay fast.
 
 __version__ = "3.1.0"
 
-# Define fallback exception
-try:
-    from core.powerpoint_agent_core import LayoutNotFoundError
-except ImportError:
-    class LayoutNotFoundError(PowerPointAgentError):
-        """Exception raised when layout is not found."""
-        def __init__(self, message: str, details: Dict = None):
-            self.message = message
-            self.details = details or {}
-            super().__init__(message)
-
 # Layouts known to potentially cause content loss
 DESTRUCTIVE_LAYOUTS = ["Blank", "Title Only"]
 
 
+def _apply_slide_layout(
+    agent,
+    slide_index: int,
+    layout_name: str,
+    force: bool
+) -> Dict[str, Any]:
+    """
+    Match the layout and change it on an open presentation without saving.
+    
+    Shared by set_slide_layout and --serve, which keeps the presentation
+    open across edits. Returns the result fields that do not depend on
+    the file or its version hashes.
+    
+    Raises:
+        SlideNotFoundError: If slide index is out of range
+        LayoutNotFoundError: If layout is not found
+        PowerPointAgentError: If force required but not provided
+    """
+    from core.powerpoint_agent_core import (
+        PowerPointAgentError, SlideNotFoundError, LayoutNotFoundError
+    )
+    
+    warnings: List[str] = []
+    recommendations: List[str] = []
+    
+    # Validate slide index
+    total_slides = agent.get_slide_count()
+    if not 0 <= slide_index < total_slides:
+        raise SlideNotFoundError(
+            f"Slide index {slide_index} out of range (0-{total_slides - 1})",
+            details={
+                "requested_index": slide_index,
+                "available_slides": total_slides
+            }
+        )
+    
+    # Get available layouts
+    available_layouts = agent.get_available_layouts()
+    
+    # Get current slide info
+    slide_info_before = agent.get_slide_info(slide_index)
+    old_layout = slide_info_before.get("layout", "Unknown")
+    placeholders_before = sum(
+        1 for shape in slide_info_before.get("shapes", [])
+        if "PLACEHOLDER" in shape.get("type", "")
+    )
+    
+    # Layout name matching with fuzzy search; names are lowercased once,
+    # and setdefault keeps the first layout when two differ only in case
+    layouts_by_lower: Dict[str, str] = {}
+    for layout in available_layouts:
+        layouts_by_lower.setdefault(layout.lower(), layout)
+    layout_lower = layout_name.lower()
+    
+    # Exact match (case-insensitive)
+    matched_layout: Optional[str] = layouts_by_lower.get(layout_lower)
+    
+    # Substring match if no exact match
+    if not matched_layout:
+        matched_layout = next(
+            (layout for lower, layout in layouts_by_lower.items() if layout_lower in lower),
+            None
+        )
+        if matched_layout:
+            warnings.append(
+                f"Matched '{layout_name}' to layout '{matched_layout}' (substring match)"
+            )
+    
+    # Fuzzy match using difflib
+    if not matched_layout:
+        close_matches = get_close_matches(
+            layout_name, available_layouts, n=3, cutoff=0.6
+        )
+        if close_matches:
+            raise LayoutNotFoundError(
+                f"Layout '{layout_name}' not found. Did you mean one of these?\n" +
+                "\n".join(f"  - {match}" for match in close_matches) +
+                f"\n\nAll available layouts:\n" +
+                "\n".join(f"  - {layout}" for layout in available_layouts),
+                details={
+                    "requested_layout": layout_name,
+                    "suggestions": close_matches,
+                    "available_layouts": available_layouts
+                }
+            )
+        else:
+            raise LayoutNotFoundError(
+                f"Layout '{layout_name}' not found.\n\n" +
+                f"Available layouts:\n" +
+                "\n".join(f"  - {layout}" for layout in available_layouts),
+                details={
+                    "requested_layout": layout_name,
+                    "available_layouts": available_layouts
+                }
+            )
+    
+    # Safety warnings for destructive layouts
+    if matched_layout in DESTRUCTIVE_LAYOUTS and placeholders_before > 0:
+        warnings.append(
+            f"⚠️ CONTENT LOSS RISK: Changing from '{old_layout}' to '{matched_layout}' "
+            f"may remove {placeholders_before} placeholder(s) and their content!"
+        )
+        
+        if not force:
+            raise PowerPointAgentError(
+                f"Layout change from '{old_layout}' to '{matched_layout}' requires --force flag.\n"
+                f"This change may cause content loss ({placeholders_before} placeholders affected).\n\n"
+                "To proceed, add --force flag:\n"
+                f"  --layout \"{matched_layout}\" --force\n\n"
+                "RECOMMENDATION: Backup your presentation first!"
+            )
+    
+    # Warn about same layout
+    if matched_layout == old_layout:
+        recommendations.append(
+            f"Slide already uses '{old_layout}' layout. No change needed."
+        )
+    
+    # Apply layout change
+    agent.set_slide_layout(slide_index, matched_layout)
+    
+    # Get slide info after change
+    slide_info_after = agent.get_slide_info(slide_index)
+    placeholders_after = sum(
+        1 for shape in slide_info_after.get("shapes", [])
+        if "PLACEHOLDER" in shape.get("type", "")
+    )
+    
+    # Detect content loss
+    if placeholders_after < placeholders_before:
+        lost_count = placeholders_before - placeholders_after
+        warnings.append(
+            f"Content loss detected: {lost_count} placeholder(s) removed during layout change."
+        )
+        recommendations.append(
+            "Review slide content and restore any lost text using ppt_add_text_box.py"
+        )
+    
+    result: Dict[str, Any] = {
+        "status": "success" if len(warnings) == 0 else "warning",
+        "slide_index": slide_index,
+        "old_layout": old_layout,
+        "new_layout": matched_layout,
+        "layout_changed": (old_layout != matched_layout),
+        "placeholders": {
+            "before": placeholders_before,
+            "after": placeholders_after,
+            "change": placeholders_after - placeholders_before
+        },
+        "available_layouts": available_layouts
+    }
+    
+    if warnings:
+        result["warnings"] = warnings
+    
+    if recommendations:
+        result["recommendations"] = recommendations
+    
+    return result
+
+
 def set_slide_layout(
     filepath: Path,
     slide_index: int,
@@ -119,8 +267,7 @@ def set_slide_layout(
     if not filepath.exists():
         raise FileNotFoundError(f"File not found: {filepath}")
     
-    warnings: List[str] = []
-    recommendations: List[str] = []
+    from core.powerpoint_agent_core import PowerPointAgent
     
     with PowerPointAgent(filepath) as agent:
         agent.open(filepath)
@@ -129,152 +276,204 @@ def set_slide_layout(
         info_before = agent.get_presentation_info()
         version_before = info_before.get("presentation_version")
         
-        # Validate slide index
-        total_slides = agent.get_slide_count()
-        if not 0 <= slide_index < total_slides:
-            raise SlideNotFoundError(
-                f"Slide index {slide_index} out of range (0-{total_slides - 1})",
-                details={
-                    "requested_index": slide_index,
-                    "available_slides": total_slides
-                }
-            )
+        layout_result = _apply_slide_layout(agent, slide_index, layout_name, force)
         
-        # Get available layouts
-        available_layouts = agent.get_available_layouts()
-        
-        # Get current slide info
-        slide_info_before = agent.get_slide_info(slide_index)
-        old_layout = slide_info_before.get("layout", "Unknown")
-        placeholders_before = sum(
-            1 for shape in slide_info_before.get("shapes", [])
-            if "PLACEHOLDER" in shape.get("type", "")
-        )
-        
-        # Layout name matching with fuzzy search
-        matched_layout: Optional[str] = None
-        
-        # Exact match (case-insensitive)
-        for layout in available_layouts:
-            if layout.lower() == layout_name.lower():
-                matched_layout = layout
-                break
-        
-        # Substring match if no exact match
-        if not matched_layout:
-            for layout in available_layouts:
-                if layout_name.lower() in layout.lower():
-                    matched_layout = layout
-                    warnings.append(
-                        f"Matched '{layout_name}' to layout '{layout}' (substring match)"
-                    )
-                    break
-        
-        # Fuzzy match using difflib
-        if not matched_layout:
-            close_matches = get_close_matches(
-                layout_name, available_layouts, n=3, cutoff=0.6
-            )
-            if close_matches:
-                raise LayoutNotFoundError(
-                    f"Layout '{layout_name}' not found. Did you mean one of these?\n" +
-                    "\n".join(f"  - {match}" for match in close_matches) +
-                    f"\n\nAll available layouts:\n" +
-                    "\n".join(f"  - {layout}" for layout in available_layouts),
-                    details={
-                        "requested_layout": layout_name,
-                        "suggestions": close_matches,
-                        "available_layouts": available_layouts
-                    }
-                )
-            else:
-                raise LayoutNotFoundError(
-                    f"Layout '{layout_name}' not found.\n\n" +
-                    f"Available layouts:\n" +
-                    "\n".join(f"  - {layout}" for layout in available_layouts),
-                    details={
-                        "requested_layout": layout_name,
-                        "available_layouts": available_layouts
-                    }
-                )
-        
-        # Safety warnings for destructive layouts
-        if matched_layout in DESTRUCTIVE_LAYOUTS and placeholders_before > 0:
-            warnings.append(
-                f"⚠️ CONTENT LOSS RISK: Changing from '{old_layout}' to '{matched_layout}' "
-                f"may remove {placeholders_before} placeholder(s) and their content!"
-            )
-            
-            if not force:
-                raise PowerPointAgentError(
-                    f"Layout change from '{old_layout}' to '{matched_layout}' requires --force flag.\n"
-                    f"This change may cause content loss ({placeholders_before} placeholders affected).\n\n"
-                    "To proceed, add --force flag:\n"
-                    f"  --layout \"{matched_layout}\" --force\n\n"
-                    "RECOMMENDATION: Backup your presentation first!"
-                )
-        
-        # Warn about same layout
-        if matched_layout == old_layout:
-            recommendations.append(
-                f"Slide already uses '{old_layout}' layout. No change needed."
-            )
-        
-        # Apply layout change
-        agent.set_slide_layout(slide_index, matched_layout)
-        
-        # Get slide info after change
-        slide_info_after = agent.get_slide_info(slide_index)
-        placeholders_after = sum(
-            1 for shape in slide_info_after.get("shapes", [])
-            if "PLACEHOLDER" in shape.get("type", "")
-        )
-        
-        # Detect content loss
-        if placeholders_after < placeholders_before:
-            lost_count = placeholders_before - placeholders_after
-            warnings.append(
-                f"Content loss detected: {lost_count} placeholder(s) removed during layout change."
-            )
-            recommendations.append(
-                "Review slide content and restore any lost text using ppt_add_text_box.py"
-            )
-        
-        # Save changes
-        agent.save()
+        # Save changes; the layout relationship lives in this slide's rels
+        # item, which is rewritten with the slide
+        agent.save_incremental([agent.prs.slides[slide_index].part])
         
         # Capture version AFTER change
         info_after = agent.get_presentation_info()
         version_after = info_after.get("presentation_version")
     
-    # Build response
-    status = "success" if len(warnings) == 0 else "warning"
-    
-    result: Dict[str, Any] = {
-        "status": status,
+    return {
+        **layout_result,
         "file": str(filepath.resolve()),
-        "slide_index": slide_index,
-        "old_layout": old_layout,
-        "new_layout": matched_layout,
-        "layout_changed": (old_layout != matched_layout),
-        "placeholders": {
-            "before": placeholders_before,
-            "after": placeholders_after,
-            "change": placeholders_after - placeholders_before
-        },
-        "available_layouts": available_layouts,
         "presentation_version_before": version_before,
         "presentation_version_after": version_after,
         "tool_version": __version__
     }
+
+
+def serve(
+    filepath: Path,
+    requests: IO[str],
+    emit: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> int:
+    """
+    Apply NDJSON layout changes to one presentation kept open until EOF.
     
-    if warnings:
-        result["warnings"] = warnings
+    Each input line is a JSON object with "slide" and "layout", plus the
+    optional keys "force" and "id", or {"cmd": "flush"}. Edits change the
+    open presentation only; a flush saves it when anything changed and
+    reports the new presentation_version. Edits still pending at EOF are
+    saved as if a final flush had been sent. Each line gets exactly one
+    response line, and an "id" is echoed back.
     
-    if recommendations:
-        result["recommendations"] = recommendations
+    Args:
+        filepath: Path to the PowerPoint file to modify
+        requests: Text stream of NDJSON requests (normally stdin)
+        emit: Record writer (default: one compact JSON line on stdout)
+        
+    Returns:
+        Number of requests answered
+        
+    Raises:
+        FileNotFoundError: If file doesn't exist
+    """
+    if not filepath.exists():
+        raise FileNotFoundError(f"File not found: {filepath}")
     
-    return result
+    from core.powerpoint_agent_core import PowerPointAgent
+    
+    emit = emit or _write_json_line
+    answered = 0
+    pending = 0
+    dirty_parts: Dict[str, Any] = {}
+    
+    with PowerPointAgent(filepath, track_versions=False) as agent:
+        agent.open(filepath)
+        
+        for line in requests:
+            if not line.strip():
+                continue
+            
+            request = None
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("Request must be a JSON object")
+                
+                if request.get("cmd") == "flush":
+                    if pending:
+                        agent.save_incremental(dirty_parts.values())
+                        dirty_parts.clear()
+                    response = {
+                        "status": "success",
+                        "cmd": "flush",
+                        "file": str(filepath.resolve()),
+                        "saved": pending > 0,
+                        "edits_saved": pending,
+                        "presentation_version": agent.get_presentation_version(),
+                        "tool_version": __version__
+                    }
+                    pending = 0
+                elif "cmd" in request:
+                    raise ValueError(f"Unknown cmd {request['cmd']!r}; expected 'flush'")
+                else:
+                    if not isinstance(request.get("slide"), int):
+                        raise ValueError("Request needs an integer 'slide'")
+                    if not isinstance(request.get("layout"), str):
+                        raise ValueError("Request needs a 'layout' name")
+                    response = _apply_slide_layout(
+                        agent, request["slide"], request["layout"],
+                        bool(request.get("force", False))
+                    )
+                    slide_part = agent.prs.slides[request["slide"]].part
+                    dirty_parts[slide_part.partname] = slide_part
+                    pending += 1
+                    response["file"] = str(filepath.resolve())
+                    response["pending_edits"] = pending
+                    response["tool_version"] = __version__
+            except Exception as e:
+                slide_index = request.get("slide") if isinstance(request, dict) else None
+                response = _error_response(e, filepath, slide_index)
+            
+            if isinstance(request, dict) and "id" in request:
+                response = {"id": request["id"], **response}
+            
+            emit(response)
+            answered += 1
+        
+        if pending:
+            agent.save_incremental(dirty_parts.values())
+    
+    return answered
+
+
+def _write_json(payload: Dict[str, Any]) -> None:
+    """Write an indented JSON payload to stdout, using orjson when it is installed."""
+    if HAS_ORJSON:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        sys.stdout.flush()
+        view = memoryview(data)
+        while view:
+            view = view[os.write(1, view):]
+    else:
+        # json.dump writes the encoder's chunks as they are produced
+        json.dump(payload, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+
+
+def _write_json_line(payload: Dict[str, Any]) -> None:
+    """Write one compact NDJSON record to stdout."""
+    if HAS_ORJSON:
+        data = orjson.dumps(payload, option=orjson.OPT_APPEND_NEWLINE)
+    else:
+        data = (json.dumps(payload, separators=(",", ":")) + "\n").encode("utf-8")
+    sys.stdout.flush()
+    view = memoryview(data)
+    while view:
+        view = view[os.write(1, view):]
+
+
+def _error_response(
+    error: Exception,
+    filepath: Optional[Path] = None,
+    slide_index: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Build the JSON error payload for an exception raised in main() or --serve.
+    
+    Core exception types are only checked when the core library has been
+    imported; anything raised before that cannot be a core error.
+    """
+    core = sys.modules.get("core.powerpoint_agent_core")
+    
+    if isinstance(error, FileNotFoundError):
+        return {
+            "status": "error",
+            "error": str(error),
+            "error_type": "FileNotFoundError",
+            "suggestion": "Verify the file path exists and is accessible"
+        }
+    
+    if core is not None and isinstance(error, core.SlideNotFoundError):
+        return {
+            "status": "error",
+            "error": str(error),
+            "error_type": "SlideNotFoundError",
+            "details": getattr(error, 'details', {}),
+            "suggestion": "Use ppt_get_info.py to check available slides"
+        }
+    
+    if core is not None and isinstance(error, core.LayoutNotFoundError):
+        return {
+            "status": "error",
+            "error": str(error),
+            "error_type": "LayoutNotFoundError",
+            "details": getattr(error, 'details', {}),
+            "suggestion": "Use ppt_get_info.py to list available layouts"
+        }
+    
+    if core is not None and isinstance(error, core.PowerPointAgentError):
+        return {
+            "status": "error",
+            "error": str(error),
+            "error_type": type(error).__name__,
+            "details": getattr(error, 'details', {}),
+            "suggestion": "Add --force flag if you accept the content loss risk"
+        }
+    
+    return {
+        "status": "error",
+        "error": str(error),
+        "error_type": type(error).__name__,
+        "file": str(filepath) if filepath else None,
+        "slide_index": slide_index,
+        "tool_version": __version__
+    }
 
 
 def main():
@@ -315,6 +514,10 @@ Examples:
     --layout "title content" \\
     --json
 
+  # Several changes against one open presentation, saved once
+  printf '%s\\n' '{"slide": 2, "layout": "Title Only"}' '{"cmd": "flush"}' \\
+    | uv run tools/ppt_set_slide_layout.py --file presentation.pptx --serve
+
 Common Layouts:
   Low Risk (preserve most content):
   - "Title and Content" - Most versatile
@@ -360,6 +563,11 @@ Output Format:
     "tool_version": "3.1.0"
   }
 
+Serve Mode (--serve, one JSON request per stdin line, one response line each):
+  {"id": 1, "slide": 5, "layout": "Blank", "force": true}
+  {"cmd": "flush"}
+  Edits are saved on flush and at EOF, not after every line.
+
 Recovery from Content Loss:
   If content was lost during layout change:
   1. Restore from backup (you did backup, right?)
@@ -383,15 +591,13 @@ Related Tools:
     
     parser.add_argument(
         '--slide',
-        required=True,
         type=int,
-        help='Slide index (0-based)'
+        help='Slide index (0-based; required unless --serve)'
     )
     
     parser.add_argument(
         '--layout',
-        required=True,
-        help='New layout name (fuzzy matching supported)'
+        help='New layout name (fuzzy matching supported; required unless --serve)'
     )
     
     parser.add_argument(
@@ -400,6 +606,12 @@ Related Tools:
         help='Force destructive layout change (acknowledges content loss risk)'
     )
     
+    parser.add_argument(
+        '--serve',
+        action='store_true',
+        help='Apply NDJSON edits from stdin to the open file, saving on {"cmd": "flush"} and EOF'
+    )
+    
     parser.add_argument(
         '--json',
         action='store_true',
@@ -409,7 +621,25 @@ Related Tools:
     
     args = parser.parse_args()
     
+    if not args.serve and (args.slide is None or args.layout is None):
+        parser.error("--slide and --layout are required unless --serve is used")
+    
+    # --- HYGIENE BLOCK START ---
+    # CRITICAL: Redirect stderr to /dev/null to prevent library noise from corrupting JSON output.
+    # Applied after argument parsing so argparse usage errors still reach the terminal.
+    # fd 2 itself is redirected so C-level output (lxml, zlib) is silenced too;
+    # PPT_DEBUG=1 keeps stderr.
+    if not os.environ.get('PPT_DEBUG'):
+        _devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(_devnull, 2)
+        os.close(_devnull)
+    # --- HYGIENE BLOCK END ---
+    
     try:
+        if args.serve:
+            serve(args.file, sys.stdin)
+            sys.exit(0)
+        
         result = set_slide_layout(
             filepath=args.file,
             slide_index=args.slide,
@@ -417,62 +647,11 @@ Related Tools:
             force=args.force
         )
         
-        sys.stdout.write(json.dumps(result, indent=2) + "\n")
+        _write_json(result)
         sys.exit(0)
         
-    except FileNotFoundError as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": "FileNotFoundError",
-            "suggestion": "Verify the file path exists and is accessible"
-        }
-        sys.stdout.write(json.dumps(error_result, indent=2) + "\n")
-        sys.exit(1)
-        
-    except SlideNotFoundError as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": "SlideNotFoundError",
-            "details": getattr(e, 'details', {}),
-            "suggestion": "Use ppt_get_info.py to check available slides"
-        }
-        sys.stdout.write(json.dumps(error_result, indent=2) + "\n")
-        sys.exit(1)
-        
-    except LayoutNotFoundError as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": "LayoutNotFoundError",
-            "details": getattr(e, 'details', {}),
-            "suggestion": "Use ppt_get_info.py to list available layouts"
-        }
-        sys.stdout.write(json.dumps(error_result, indent=2) + "\n")
-        sys.exit(1)
-        
-    except PowerPointAgentError as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "details": getattr(e, 'details', {}),
-            "suggestion": "Add --force flag if you accept the content loss risk"
-        }
-        sys.stdout.write(json.dumps(error_result, indent=2) + "\n")
-        sys.exit(1)
-        
     except Exception as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "file": str(args.file) if args.file else None,
-            "slide_index": args.slide if hasattr(args, 'slide') else None,
-            "tool_version": __version__
-        }
-        sys.stdout.write(json.dumps(error_result, indent=2) + "\n")
+        _write_json(_error_response(e, args.file, args.slide))
         sys.exit(1)
 
 
@@ -27,12 +27,18 @@ Best Practices:
 import sys
 import os
 
-sys.stderr = open(os.devnull, 'w')
-
 import json
 import argparse
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple, IO, Callable
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+from pptx.enum.shapes import PP_PLACEHOLDER
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -44,46 +50,26 @@ from core.powerpoint_agent_core import (
 
 __version__ = "3.1.0"
 
+# Titles longer than this are rejected before the presentation is opened
+MAX_TITLE_LENGTH = 500
 
-def set_title(
-    filepath: Path,
-    slide_index: int,
-    title: str,
-    subtitle: Optional[str] = None
-) -> Dict[str, Any]:
+TITLE_PLACEHOLDER_TYPES = frozenset({PP_PLACEHOLDER.TITLE, PP_PLACEHOLDER.CENTER_TITLE})
+
+
+def _check_title_text(title: str, subtitle: Optional[str]) -> Tuple[List[str], List[str]]:
     """
-    Set slide title and subtitle with validation.
+    Run the checks that only need the title and subtitle strings.
     
-    Args:
-        filepath: Path to PowerPoint file (.pptx)
-        slide_index: Slide index (0-based)
-        title: Title text
-        subtitle: Optional subtitle text
-        
     Returns:
-        Dict containing:
-        - status: "success" or "warning"
-        - file: Absolute file path
-        - slide_index: Modified slide
-        - title: Title set
-        - subtitle: Subtitle set (if any)
-        - layout: Current layout name
-        - warnings: List of validation warnings
-        - recommendations: Suggested improvements
-        - presentation_version_before: Version hash before
-        - presentation_version_after: Version hash after
-        - tool_version: Tool version
+        Tuple of (warnings, recommendations)
         
     Raises:
-        FileNotFoundError: If file doesn't exist
-        ValueError: If file format invalid
-        SlideNotFoundError: If slide index out of range
+        ValueError: If title exceeds MAX_TITLE_LENGTH
     """
-    if not filepath.exists():
-        raise FileNotFoundError(f"File not found: {filepath}")
-    
-    if filepath.suffix.lower() != '.pptx':
-        raise ValueError("Only .pptx files are supported")
+    if len(title) > MAX_TITLE_LENGTH:
+        raise ValueError(
+            f"Title is {len(title)} characters; the maximum is {MAX_TITLE_LENGTH}"
+        )
     
     warnings: List[str] = []
     recommendations: List[str] = []
@@ -117,89 +103,448 @@ def set_title(
             "Title is all lowercase. Consider using title case for professionalism."
         )
     
+    return warnings, recommendations
+
+
+def _title_result(
+    slide_index: int,
+    title: str,
+    subtitle: Optional[str],
+    warnings: List[str],
+    recommendations: List[str],
+    **fields: Any
+) -> Dict[str, Any]:
+    """Assemble the result fields shared by real runs, dry runs and --serve."""
+    result: Dict[str, Any] = {
+        "status": "success" if not warnings else "warning",
+        "slide_index": slide_index,
+        "title": title,
+        "subtitle": subtitle,
+        **fields,
+        "validation": {
+            "title_length": len(title),
+            "title_length_ok": len(title) <= 60,
+            "subtitle_length": len(subtitle) if subtitle else 0,
+            "subtitle_length_ok": len(subtitle) <= 100 if subtitle else True
+        }
+    }
+    
+    if warnings:
+        result["warnings"] = warnings
+    
+    if recommendations:
+        result["recommendations"] = recommendations
+    
+    return result
+
+
+def _apply_title(
+    agent,
+    slide_index: int,
+    title: str,
+    subtitle: Optional[str],
+    warnings: List[str],
+    recommendations: List[str]
+) -> Dict[str, Any]:
+    """
+    Check placeholders and set the title on an open presentation without saving.
+    
+    Shared by set_title and --serve, which keeps the presentation open
+    across edits. The text-check warnings and recommendations are extended
+    with the layout checks; the lists passed in are not modified.
+    
+    Raises:
+        SlideNotFoundError: If slide index out of range
+    """
+    warnings = list(warnings)
+    recommendations = list(recommendations)
+    
+    total_slides = agent.get_slide_count()
+    if not 0 <= slide_index < total_slides:
+        raise SlideNotFoundError(
+            f"Slide index {slide_index} out of range (0-{total_slides - 1})",
+            details={"requested": slide_index, "available": total_slides}
+        )
+    
+    slide = agent.prs.slides[slide_index]
+    layout_name = slide.slide_layout.name
+    
+    if slide_index == 0 and "Title Slide" not in layout_name:
+        recommendations.append(
+            f"First slide has layout '{layout_name}'. "
+            "Consider using 'Title Slide' layout for cover slides."
+        )
+    
+    has_title_placeholder = False
+    has_subtitle_placeholder = False
+    
+    need_subtitle = subtitle is not None
+    
+    # Only <p:ph> shapes matter; stop once nothing is left to find
+    for placeholder in slide.placeholders:
+        ph_type = placeholder.placeholder_format.type
+        if not has_title_placeholder and ph_type in TITLE_PLACEHOLDER_TYPES:
+            has_title_placeholder = True
+        if need_subtitle and not has_subtitle_placeholder and ph_type == PP_PLACEHOLDER.SUBTITLE:
+            has_subtitle_placeholder = True
+        if has_title_placeholder and (has_subtitle_placeholder or not need_subtitle):
+            break
+    
+    if not has_title_placeholder:
+        warnings.append(
+            f"Layout '{layout_name}' may not have a title placeholder. "
+            "Title may not display as expected. Consider changing layout first."
+        )
+    
+    if subtitle and not has_subtitle_placeholder:
+        warnings.append(
+            f"Layout '{layout_name}' does not have a subtitle placeholder. "
+            "Subtitle will not be displayed. Consider using 'Title Slide' layout."
+        )
+    
+    agent.set_title(slide_index, title, subtitle)
+    
+    return _title_result(
+        slide_index, title, subtitle, warnings, recommendations,
+        layout=layout_name,
+        shape_count=len(slide.shapes),
+        placeholders_found={
+            "title": has_title_placeholder,
+            "subtitle": has_subtitle_placeholder
+        }
+    )
+
+
+def set_title(
+    filepath: Path,
+    slide_index: int,
+    title: str,
+    subtitle: Optional[str] = None,
+    dry_run: bool = False
+) -> Dict[str, Any]:
+    """
+    Set slide title and subtitle with validation.
+    
+    Args:
+        filepath: Path to PowerPoint file (.pptx)
+        slide_index: Slide index (0-based)
+        title: Title text
+        subtitle: Optional subtitle text
+        dry_run: Run the text checks only, without opening the file
+        
+    Returns:
+        Dict containing:
+        - status: "success" or "warning"
+        - file: Absolute file path
+        - slide_index: Modified slide
+        - title: Title set
+        - subtitle: Subtitle set (if any)
+        - layout: Current layout name (None for dry runs)
+        - warnings: List of validation warnings
+        - recommendations: Suggested improvements
+        - presentation_version_before: Version hash before
+        - presentation_version_after: Version hash after
+        - tool_version: Tool version
+        
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ValueError: If file format invalid or title exceeds MAX_TITLE_LENGTH
+        SlideNotFoundError: If slide index out of range
+    """
+    if not filepath.exists():
+        raise FileNotFoundError(f"File not found: {filepath}")
+    
+    if filepath.suffix.lower() != '.pptx':
+        raise ValueError("Only .pptx files are supported")
+    
+    warnings, recommendations = _check_title_text(title, subtitle)
+    
+    # The checks above only need the strings; a dry run never loads the deck
+    if dry_run:
+        return {
+            **_title_result(
+                slide_index, title, subtitle, warnings, recommendations,
+                dry_run=True,
+                message="DRY RUN: Title text validated only. Run without --dry-run to apply.",
+                layout=None,
+                placeholders_found=None
+            ),
+            "file": str(filepath.resolve()),
+            "tool_version": __version__
+        }
+    
     with PowerPointAgent(filepath) as agent:
         agent.open(filepath)
         
         version_before = agent.get_presentation_version()
         
-        total_slides = agent.get_slide_count()
-        if not 0 <= slide_index < total_slides:
-            raise SlideNotFoundError(
-                f"Slide index {slide_index} out of range (0-{total_slides - 1})",
-                details={"requested": slide_index, "available": total_slides}
-            )
-        
-        slide_info_before = agent.get_slide_info(slide_index)
-        layout_name = slide_info_before.get("layout", "Unknown")
-        
-        if slide_index == 0 and "Title Slide" not in layout_name:
-            recommendations.append(
-                f"First slide has layout '{layout_name}'. "
-                "Consider using 'Title Slide' layout for cover slides."
-            )
+        title_result = _apply_title(
+            agent, slide_index, title, subtitle, warnings, recommendations
+        )
         
-        has_title_placeholder = False
-        has_subtitle_placeholder = False
+        # Only this slide's XML is re-serialized; other entries are copied
+        agent.save_incremental([agent.prs.slides[slide_index].part])
         
-        for shape in slide_info_before.get("shapes", []):
-            shape_type = shape.get("type", "")
-            if "TITLE" in shape_type or "CENTER_TITLE" in shape_type:
-                has_title_placeholder = True
-            if "SUBTITLE" in shape_type:
-                has_subtitle_placeholder = True
+        version_after = agent.get_presentation_version()
+    
+    return {
+        **title_result,
+        "file": str(filepath.resolve()),
+        "presentation_version_before": version_before,
+        "presentation_version_after": version_after,
+        "tool_version": __version__
+    }
+
+
+def set_titles_batch(filepath: Path, titles: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Set several slide titles with a single open/save cycle.
+    
+    Every entry's text is checked before the file is opened. If any entry
+    fails, nothing is saved.
+    
+    Args:
+        filepath: Path to PowerPoint file (.pptx)
+        titles: List of dicts with "slide", "title" and optional "subtitle"
         
-        if not has_title_placeholder:
-            warnings.append(
-                f"Layout '{layout_name}' may not have a title placeholder. "
-                "Title may not display as expected. Consider changing layout first."
-            )
+    Returns:
+        Result dict with one set_title-style result per entry
         
-        if subtitle and not has_subtitle_placeholder:
-            warnings.append(
-                f"Layout '{layout_name}' does not have a subtitle placeholder. "
-                "Subtitle will not be displayed. Consider using 'Title Slide' layout."
-            )
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ValueError: If file format invalid or an entry is malformed
+        SlideNotFoundError: If an entry's slide index is out of range
+    """
+    if not filepath.exists():
+        raise FileNotFoundError(f"File not found: {filepath}")
+    
+    if filepath.suffix.lower() != '.pptx':
+        raise ValueError("Only .pptx files are supported")
+    
+    if not isinstance(titles, list) or not titles:
+        raise ValueError("Titles manifest must be a non-empty JSON array of entries")
+    
+    # Validate every entry before touching the presentation
+    checks = []
+    for entry_idx, entry in enumerate(titles):
+        if not isinstance(entry, dict):
+            raise ValueError(f"Entry {entry_idx} must be a JSON object")
+        missing = [key for key in ("slide", "title") if key not in entry]
+        if missing:
+            raise ValueError(f"Entry {entry_idx} is missing required keys: {', '.join(missing)}")
+        if not isinstance(entry["title"], str):
+            raise ValueError(f"Entry {entry_idx} 'title' must be a string")
+        subtitle = entry.get("subtitle")
+        if subtitle is not None and not isinstance(subtitle, str):
+            raise ValueError(f"Entry {entry_idx} 'subtitle' must be a string")
+        checks.append(_check_title_text(entry["title"], subtitle))
+    
+    with PowerPointAgent(filepath) as agent:
+        agent.open(filepath)
         
-        agent.set_title(slide_index, title, subtitle)
+        version_before = agent.get_presentation_version()
         
-        slide_info_after = agent.get_slide_info(slide_index)
+        results = []
+        dirty_parts: Dict[str, Any] = {}
+        for entry, (warnings, recommendations) in zip(titles, checks):
+            slide_index = int(entry["slide"])
+            results.append(_apply_title(
+                agent, slide_index, entry["title"], entry.get("subtitle"),
+                warnings, recommendations
+            ))
+            slide_part = agent.prs.slides[slide_index].part
+            dirty_parts[slide_part.partname] = slide_part
         
-        agent.save()
+        # Single save for the whole batch, re-serializing only touched slides
+        agent.save_incremental(dirty_parts.values())
         
         version_after = agent.get_presentation_version()
     
-    status = "success" if len(warnings) == 0 else "warning"
-    
-    result: Dict[str, Any] = {
-        "status": status,
+    return {
+        "status": "warning" if any(r["status"] == "warning" for r in results) else "success",
         "file": str(filepath.resolve()),
-        "slide_index": slide_index,
-        "title": title,
-        "subtitle": subtitle,
-        "layout": layout_name,
-        "shape_count": slide_info_after.get("shape_count", 0),
-        "placeholders_found": {
-            "title": has_title_placeholder,
-            "subtitle": has_subtitle_placeholder
-        },
-        "validation": {
-            "title_length": len(title),
-            "title_length_ok": len(title) <= 60,
-            "subtitle_length": len(subtitle) if subtitle else 0,
-            "subtitle_length_ok": len(subtitle) <= 100 if subtitle else True
-        },
+        "mode": "batch",
+        "operations_applied": len(results),
+        "results": results,
         "presentation_version_before": version_before,
         "presentation_version_after": version_after,
         "tool_version": __version__
     }
+
+
+def serve(
+    filepath: Path,
+    requests: IO[str],
+    emit: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> int:
+    """
+    Apply NDJSON title edits to one presentation kept open until EOF.
     
-    if warnings:
-        result["warnings"] = warnings
+    Each input line is a JSON object with "slide" and "title", plus the
+    optional keys "subtitle" and "id", or {"cmd": "flush"}. Edits change
+    the open presentation only; a flush saves it when anything changed and
+    reports the new presentation_version. Edits still pending at EOF are
+    saved as if a final flush had been sent. Each line gets exactly one
+    response line, and an "id" is echoed back.
     
-    if recommendations:
-        result["recommendations"] = recommendations
+    Args:
+        filepath: Path to the PowerPoint file to modify
+        requests: Text stream of NDJSON requests (normally stdin)
+        emit: Record writer (default: one compact JSON line on stdout)
+        
+    Returns:
+        Number of requests answered
+        
+    Raises:
+        FileNotFoundError: If file doesn't exist
+    """
+    if not filepath.exists():
+        raise FileNotFoundError(f"File not found: {filepath}")
     
-    return result
+    emit = emit or _write_json_line
+    answered = 0
+    pending = 0
+    dirty_parts: Dict[str, Any] = {}
+    
+    with PowerPointAgent(filepath, track_versions=False) as agent:
+        agent.open(filepath)
+        
+        for line in requests:
+            if not line.strip():
+                continue
+            
+            request = None
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("Request must be a JSON object")
+                
+                if request.get("cmd") == "flush":
+                    if pending:
+                        agent.save_incremental(dirty_parts.values())
+                        dirty_parts.clear()
+                    response = {
+                        "status": "success",
+                        "cmd": "flush",
+                        "file": str(filepath.resolve()),
+                        "saved": pending > 0,
+                        "edits_saved": pending,
+                        "presentation_version": agent.get_presentation_version(),
+                        "tool_version": __version__
+                    }
+                    pending = 0
+                elif "cmd" in request:
+                    raise ValueError(f"Unknown cmd {request['cmd']!r}; expected 'flush'")
+                else:
+                    if not isinstance(request.get("slide"), int):
+                        raise ValueError("Request needs an integer 'slide'")
+                    if not isinstance(request.get("title"), str):
+                        raise ValueError("Request needs a 'title' string")
+                    subtitle = request.get("subtitle")
+                    if subtitle is not None and not isinstance(subtitle, str):
+                        raise ValueError("'subtitle' must be a string")
+                    
+                    warnings, recommendations = _check_title_text(request["title"], subtitle)
+                    response = _apply_title(
+                        agent, request["slide"], request["title"], subtitle,
+                        warnings, recommendations
+                    )
+                    slide_part = agent.prs.slides[request["slide"]].part
+                    dirty_parts[slide_part.partname] = slide_part
+                    pending += 1
+                    response["file"] = str(filepath.resolve())
+                    response["pending_edits"] = pending
+                    response["tool_version"] = __version__
+            except Exception as e:
+                slide_index = request.get("slide") if isinstance(request, dict) else None
+                response = _error_response(e, filepath, slide_index)
+            
+            if isinstance(request, dict) and "id" in request:
+                response = {"id": request["id"], **response}
+            
+            emit(response)
+            answered += 1
+        
+        if pending:
+            agent.save_incremental(dirty_parts.values())
+    
+    return answered
+
+
+def _write_json(payload: Dict[str, Any]) -> None:
+    """Write an indented JSON payload to stdout, using orjson when it is installed."""
+    if HAS_ORJSON:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        sys.stdout.flush()
+        view = memoryview(data)
+        while view:
+            view = view[os.write(1, view):]
+    else:
+        # json.dump writes the encoder's chunks as they are produced
+        json.dump(payload, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+
+
+def _write_json_line(payload: Dict[str, Any]) -> None:
+    """Write one compact NDJSON record to stdout."""
+    if HAS_ORJSON:
+        data = orjson.dumps(payload, option=orjson.OPT_APPEND_NEWLINE)
+    else:
+        data = (json.dumps(payload, separators=(",", ":")) + "\n").encode("utf-8")
+    sys.stdout.flush()
+    view = memoryview(data)
+    while view:
+        view = view[os.write(1, view):]
+
+
+def _error_response(
+    error: Exception,
+    filepath: Optional[Path] = None,
+    slide_index: Optional[int] = None
+) -> Dict[str, Any]:
+    """Build the JSON error payload for an exception raised in main() or --serve."""
+    if isinstance(error, FileNotFoundError):
+        return {
+            "status": "error",
+            "error": str(error),
+            "error_type": "FileNotFoundError",
+            "suggestion": "Verify the file path exists and is accessible."
+        }
+    
+    if isinstance(error, SlideNotFoundError):
+        return {
+            "status": "error",
+            "error": str(error),
+            "error_type": "SlideNotFoundError",
+            "details": getattr(error, 'details', {}),
+            "suggestion": "Use ppt_get_info.py to check available slides."
+        }
+    
+    if isinstance(error, ValueError):
+        return {
+            "status": "error",
+            "error": str(error),
+            "error_type": "ValueError",
+            "suggestion": f"Ensure file is .pptx format and the title is at most {MAX_TITLE_LENGTH} characters."
+        }
+    
+    if isinstance(error, PowerPointAgentError):
+        return {
+            "status": "error",
+            "error": str(error),
+            "error_type": type(error).__name__,
+            "suggestion": "Check the presentation file is valid."
+        }
+    
+    return {
+        "status": "error",
+        "error": str(error),
+        "error_type": type(error).__name__,
+        "file": str(filepath) if filepath else None,
+        "slide_index": slide_index,
+        "tool_version": __version__
+    }
 
 
 def main():
@@ -223,6 +568,26 @@ Examples:
     --subtitle "Driving Growth and Innovation" \\
     --json
   
+  # Check title text without opening the presentation
+  uv run tools/ppt_set_title.py \\
+    --file deck.pptx \\
+    --slide 0 \\
+    --title "2024 Strategic Plan" \\
+    --dry-run \\
+    --json
+  
+  # Set titles on many slides from a manifest with one open/save
+  uv run tools/ppt_set_title.py \\
+    --file deck.pptx \\
+    --titles-json titles.json \\
+    --json
+  
+  # Set titles on many slides with one open/save (NDJSON on stdin)
+  printf '%s\\n' \\
+    '{"slide": 0, "title": "2024 Strategic Plan", "subtitle": "Growth"}' \\
+    '{"slide": 5, "title": "Market Analysis"}' \\
+    | uv run tools/ppt_set_title.py --file deck.pptx --serve
+  
   # Update section title (middle slide)
   uv run tools/ppt_set_title.py \\
     --file presentation.pptx \\
@@ -252,12 +617,25 @@ Best Practices:
 
 Validation:
   This tool performs automatic validation:
-  - Title length (warns if >60 chars, strong warning if >100)
+  - Title length (warns if >60 chars, strong warning if >100, rejects >500)
   - Subtitle length (warns if >100 chars)
   - Title case recommendations
   - Placeholder availability checks
   - Layout compatibility warnings
 
+Titles Manifest (--titles-json):
+  JSON array of entries, all checked first and saved once:
+  [
+    {"slide": 0, "title": "2024 Strategic Plan", "subtitle": "Growth"},
+    {"slide": 5, "title": "Market Analysis"}
+  ]
+  If any entry fails, the presentation is left unchanged.
+
+Serve Mode (--serve, one JSON request per stdin line, one response line each):
+  {"id": 1, "slide": 0, "title": "2024 Strategic Plan", "subtitle": "Growth"}
+  {"cmd": "flush"}
+  Edits are saved on flush and at EOF, not after every line.
+
 Related Tools:
   - ppt_get_slide_info.py: Inspect slide layout and placeholders
   - ppt_set_slide_layout.py: Change slide layout
@@ -275,15 +653,13 @@ Related Tools:
     
     parser.add_argument(
         '--slide',
-        required=True,
         type=int,
-        help='Slide index (0-based, e.g., 0 for first slide)'
+        help='Slide index (0-based, e.g., 0 for first slide; required unless --serve)'
     )
     
     parser.add_argument(
         '--title',
-        required=True,
-        help='Title text (recommended: ≤60 characters)'
+        help='Title text (recommended: ≤60 characters; required unless --serve)'
     )
     
     parser.add_argument(
@@ -291,6 +667,24 @@ Related Tools:
         help='Optional subtitle text (recommended: ≤100 characters)'
     )
     
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Validate title text only, without opening or modifying the file'
+    )
+    
+    parser.add_argument(
+        '--titles-json',
+        type=Path,
+        help='JSON manifest of titles to set in one pass (replaces --slide/--title/--subtitle)'
+    )
+    
+    parser.add_argument(
+        '--serve',
+        action='store_true',
+        help='Apply NDJSON edits from stdin to the open file, saving on {"cmd": "flush"} and EOF'
+    )
+    
     parser.add_argument(
         '--json',
         action='store_true',
@@ -300,66 +694,53 @@ Related Tools:
     
     args = parser.parse_args()
     
+    if args.titles_json and (args.slide is not None or args.title is not None or args.subtitle):
+        parser.error("--titles-json cannot be combined with --slide, --title or --subtitle")
+    
+    if not (args.serve or args.titles_json) and (args.slide is None or args.title is None):
+        parser.error("--slide and --title are required unless --titles-json or --serve is used")
+    
+    # --- HYGIENE BLOCK START ---
+    # CRITICAL: Redirect stderr to /dev/null to prevent library noise from corrupting JSON output.
+    # Applied after argument parsing so argparse usage errors still reach the terminal.
+    # fd 2 itself is redirected so C-level output (lxml, zlib) is silenced too;
+    # PPT_DEBUG=1 keeps stderr.
+    if not os.environ.get('PPT_DEBUG'):
+        _devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(_devnull, 2)
+        os.close(_devnull)
+    # --- HYGIENE BLOCK END ---
+    
     try:
+        if args.serve:
+            serve(args.file, sys.stdin)
+            sys.exit(0)
+        
+        if args.titles_json:
+            if not args.titles_json.exists():
+                raise FileNotFoundError(f"Titles manifest not found: {args.titles_json}")
+            try:
+                with open(args.titles_json, 'r', encoding='utf-8') as f:
+                    titles = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON in --titles-json manifest: {e}")
+            
+            _write_json(set_titles_batch(args.file, titles))
+            sys.exit(0)
+        
         result = set_title(
             filepath=args.file,
             slide_index=args.slide,
             title=args.title,
-            subtitle=args.subtitle
+            subtitle=args.subtitle,
+            dry_run=args.dry_run
         )
         
-        print(json.dumps(result, indent=2))
+        _write_json(result)
         sys.exit(0)
         
-    except FileNotFoundError as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": "FileNotFoundError",
-            "suggestion": "Verify the file path exists and is accessible."
-        }
-        print(json.dumps(error_result, indent=2))
-        sys.exit(1)
-        
-    except SlideNotFoundError as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": "SlideNotFoundError",
-            "details": getattr(e, 'details', {}),
-            "suggestion": "Use ppt_get_info.py to check available slides."
-        }
-        print(json.dumps(error_result, indent=2))
-        sys.exit(1)
-        
-    except ValueError as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": "ValueError",
-            "suggestion": "Ensure file is .pptx format."
-        }
-        print(json.dumps(error_result, indent=2))
-        sys.exit(1)
-        
-    except PowerPointAgentError as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "suggestion": "Check the presentation file is valid."
-        }
-        print(json.dumps(error_result, indent=2))
-        sys.exit(1)
-        
     except Exception as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "tool_version": __version__
-        }
-        print(json.dumps(error_result, indent=2))
+        _write_json(_error_response(e, args.file, args.slide))
         sys.exit(1)
 
 
@@ -21,12 +21,18 @@ Exit Codes:
 import sys
 import os
 
-sys.stderr = open(os.devnull, 'w')
-
 import json
 import argparse
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, IO, Callable
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+from pptx.oxml.ns import qn
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -39,12 +45,117 @@ from core.powerpoint_agent_core import (
 
 __version__ = "3.1.0"
 
+Z_ORDER_ACTIONS = ['bring_to_front', 'send_to_back', 'bring_forward', 'send_backward']
+
 
 def _validate_xml_structure(sp_tree) -> bool:
     """Validate XML tree integrity after manipulation."""
     return all(child is not None for child in sp_tree)
 
 
+def _apply_z_order(
+    agent,
+    slide_index: int,
+    shape_index: int,
+    action: str,
+    slide_count: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Move one shape within its slide's <p:spTree> on an open presentation.
+    
+    Shared by set_z_order, set_z_order_batch and --serve; nothing is saved
+    here. Callers applying several actions pass slide_count, which z-order
+    changes never alter, so it is read from the presentation only once.
+    
+    Returns:
+        Dict with slide_index, shape_index_target, action and z_order_change,
+        plus no_changes=True when the shape is already where the action
+        would put it (the XML is then left untouched)
+        
+    Raises:
+        SlideNotFoundError: If slide index invalid
+        ShapeNotFoundError: If shape index invalid
+        PowerPointAgentError: If XML manipulation fails
+    """
+    if slide_count is None:
+        slide_count = agent.get_slide_count()
+    if not 0 <= slide_index < slide_count:
+        raise SlideNotFoundError(
+            f"Slide index {slide_index} out of range (0-{slide_count - 1})",
+            details={"requested": slide_index, "available": slide_count}
+        )
+    
+    slide = agent.prs.slides[slide_index]
+    shape_count = len(slide.shapes)
+    
+    if not 0 <= shape_index < shape_count:
+        raise ShapeNotFoundError(
+            f"Shape index {shape_index} out of range (0-{shape_count - 1})",
+            details={"requested": shape_index, "available": shape_count}
+        )
+    
+    shape = slide.shapes[shape_index]
+    
+    # XML Manipulation for Z-Order
+    sp_tree = slide.shapes._spTree
+    element = shape.element
+    
+    # Find current position in XML tree; lxml's index() is a C-level
+    # identity scan, with no Python-level loop over the children
+    try:
+        current_index = sp_tree.index(element)
+    except ValueError:
+        raise PowerPointAgentError("Could not locate shape in XML tree")
+    
+    change: Dict[str, Any] = {
+        "slide_index": slide_index,
+        "shape_index_target": shape_index,
+        "action": action,
+        "z_order_change": {
+            "from": current_index,
+            "to": current_index
+        }
+    }
+    
+    # A shape already at the requested end of the stack is left alone;
+    # shapes stay between <p:grpSpPr> and an optional trailing <p:extLst>
+    if action in ('bring_to_front', 'bring_forward'):
+        neighbor = element.getnext()
+        at_end = neighbor is None or neighbor.tag == qn('p:extLst')
+    else:
+        neighbor = element.getprevious()
+        at_end = neighbor is None or neighbor.tag == qn('p:grpSpPr')
+    
+    if at_end:
+        change["no_changes"] = True
+        return change
+    
+    # Execute Z-Order Action. lxml moves an attached element in one call,
+    # so nothing is removed first
+    if action == 'bring_to_front':
+        sp_tree.insert_element_before(element, 'p:extLst')
+        new_index = sp_tree.index(element)
+        
+    elif action == 'send_to_back':
+        sp_tree.grpSpPr.addnext(element)
+        new_index = 2
+        
+    elif action == 'bring_forward':
+        neighbor.addnext(element)
+        new_index = current_index + 1
+            
+    else:
+        neighbor.addprevious(element)
+        new_index = current_index - 1
+    
+    # Validate XML structure after manipulation
+    if not _validate_xml_structure(sp_tree):
+        raise PowerPointAgentError("XML structure corrupted during Z-order operation")
+    
+    change["z_order_change"]["to"] = new_index
+    return change
+
+
 def set_z_order(
     filepath: Path,
     slide_index: int,
@@ -76,96 +187,308 @@ def set_z_order(
     if filepath.suffix.lower() != '.pptx':
         raise ValueError("Only .pptx files are supported")
     
-    valid_actions = ['bring_to_front', 'send_to_back', 'bring_forward', 'send_backward']
-    if action not in valid_actions:
-        raise ValueError(f"Invalid action '{action}'. Must be one of: {valid_actions}")
+    if action not in Z_ORDER_ACTIONS:
+        raise ValueError(f"Invalid action '{action}'. Must be one of: {Z_ORDER_ACTIONS}")
     
     with PowerPointAgent(filepath) as agent:
         agent.open(filepath)
         
         version_before = agent.get_presentation_version()
         
-        slide_count = agent.get_slide_count()
-        if not 0 <= slide_index < slide_count:
-            raise SlideNotFoundError(
-                f"Slide index {slide_index} out of range (0-{slide_count - 1})",
-                details={"requested": slide_index, "available": slide_count}
-            )
+        change = _apply_z_order(agent, slide_index, shape_index, action)
         
-        slide = agent.prs.slides[slide_index]
-        shape_count = len(slide.shapes)
+        if change.get("no_changes"):
+            # Nothing moved, so there is nothing to save
+            version_after = version_before
+        else:
+            # Only this slide's XML is re-serialized; other entries are copied
+            agent.save_incremental([agent.prs.slides[slide_index].part])
+            
+            version_after = agent.get_presentation_version()
+    
+    result = {
+        "status": "success",
+        "file": str(filepath.resolve()),
+        **change,
+        "presentation_version_before": version_before,
+        "presentation_version_after": version_after,
+        "tool_version": __version__
+    }
+    
+    if not change.get("no_changes"):
+        result["warning"] = "⚠️ Shape indices may have changed. Use ppt_get_slide_info.py to refresh before further operations."
+        result["refresh_command"] = f"uv run tools/ppt_get_slide_info.py --file {filepath} --slide {slide_index} --json"
+    
+    return result
+
+
+def set_z_order_batch(filepath: Path, actions: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Apply several z-order changes with a single open/save cycle.
+    
+    Actions run in order against the in-memory XML, so each shape index
+    refers to the stacking left by the actions before it. If any action
+    fails, nothing is saved.
+    
+    Args:
+        filepath: Path to PowerPoint file (.pptx)
+        actions: List of dicts with "slide", "shape" and "action"
+        
+    Returns:
+        Result dict with per-action z-order changes
         
-        if not 0 <= shape_index < shape_count:
-            raise ShapeNotFoundError(
-                f"Shape index {shape_index} out of range (0-{shape_count - 1})",
-                details={"requested": shape_index, "available": shape_count}
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ValueError: If file format invalid or an action is malformed
+        SlideNotFoundError: If an action's slide index is invalid
+        ShapeNotFoundError: If an action's shape index is invalid
+        PowerPointAgentError: If XML manipulation fails
+    """
+    if not filepath.exists():
+        raise FileNotFoundError(f"File not found: {filepath}")
+    
+    if filepath.suffix.lower() != '.pptx':
+        raise ValueError("Only .pptx files are supported")
+    
+    if not isinstance(actions, list) or not actions:
+        raise ValueError("Actions manifest must be a non-empty JSON array of actions")
+    
+    # Validate every action before touching the presentation
+    for op_idx, op in enumerate(actions):
+        if not isinstance(op, dict):
+            raise ValueError(f"Action {op_idx} must be a JSON object")
+        missing = [key for key in ("slide", "shape", "action") if key not in op]
+        if missing:
+            raise ValueError(f"Action {op_idx} is missing required keys: {', '.join(missing)}")
+        if op["action"] not in Z_ORDER_ACTIONS:
+            raise ValueError(
+                f"Action {op_idx} has invalid action '{op['action']}'. "
+                f"Must be one of: {Z_ORDER_ACTIONS}"
             )
+    
+    with PowerPointAgent(filepath) as agent:
+        agent.open(filepath)
         
-        shape = slide.shapes[shape_index]
+        version_before = agent.get_presentation_version()
         
-        # XML Manipulation for Z-Order
-        sp_tree = slide.shapes._spTree
-        element = shape.element
+        slide_count = agent.get_slide_count()
+        results = [
+            _apply_z_order(
+                agent, int(op["slide"]), int(op["shape"]), op["action"], slide_count
+            )
+            for op in actions
+        ]
         
-        # Find current position in XML tree
-        current_index = -1
-        for i, child in enumerate(sp_tree):
-            if child == element:
-                current_index = i
-                break
+        # Single save for the whole batch, re-serializing only slides
+        # where a shape actually moved
+        dirty_parts = {}
+        for change in results:
+            if not change.get("no_changes"):
+                slide_part = agent.prs.slides[change["slide_index"]].part
+                dirty_parts[slide_part.partname] = slide_part
         
-        if current_index == -1:
-            raise PowerPointAgentError("Could not locate shape in XML tree")
+        if dirty_parts:
+            agent.save_incremental(dirty_parts.values())
+            version_after = agent.get_presentation_version()
+        else:
+            version_after = version_before
+    
+    result = {
+        "status": "success",
+        "file": str(filepath.resolve()),
+        "mode": "batch",
+        "operations_applied": len(results),
+        "results": results,
+        "presentation_version_before": version_before,
+        "presentation_version_after": version_after,
+        "tool_version": __version__
+    }
+    
+    if dirty_parts:
+        result["warning"] = "⚠️ Shape indices may have changed. Use ppt_get_slide_info.py to refresh before further operations."
+    else:
+        result["no_changes"] = True
+    
+    return result
+
+
+def serve(
+    filepath: Path,
+    requests: IO[str],
+    emit: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> int:
+    """
+    Apply NDJSON z-order changes to one presentation kept open until EOF.
+    
+    Each input line is a JSON object with "slide", "shape" and "action",
+    plus an optional "id", or {"cmd": "flush"}. Changes apply to the open
+    presentation only, so shape indices refer to the stacking left by the
+    lines before; a flush saves it when anything changed and reports the
+    new presentation_version. Changes still pending at EOF are saved as if
+    a final flush had been sent. Each line gets exactly one response line,
+    and an "id" is echoed back.
+    
+    Args:
+        filepath: Path to the PowerPoint file to modify
+        requests: Text stream of NDJSON requests (normally stdin)
+        emit: Record writer (default: one compact JSON line on stdout)
         
-        new_index = current_index
-        max_index = len(sp_tree) - 1
+    Returns:
+        Number of requests answered
         
-        # Execute Z-Order Action
-        if action == 'bring_to_front':
-            sp_tree.remove(element)
-            sp_tree.append(element)
-            new_index = max_index
-            
-        elif action == 'send_to_back':
-            sp_tree.remove(element)
-            sp_tree.insert(0, element)
-            new_index = 0
+    Raises:
+        FileNotFoundError: If file doesn't exist
+    """
+    if not filepath.exists():
+        raise FileNotFoundError(f"File not found: {filepath}")
+    
+    emit = emit or _write_json_line
+    answered = 0
+    pending = 0
+    dirty_parts: Dict[str, Any] = {}
+    
+    with PowerPointAgent(filepath, track_versions=False) as agent:
+        agent.open(filepath)
+        slide_count = agent.get_slide_count()
+        
+        for line in requests:
+            if not line.strip():
+                continue
             
-        elif action == 'bring_forward':
-            if current_index < max_index:
-                sp_tree.remove(element)
-                sp_tree.insert(current_index + 1, element)
-                new_index = current_index + 1
+            request = None
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("Request must be a JSON object")
                 
-        elif action == 'send_backward':
-            if current_index > 0:
-                sp_tree.remove(element)
-                sp_tree.insert(current_index - 1, element)
-                new_index = current_index - 1
-        
-        # Validate XML structure after manipulation
-        if not _validate_xml_structure(sp_tree):
-            raise PowerPointAgentError("XML structure corrupted during Z-order operation")
-        
-        agent.save()
+                if request.get("cmd") == "flush":
+                    if pending:
+                        agent.save_incremental(dirty_parts.values())
+                        dirty_parts.clear()
+                    response = {
+                        "status": "success",
+                        "cmd": "flush",
+                        "file": str(filepath.resolve()),
+                        "saved": pending > 0,
+                        "edits_saved": pending,
+                        "presentation_version": agent.get_presentation_version(),
+                        "tool_version": __version__
+                    }
+                    pending = 0
+                elif "cmd" in request:
+                    raise ValueError(f"Unknown cmd {request['cmd']!r}; expected 'flush'")
+                else:
+                    if not isinstance(request.get("slide"), int):
+                        raise ValueError("Request needs an integer 'slide'")
+                    if not isinstance(request.get("shape"), int):
+                        raise ValueError("Request needs an integer 'shape'")
+                    if request.get("action") not in Z_ORDER_ACTIONS:
+                        raise ValueError(
+                            f"Invalid action {request.get('action')!r}. Must be one of: {Z_ORDER_ACTIONS}"
+                        )
+                    response = _apply_z_order(
+                        agent, request["slide"], request["shape"], request["action"],
+                        slide_count
+                    )
+                    if not response.get("no_changes"):
+                        slide_part = agent.prs.slides[request["slide"]].part
+                        dirty_parts[slide_part.partname] = slide_part
+                        pending += 1
+                    response = {"status": "success", **response}
+                    response["file"] = str(filepath.resolve())
+                    response["pending_edits"] = pending
+                    response["tool_version"] = __version__
+            except Exception as e:
+                response = _error_response(e)
+            
+            if isinstance(request, dict) and "id" in request:
+                response = {"id": request["id"], **response}
+            
+            emit(response)
+            answered += 1
         
-        version_after = agent.get_presentation_version()
+        if pending:
+            agent.save_incremental(dirty_parts.values())
+    
+    return answered
+
+
+def _write_json(payload: Dict[str, Any]) -> None:
+    """Write an indented JSON payload to stdout, using orjson when it is installed."""
+    if HAS_ORJSON:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        sys.stdout.flush()
+        view = memoryview(data)
+        while view:
+            view = view[os.write(1, view):]
+    else:
+        # json.dump writes the encoder's chunks as they are produced
+        json.dump(payload, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+
+
+def _write_json_line(payload: Dict[str, Any]) -> None:
+    """Write one compact NDJSON record to stdout."""
+    if HAS_ORJSON:
+        data = orjson.dumps(payload, option=orjson.OPT_APPEND_NEWLINE)
+    else:
+        data = (json.dumps(payload, separators=(",", ":")) + "\n").encode("utf-8")
+    sys.stdout.flush()
+    view = memoryview(data)
+    while view:
+        view = view[os.write(1, view):]
+
+
+def _error_response(error: Exception) -> Dict[str, Any]:
+    """Build the JSON error payload for an exception raised in main() or --serve."""
+    if isinstance(error, FileNotFoundError):
+        return {
+            "status": "error",
+            "error": str(error),
+            "error_type": "FileNotFoundError",
+            "suggestion": "Verify file path exists and is accessible."
+        }
+    
+    if isinstance(error, SlideNotFoundError):
+        return {
+            "status": "error",
+            "error": str(error),
+            "error_type": "SlideNotFoundError",
+            "details": getattr(error, 'details', {}),
+            "suggestion": "Use ppt_get_info.py to check available slides."
+        }
+    
+    if isinstance(error, ShapeNotFoundError):
+        return {
+            "status": "error",
+            "error": str(error),
+            "error_type": "ShapeNotFoundError",
+            "details": getattr(error, 'details', {}),
+            "suggestion": "Use ppt_get_slide_info.py to check available shapes."
+        }
+    
+    if isinstance(error, ValueError):
+        return {
+            "status": "error",
+            "error": str(error),
+            "error_type": "ValueError",
+            "suggestion": "Check file format (.pptx) and action is valid."
+        }
+    
+    if isinstance(error, PowerPointAgentError):
+        return {
+            "status": "error",
+            "error": str(error),
+            "error_type": "PowerPointAgentError",
+            "suggestion": "XML manipulation failed. File may be corrupted."
+        }
     
     return {
-        "status": "success",
-        "file": str(filepath.resolve()),
-        "slide_index": slide_index,
-        "shape_index_target": shape_index,
-        "action": action,
-        "z_order_change": {
-            "from": current_index,
-            "to": new_index
-        },
-        "presentation_version_before": version_before,
-        "presentation_version_after": version_after,
-        "tool_version": __version__,
-        "warning": "⚠️ Shape indices may have changed. Use ppt_get_slide_info.py to refresh before further operations.",
-        "refresh_command": f"uv run tools/ppt_get_slide_info.py --file {filepath} --slide {slide_index} --json"
+        "status": "error",
+        "error": str(error),
+        "error_type": type(error).__name__,
+        "tool_version": __version__
     }
 
 
@@ -189,91 +512,83 @@ Examples:
   uv run tools/ppt_set_z_order.py --file deck.pptx --slide 0 --shape 2 \\
     --action bring_to_front --json
 
+  # Several reorderings with one open/save
+  uv run tools/ppt_set_z_order.py --file deck.pptx --actions-json zorder.json --json
+
+Actions Manifest (--actions-json):
+  JSON array of actions, applied in order with a single save:
+  [
+    {"slide": 0, "shape": 5, "action": "send_to_back"},
+    {"slide": 2, "shape": 1, "action": "bring_forward"}
+  ]
+  Shape indices refer to the order left by the preceding actions.
+  If any action fails, the presentation is left unchanged.
+
+Serve Mode (--serve, one JSON request per stdin line, one response line each):
+  {"id": 1, "slide": 0, "shape": 5, "action": "send_to_back"}
+  {"cmd": "flush"}
+  Changes are saved on flush and at EOF, not after every line.
+
 ⚠️  IMPORTANT: Shape indices change after z-order operations!
     Always run ppt_get_slide_info.py to refresh indices before targeting shapes.
         """
     )
     
     parser.add_argument('--file', required=True, type=Path, help='PowerPoint file path (.pptx)')
-    parser.add_argument('--slide', required=True, type=int, help='Slide index (0-based)')
-    parser.add_argument('--shape', required=True, type=int, help='Shape index (0-based)')
-    parser.add_argument('--action', required=True,
-                        choices=['bring_to_front', 'send_to_back', 'bring_forward', 'send_backward'],
-                        help='Layering action')
+    parser.add_argument('--slide', type=int, help='Slide index (0-based)')
+    parser.add_argument('--shape', type=int, help='Shape index (0-based)')
+    parser.add_argument('--action', choices=Z_ORDER_ACTIONS, help='Layering action')
+    parser.add_argument('--actions-json', type=Path,
+                        help='JSON manifest of actions to apply in one pass (replaces --slide/--shape/--action)')
+    parser.add_argument('--serve', action='store_true',
+                        help='Apply NDJSON changes from stdin to the open file, saving on {"cmd": "flush"} and EOF')
     parser.add_argument('--json', action='store_true', default=True, help='Output JSON (default: true)')
     
     args = parser.parse_args()
     
+    # --- HYGIENE BLOCK START ---
+    # CRITICAL: Redirect stderr to /dev/null to prevent library noise from corrupting JSON output.
+    # Applied after argument parsing so argparse usage errors still reach the terminal.
+    # fd 2 itself is redirected so C-level output (lxml, zlib) is silenced too;
+    # PPT_DEBUG=1 keeps stderr.
+    if not os.environ.get('PPT_DEBUG'):
+        _devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(_devnull, 2)
+        os.close(_devnull)
+    # --- HYGIENE BLOCK END ---
+    
     try:
-        result = set_z_order(
-            filepath=args.file,
-            slide_index=args.slide,
-            shape_index=args.shape,
-            action=args.action
-        )
-        print(json.dumps(result, indent=2))
-        sys.exit(0)
-        
-    except FileNotFoundError as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": "FileNotFoundError",
-            "suggestion": "Verify file path exists and is accessible."
-        }
-        print(json.dumps(error_result, indent=2))
-        sys.exit(1)
-        
-    except SlideNotFoundError as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": "SlideNotFoundError",
-            "details": getattr(e, 'details', {}),
-            "suggestion": "Use ppt_get_info.py to check available slides."
-        }
-        print(json.dumps(error_result, indent=2))
-        sys.exit(1)
-        
-    except ShapeNotFoundError as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": "ShapeNotFoundError",
-            "details": getattr(e, 'details', {}),
-            "suggestion": "Use ppt_get_slide_info.py to check available shapes."
-        }
-        print(json.dumps(error_result, indent=2))
-        sys.exit(1)
-        
-    except ValueError as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": "ValueError",
-            "suggestion": "Check file format (.pptx) and action is valid."
-        }
-        print(json.dumps(error_result, indent=2))
-        sys.exit(1)
+        if args.serve:
+            serve(args.file, sys.stdin)
+            sys.exit(0)
         
-    except PowerPointAgentError as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": "PowerPointAgentError",
-            "suggestion": "XML manipulation failed. File may be corrupted."
-        }
-        print(json.dumps(error_result, indent=2))
-        sys.exit(1)
+        if args.actions_json:
+            if not args.actions_json.exists():
+                raise FileNotFoundError(f"Actions manifest not found: {args.actions_json}")
+            try:
+                with open(args.actions_json, 'r', encoding='utf-8') as f:
+                    actions = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON in --actions-json manifest: {e}")
+            
+            result = set_z_order_batch(filepath=args.file, actions=actions)
+        else:
+            if args.slide is None or args.shape is None or args.action is None:
+                raise ValueError(
+                    "--slide, --shape and --action are required unless --actions-json or --serve is used"
+                )
+            
+            result = set_z_order(
+                filepath=args.file,
+                slide_index=args.slide,
+                shape_index=args.shape,
+                action=args.action
+            )
+        _write_json(result)
+        sys.exit(0)
         
     except Exception as e:
-        error_result = {
-            "status": "error",
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "tool_version": __version__
-        }
-        print(json.dumps(error_result, indent=2))
+        _write_json(_error_response(e))
         sys.exit(1)
 
 